@@ -0,0 +1,221 @@
+__version__ = '24.2.26.0'
+
+import threading
+
+CATEGORIES = (
+    'cards', 'decks', 'gui', 'media', 'misc', 'models', 'notes', 'stats'
+)
+
+URL = 'http://127.0.0.1:8765'
+KEY = None
+POOL_SIZE = 4
+CHUNK_SIZE = None
+CODEC = None
+METRICS = None
+RECORD = None
+CACHES = ()
+
+_client = None
+_client_settings = None
+_client_lock = threading.Lock()
+
+_LAZY = {
+    'AdaptiveChunkSize': '._tuning',
+    'AnkiClient': '.client',
+    'CardCache': '._cardcache',
+    'LRUStore': '._cardcache',
+    'MediaCache': '._mediacache',
+    'MediaManifest': '._manifest',
+    'MediaUploader': '._mediaupload',
+    'MetadataCache': '._cache',
+    'Metrics': '._metrics',
+    'NoteCache': '._cardcache',
+    'Profile': '._profiling',
+    'QueryCache': '._cache',
+    'RecordingTransport': '._cassette',
+    'ReplayTransport': '._cassette',
+    'SQLiteStore': '._sqlitestore',
+    'UploadManifest': '._mediaupload',
+    'hash_file': '._media',
+}
+
+
+def __getattr__(name):
+    import importlib
+    if name in CATEGORIES:
+        return importlib.import_module(f'.{name}', __name__)
+    module = _LAZY.get(name)
+    if module is None and name in _ACTIONS:
+        module = f'.{_ACTIONS[name]}'
+    if module is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY) | set(_ACTIONS) | set(CATEGORIES))
+
+
+def load_docs():
+    """Attach the documentation and examples to all action functions, for
+    `help()` and interactive use. The functions are loaded without it to
+    save time and memory."""
+    from ._docs import DOCS
+    for name in _ACTIONS:
+        __getattr__(name).__doc__ = DOCS[name]
+
+
+def _get_client():
+    global _client, _client_settings
+    settings = (
+        URL, KEY, POOL_SIZE, CHUNK_SIZE, CODEC, METRICS, RECORD, tuple(CACHES)
+    )
+    with _client_lock:
+        if _client is None or settings != _client_settings:
+            from .client import AnkiClient
+            if _client is not None:
+                _client.close()
+            _client = AnkiClient(
+                URL,
+                KEY,
+                pool_size=POOL_SIZE,
+                chunk_size=CHUNK_SIZE,
+                codec=CODEC,
+                metrics=METRICS,
+                record=RECORD,
+                caches=CACHES,
+            )
+            _client_settings = settings
+        return _client
+
+
+def invoke(action: str, **params):
+    return _get_client().invoke(action, **params)
+
+
+def stream(action: str, **params):
+    return _get_client().stream(action, **params)
+
+
+def profile():
+    return _get_client().profile()
+
+
+_ACTIONS = {
+    'getEaseFactors': 'cards',
+    'setEaseFactors': 'cards',
+    'setSpecificValueOfCard': 'cards',
+    'suspend': 'cards',
+    'unsuspend': 'cards',
+    'suspended': 'cards',
+    'areSuspended': 'cards',
+    'areDue': 'cards',
+    'getIntervals': 'cards',
+    'findCards': 'cards',
+    'cardsToNotes': 'cards',
+    'cardsModTime': 'cards',
+    'cardsInfo': 'cards',
+    'forgetCards': 'cards',
+    'relearnCards': 'cards',
+    'answerCards': 'cards',
+    'deckNames': 'decks',
+    'deckNamesAndIds': 'decks',
+    'getDecks': 'decks',
+    'createDeck': 'decks',
+    'changeDeck': 'decks',
+    'deleteDecks': 'decks',
+    'getDeckConfig': 'decks',
+    'saveDeckConfig': 'decks',
+    'setDeckConfigId': 'decks',
+    'cloneDeckConfigId': 'decks',
+    'removeDeckConfigId': 'decks',
+    'getDeckStats': 'decks',
+    'guiBrowse': 'gui',
+    'guiSelectNote': 'gui',
+    'guiSelectedNotes': 'gui',
+    'guiAddCards': 'gui',
+    'guiEditNote': 'gui',
+    'guiCurrentCard': 'gui',
+    'guiStartCardTimer': 'gui',
+    'guiShowQuestion': 'gui',
+    'guiShowAnswer': 'gui',
+    'guiAnswerCard': 'gui',
+    'guiUndo': 'gui',
+    'guiDeckOverview': 'gui',
+    'guiDeckBrowser': 'gui',
+    'guiDeckReview': 'gui',
+    'guiImportFile': 'gui',
+    'guiExitAnki': 'gui',
+    'guiCheckDatabase': 'gui',
+    'storeMediaFile': 'media',
+    'retrieveMediaFile': 'media',
+    'getMediaFilesNames': 'media',
+    'getMediaDirPath': 'media',
+    'deleteMediaFile': 'media',
+    'requestPermission': 'misc',
+    'version': 'misc',
+    'apiReflect': 'misc',
+    'sync': 'misc',
+    'getProfiles': 'misc',
+    'loadProfile': 'misc',
+    'multi': 'misc',
+    'exportPackage': 'misc',
+    'importPackage': 'misc',
+    'reloadCollection': 'misc',
+    'modelNames': 'models',
+    'modelNamesAndIds': 'models',
+    'findModelsById': 'models',
+    'findModelsByName': 'models',
+    'modelFieldNames': 'models',
+    'modelFieldDescriptions': 'models',
+    'modelFieldFonts': 'models',
+    'modelFieldsOnTemplates': 'models',
+    'createModel': 'models',
+    'modelTemplates': 'models',
+    'modelStyling': 'models',
+    'updateModelTemplates': 'models',
+    'updateModelStyling': 'models',
+    'findAndReplaceInModels': 'models',
+    'modelTemplateRename': 'models',
+    'modelTemplateReposition': 'models',
+    'modelTemplateAdd': 'models',
+    'modelTemplateRemove': 'models',
+    'modelFieldRename': 'models',
+    'modelFieldReposition': 'models',
+    'modelFieldAdd': 'models',
+    'modelFieldRemove': 'models',
+    'modelFieldSetFont': 'models',
+    'modelFieldSetFontSize': 'models',
+    'modelFieldSetDescription': 'models',
+    'addNote': 'notes',
+    'addNotes': 'notes',
+    'canAddNotes': 'notes',
+    'canAddNotesWithErrorDetail': 'notes',
+    'updateNoteFields': 'notes',
+    'updateNote': 'notes',
+    'updateNoteTags': 'notes',
+    'getNoteTags': 'notes',
+    'addTags': 'notes',
+    'removeTags': 'notes',
+    'getTags': 'notes',
+    'clearUnusedTags': 'notes',
+    'replaceTags': 'notes',
+    'replaceTagsInAllNotes': 'notes',
+    'findNotes': 'notes',
+    'notesInfo': 'notes',
+    'deleteNotes': 'notes',
+    'removeEmptyNotes': 'notes',
+    'getNumCardsReviewedToday': 'stats',
+    'getNumCardsReviewedByDay': 'stats',
+    'getCollectionStatsHTML': 'stats',
+    'cardReviews': 'stats',
+    'getReviewsOfCards': 'stats',
+    'getLatestReviewID': 'stats',
+    'insertReviews': 'stats',
+}
+
+__all__ = [
+    'invoke', 'stream', 'profile', 'load_docs', *_LAZY, *_ACTIONS
+]
@@ -0,0 +1,922 @@
+class AsyncActions:
+    """Mixin of `AsyncAnkiClient` with a coroutine for every action."""
+
+    # Card Actions
+
+    async def getEaseFactors(self, cards: list) -> list:
+        """Returns an array with the ease factor for each of the given cards (in the same
+        order).
+        """
+        return await self.invoke("getEaseFactors", cards=cards)
+
+    async def setEaseFactors(self, cards: list, easeFactors: list) -> list:
+        """Sets ease factor of cards by card ID; returns `True` if successful (all cards
+        existed) or `False` otherwise.
+        """
+        return await self.invoke(
+            "setEaseFactors", cards=cards, easeFactors=easeFactors
+        )
+
+    async def setSpecificValueOfCard(
+        self, card: int, keys: list, newValues: list
+    ) -> list:
+        """Sets specific value of a single card. Given the risk of wreaking havor in the
+        database when changing some of the values of a card, some of the keys require the
+        argument "warning_check" set to True. This can be used to set a card's flag,
+        change it's ease factor, change the review order in a filtered deck and change the
+        column "data" (not currently used by anki apparantly), and many other values. A
+        list of values and explanation of their respective utility can be found at
+        [AnkiDroid's
+        wiki](https://github.com/ankidroid/Anki-Android/wiki/Database-Structure).
+        """
+        return await self.invoke(
+            "setSpecificValueOfCard", card=card, keys=keys, newValues=newValues
+        )
+
+    async def suspend(self, cards: list) -> bool:
+        """Suspend cards by card ID; returns `True` if successful (at least one card
+        wasn't already suspended) or `False` otherwise.
+        """
+        return await self.invoke("suspend", cards=cards)
+
+    async def unsuspend(self, cards: list) -> bool:
+        """Unsuspend cards by card ID; returns `True` if successful (at least one card was
+        previously suspended) or `False` otherwise.
+        """
+        return await self.invoke("unsuspend", cards=cards)
+
+    async def suspended(self, card: int) -> bool:
+        """Check if card is suspended by its ID. Returns `True` if suspended, `False`
+        otherwise.
+        """
+        return await self.invoke("suspended", card=card)
+
+    async def areSuspended(self, cards: list) -> list:
+        """Returns an array indicating whether each of the given cards is suspended (in
+        the same order). If card doesn't exist returns `None`.
+        """
+        return await self.invoke("areSuspended", cards=cards)
+
+    async def areDue(self, cards: list) -> list:
+        """Returns an array indicating whether each of the given cards is due (in the same
+        order). *Note*: cards in the learning queue with a large interval (over 20
+        minutes) are treated as not due until the time of their interval has passed, to
+        match the way Anki treats them when reviewing.
+        """
+        return await self.invoke("areDue", cards=cards)
+
+    async def getIntervals(self, cards: list, complete: bool = False) -> list:
+        """Returns an array of the most recent intervals for each given card ID, or a
+        2-dimensional array of all the intervals for each given card ID when `complete` is
+        `True`. Negative intervals are in seconds and positive intervals in days.
+        """
+        return await self.invoke("getIntervals", cards=cards, complete=complete)
+
+    async def findCards(self, query: str) -> list:
+        """Returns an array of card IDs for a given query. Functionally identical to
+        `guiBrowse` but doesn't use the GUI for better performance.
+        """
+        return await self.invoke("findCards", query=query)
+
+    async def cardsToNotes(self, cards: list) -> list:
+        """Returns an unordered array of note IDs for the given card IDs. For cards with
+        the same note, the ID is only given once in the array.
+        """
+        return await self.invoke("cardsToNotes", cards=cards)
+
+    async def cardsModTime(self, cards: list) -> list:
+        """Returns a list of objects containings for each card ID the modification time.
+        This function is about 15 times faster than executing `cardsInfo`.
+        """
+        return await self.invoke("cardsModTime", cards=cards)
+
+    async def cardsInfo(self, cards: list) -> list:
+        """Returns a list of objects containing for each card ID the card fields, front
+        and back sides including CSS, note type, the note that the card belongs to, and
+        deck name, last modification timestamp as well as ease and interval.
+        """
+        return await self.invoke("cardsInfo", cards=cards)
+
+    async def forgetCards(self, cards: list) -> None:
+        """Forget cards, making the cards new again."""
+        return await self.invoke("forgetCards", cards=cards)
+
+    async def relearnCards(self, cards: list) -> None:
+        """Make cards be "relearning"."""
+        return await self.invoke("relearnCards", cards=cards)
+
+    async def answerCards(self, answers: list) -> list:
+        """Answer cards. Ease is between 1 (Again) and 4 (Easy). Will start the timer
+        immediately before answering. Returns `True` if card exists, `False` otherwise.
+        """
+        return await self.invoke("answerCards", answers=answers)
+
+    # Deck Actions
+
+    async def deckNames(self) -> list:
+        """Gets the complete list of deck names for the current user."""
+        return await self.invoke("deckNames")
+
+    async def deckNamesAndIds(self) -> dict:
+        """Gets the complete list of deck names and their respective IDs for the current
+        user.
+        """
+        return await self.invoke("deckNamesAndIds")
+
+    async def getDecks(self, cards: list) -> dict:
+        """Accepts an array of card IDs and returns an object with each deck name as a
+        key, and its value an array of the given cards which belong to it.
+        """
+        return await self.invoke("getDecks", cards=cards)
+
+    async def createDeck(self, deck: str) -> int:
+        """Create a new empty deck. Will not overwrite a deck that exists with the same
+        name.
+        """
+        return await self.invoke("createDeck", deck=deck)
+
+    async def changeDeck(self, cards: list, deck: str) -> None:
+        """Moves cards with the given IDs to a different deck, creating the deck if it
+        doesn't exist yet.
+        """
+        return await self.invoke("changeDeck", cards=cards, deck=deck)
+
+    async def deleteDecks(self, decks: list, cardsToo: bool) -> None:
+        """Deletes decks with the given names. The argument `cardsToo` *must* be specified
+        and set to `True`.
+        """
+        return await self.invoke("deleteDecks", decks=decks, cardsToo=cardsToo)
+
+    async def getDeckConfig(self, deck: str) -> dict:
+        """Gets the configuration group object for the given deck."""
+        return await self.invoke("getDeckConfig", deck=deck)
+
+    async def saveDeckConfig(self, config: dict) -> bool:
+        """Saves the given configuration group, returning `True` on success or `False` if
+        the ID of the configuration group is invalid (such as when it does not exist).
+        """
+        return await self.invoke("saveDeckConfig", config=config)
+
+    async def setDeckConfigId(self, decks: list, configId: int) -> bool:
+        """Changes the configuration group for the given decks to the one with the given
+        ID. Returns `True` on success or `False` if the given configuration group or any
+        of the given decks do not exist.
+        """
+        return await self.invoke(
+            "setDeckConfigId", decks=decks, configId=configId
+        )
+
+    async def cloneDeckConfigId(self, name: str, cloneFrom: int) -> int:
+        """Creates a new configuration group with the given name, cloning from the group
+        with the given ID, or from the default group if this is unspecified. Returns the
+        ID of the new configuration group, or `False` if the specified group to clone from
+        does not exist.
+        """
+        return await self.invoke(
+            "cloneDeckConfigId", name=name, cloneFrom=cloneFrom
+        )
+
+    async def removeDeckConfigId(self, configId: int) -> bool:
+        """Removes the configuration group with the given ID, returning `True` if
+        successful, or `False` if attempting to remove either the default configuration
+        group (ID = 1) or a configuration group that does not exist.
+        """
+        return await self.invoke("removeDeckConfigId", configId=configId)
+
+    async def getDeckStats(self, decks: list) -> dict:
+        """Gets statistics such as total cards and cards due for the given decks."""
+        return await self.invoke("getDeckStats", decks=decks)
+
+    # Graphical Actions
+
+    async def guiBrowse(self, query: str, reorderCards: dict) -> list:
+        """Invokes the *Card Browser* dialog and searches for a given query. Returns an
+        array of identifiers of the cards that were found. Query syntax is [documented
+        here](https://docs.ankiweb.net/searching.html).
+
+        Optionally, the `reorderCards` property can be provided to reorder the cards shown
+        in the *Card Browser*. This is an array including the `order` and `columnId`
+        objects. `order` can be either `ascending` or `descending` while `columnId` can be
+        one of several column identifiers (as documented in the [Anki source
+        code](https://github.com/ankitects/anki/blob/main/rslib/src/browser_table.rs)).
+        The specified column needs to be visible in the *Card Browser*.
+        """
+        return await self.invoke(
+            "guiBrowse", query=query, reorderCards=reorderCards
+        )
+
+    async def guiSelectNote(self, note: int) -> bool:
+        """Finds the open instance of the *Card Browser* dialog and selects a note given a
+        note identifier. Returns `True` if the *Card Browser* is open, `False` otherwise.
+        """
+        return await self.invoke("guiSelectNote", note=note)
+
+    async def guiSelectedNotes(self) -> list:
+        """Finds the open instance of the *Card Browser* dialog and returns an array of
+        identifiers of the notes that are selected. Returns an empty list if the browser
+        is not open.
+        """
+        return await self.invoke("guiSelectedNotes")
+
+    async def guiAddCards(self, note: dict) -> int:
+        """Invokes the *Add Cards* dialog, presets the note using the given deck and
+        model, with the provided field values and tags. Invoking it multiple times closes
+        the old window and _reopen the window_ with the new provided values.
+
+        Audio, video, and picture files can be embedded into the fields via the `audio`,
+        `video`, and `picture` keys, respectively. Refer to the documentation of `addNote`
+        and `storeMediaFile` for an explanation of these fields.
+
+        The result is the ID of the note which would be added, if the user chose to
+        confirm the *Add Cards* dialogue.
+        """
+        return await self.invoke("guiAddCards", note=note)
+
+    async def guiEditNote(self, note: int) -> None:
+        """Opens the *Edit* dialog with a note corresponding to given note ID. The dialog
+        is similar to the *Edit Current* dialog, but:
+
+        * has a Preview button to preview the cards for the note
+        * has a Browse button to open the browser with these cards
+        * has Previous/Back buttons to navigate the history of the dialog
+        * has no bar with the Close button
+        """
+        return await self.invoke("guiEditNote", note=note)
+
+    async def guiCurrentCard(self) -> dict:
+        """Returns information about the current card or `None` if not in review mode."""
+        return await self.invoke("guiCurrentCard")
+
+    async def guiStartCardTimer(self) -> bool:
+        """Starts or resets the `timerStarted` value for the current card. This is useful
+        for deferring the start time to when it is displayed via the API, allowing the
+        recorded time taken to answer the card to be more accurate when calling
+        `guiAnswerCard`.
+        """
+        return await self.invoke("guiStartCardTimer")
+
+    async def guiShowQuestion(self) -> bool:
+        """Shows question text for the current card; returns `True` if in review mode or
+        `False` otherwise.
+        """
+        return await self.invoke("guiShowQuestion")
+
+    async def guiShowAnswer(self) -> bool:
+        """Shows answer text for the current card; returns `True` if in review mode or
+        `False` otherwise.
+        """
+        return await self.invoke("guiShowAnswer")
+
+    async def guiAnswerCard(self, ease: int) -> bool:
+        """Answers the current card; returns `True` if succeeded or `False` otherwise.
+        Note that the answer for the current card must be displayed before before any
+        answer can be accepted by Anki.
+        """
+        return await self.invoke("guiAnswerCard", ease=ease)
+
+    async def guiUndo(self) -> bool:
+        """Undo the last action / card; returns `True` if succeeded or `False` otherwise."""
+        return await self.invoke("guiUndo")
+
+    async def guiDeckOverview(self, name: str) -> bool:
+        """Opens the *Deck Overview* dialog for the deck with the given name; returns
+        `True` if succeeded or `False` otherwise.
+        """
+        return await self.invoke("guiDeckOverview", name=name)
+
+    async def guiDeckBrowser(self) -> None:
+        """Opens the *Deck Browser* dialog."""
+        return await self.invoke("guiDeckBrowser")
+
+    async def guiDeckReview(self, name: str) -> bool:
+        """Starts review for the deck with the given name; returns `True` if succeeded or
+        `False` otherwise.
+        """
+        return await self.invoke("guiDeckReview", name=name)
+
+    async def guiImportFile(self, path: str) -> None:
+        """Invokes the *Import... (Ctrl+Shift+I)* dialog with an optional file path.
+        Brings up the dialog for user to review the import. Supports all file types that
+        Anki supports. Brings open file dialog if no path is provided. Forward slashes
+        must be used in the path on Windows. Only supported for Anki 2.1.52+.
+        """
+        return await self.invoke("guiImportFile", path=path)
+
+    async def guiExitAnki(self) -> None:
+        """Schedules a request to gracefully close Anki. This operation is asynchronous,
+        so it will return immediately and won't wait until the Anki process actually
+        terminates.
+        """
+        return await self.invoke("guiExitAnki")
+
+    async def guiCheckDatabase(self) -> bool:
+        """Requests a database check, but returns immediately without waiting for the
+        check to complete. Therefore, the action will always return `True` even if errors
+        are detected during the database check.
+        """
+        return await self.invoke("guiCheckDatabase")
+
+    # Media Actions
+
+    async def storeMediaFile(
+        self,
+        filename: str,
+        *,
+        data: str = None,
+        path: str = None,
+        url: str = None,
+        deleteExisting: bool = True
+    ) -> str:
+        """Stores a file with the specified base64-encoded contents inside the media
+        folder. Alternatively you can specify a absolute file path, or a url from where
+        the file shell be downloaded. If more than one of `data`, `path` and `url` are
+        provided, the `data` field will be used first, then `path`, and finally `url`. To
+        prevent Anki from removing files not used by any cards (e.g. for configuration
+        files), prefix the filename with an underscore. These files are still synchronized
+        to AnkiWeb. Any existing file with the same name is deleted by default. Set
+        `deleteExisting` to false to prevent that by [letting Anki give the new file a
+        non-conflicting
+        name](https://github.com/ankitects/anki/blob/aeba725d3ea9628c73300648f748140db3fdd5ed/rslib/src/media/files.rs#L194).
+        """
+        if data is not None:
+            return await self.invoke(
+                "storeMediaFile",
+                filename=filename,
+                data=data,
+                deleteExisting=deleteExisting,
+            )
+        elif path is not None:
+            return await self.invoke(
+                "storeMediaFile",
+                filename=filename,
+                path=str(path),
+                deleteExisting=deleteExisting,
+            )
+        elif url is not None:
+            return await self.invoke(
+                "storeMediaFile",
+                filename=filename,
+                url=url,
+                deleteExisting=deleteExisting,
+            )
+        else:
+            raise Exception(
+                "one argument of data, path or url must be supplied"
+            )
+
+    async def retrieveMediaFile(self, filename: str) -> str:
+        """Retrieves the base64-encoded contents of the specified file, returning `False`
+        if the file does not exist.
+        """
+        return await self.invoke("retrieveMediaFile", filename=filename)
+
+    async def getMediaFilesNames(self, pattern: str) -> list:
+        """Gets the names of media files matched the pattern. Returning all names by
+        default.
+        """
+        return await self.invoke("getMediaFilesNames", pattern=pattern)
+
+    async def getMediaDirPath(self) -> str:
+        """Gets the full path to the `collection.media` folder of the currently opened
+        profile.
+        """
+        return await self.invoke("getMediaDirPath")
+
+    async def deleteMediaFile(self, filename: str) -> None:
+        """Deletes the specified file inside the media folder."""
+        return await self.invoke("deleteMediaFile", filename=filename)
+
+    # Miscellaneous Actions
+
+    async def requestPermission(self) -> dict:
+        """Requests permission to use the API exposed by this plugin. This method does not
+        require the API key, and is the only one that accepts requests from any origin;
+        the other methods only accept requests from trusted origins, which are listed
+        under `webCorsOriginList` in the add-on config. `localhost` is trusted by default.
+
+        Calling this method from an untrusted origin will display a popup in Anki asking
+        the user whether they want to allow your origin to use the API; calls from trusted
+        origins will return the result without displaying the popup. When denying
+        permission, the user may also choose to ignore further permission requests from
+        that origin. These origins end up in the `ignoreOriginList`, editable via the
+        add-on config.
+
+        The result always contains the `permission` field, which in turn contains either
+        the string `granted` or `denied`, corresponding to whether your origin is trusted.
+        If your origin is trusted, the fields `requireApiKey` (`True` if required) and
+        `version` will also be returned.
+
+        This should be the first call you make to make sure that your application and
+        Anki-Connect are able to communicate properly with each other. New versions of
+        Anki-Connect are backwards compatible; as long as you are using actions which are
+        available in the reported Anki-Connect version or earlier, everything should work
+        fine.
+        """
+        return await self.invoke("requestPermission")
+
+    async def version(self) -> int:
+        """Gets the version of the API exposed by this plugin. Currently versions `1`
+        through `6` are defined.
+        """
+        return await self.invoke("version")
+
+    async def apiReflect(self, scopes: list, actions: list) -> dict:
+        """Gets information about the AnkiConnect APIs available. The request supports the
+        following params:
+
+        * `scopes` - An array of scopes to get reflection information about. The only
+        currently supported value is `"actions"`.
+        * `actions` - Either `None` or an array of API method names to check for. If the
+        value is `None`, the result will list all of the available API actions. If the
+        value is an array of strings, the result will only contain actions which were in
+        this array.
+
+        The result will contain a list of which scopes were used and a value for each
+        scope. For example, the `"actions"` scope will contain a `"actions"` property
+        which contains a list of supported action names.
+        """
+        return await self.invoke("apiReflect", scopes=scopes, actions=actions)
+
+    async def sync(self) -> None:
+        """Synchronizes the local Anki collections with AnkiWeb."""
+        return await self.invoke("sync")
+
+    async def getProfiles(self) -> list:
+        """Retrieve the list of profiles."""
+        return await self.invoke("getProfiles")
+
+    async def loadProfile(self, name: str) -> bool:
+        """Selects the profile specified in request."""
+        return await self.invoke("loadProfile", name=name)
+
+    async def multi(self, actions: list) -> list:
+        """Performs multiple actions in one request, returning an array with the response
+        of each action (in the given order).
+        """
+        return await self.invoke("multi", actions=actions)
+
+    async def exportPackage(
+        self, deck: str, path: str, includeSched: bool
+    ) -> bool:
+        """Exports a given deck in `.apkg` format. Returns `True` if successful or `False`
+        otherwise. The optional property `includeSched` (default is `False`) can be
+        specified to include the cards' scheduling data.
+        """
+        return await self.invoke(
+            "exportPackage", deck=deck, path=path, includeSched=includeSched
+        )
+
+    async def importPackage(self, path: str) -> bool:
+        """Imports a file in `.apkg` format into the collection. Returns `True` if
+        successful or `False` otherwise. Note that the file path is relative to Anki's
+        collection.media folder, not to the client.
+        """
+        return await self.invoke("importPackage", path=path)
+
+    async def reloadCollection(self) -> None:
+        """Tells anki to reload all data from the database."""
+        return await self.invoke("reloadCollection")
+
+    # Model Actions
+
+    async def modelNames(self) -> list:
+        """Gets the complete list of model names for the current user."""
+        return await self.invoke("modelNames")
+
+    async def modelNamesAndIds(self) -> dict:
+        """Gets the complete list of model names and their corresponding IDs for the
+        current user.
+        """
+        return await self.invoke("modelNamesAndIds")
+
+    async def findModelsById(self, modelIds: list) -> list:
+        """Gets a list of models  for the provided model IDs from the current user."""
+        return await self.invoke("findModelsById", modelIds=modelIds)
+
+    async def findModelsByName(self, modelNames: list) -> list:
+        """Gets a list of models for the provided model names from the current user."""
+        return await self.invoke("findModelsByName", modelNames=modelNames)
+
+    async def modelFieldNames(self, modelName: str) -> list:
+        """Gets the complete list of field names for the provided model name."""
+        return await self.invoke("modelFieldNames", modelName=modelName)
+
+    async def modelFieldDescriptions(self, modelName: str) -> list:
+        """Gets the complete list of field descriptions (the text seen in the gui editor
+        when a field is empty) for the provided model name.
+        """
+        return await self.invoke("modelFieldDescriptions", modelName=modelName)
+
+    async def modelFieldFonts(self, modelName: str) -> dict:
+        """Gets the complete list of fonts along with their font sizes."""
+        return await self.invoke("modelFieldFonts", modelName=modelName)
+
+    async def modelFieldsOnTemplates(self, modelName: str) -> dict:
+        """Returns an object indicating the fields on the question and answer side of each
+        card template for the given model name. The question side is given first in each
+        array.
+        """
+        return await self.invoke("modelFieldsOnTemplates", modelName=modelName)
+
+    async def createModel(
+        self,
+        modelName: str,
+        inOrderFields: list,
+        css: str,
+        isCloze: bool,
+        cardTemplates: list,
+    ) -> dict:
+        """Creates a new model to be used in Anki. User must provide the `modelName`,
+        `inOrderFields` and `cardTemplates` to be used in the model. There are optional
+        fields `css` and `isCloze`. If not specified, `css` will use the default Anki css
+        and `isCloze` will be equal to `False`. If `isCloze` is `True` then model will be
+        created as Cloze.
+
+        Optionally the `Name` field can be provided for each entry of `cardTemplates`. By
+        default the card names will be `Card 1`, `Card 2`, and so on.
+        """
+        return await self.invoke(
+            "createModel",
+            modelName=modelName,
+            inOrderFields=inOrderFields,
+            css=css,
+            isCloze=isCloze,
+            cardTemplates=cardTemplates,
+        )
+
+    async def modelTemplates(self, modelName: str) -> dict:
+        """Returns an object indicating the template content for each card connected to
+        the provided model by name.
+        """
+        return await self.invoke("modelTemplates", modelName=modelName)
+
+    async def modelStyling(self, modelName: str) -> dict:
+        """Gets the CSS styling for the provided model by name."""
+        return await self.invoke("modelStyling", modelName=modelName)
+
+    async def updateModelTemplates(self, model: dict) -> None:
+        """Modify the templates of an existing model by name. Only specifies cards and
+        specified sides will be modified. If an existing card or side is not included in
+        the request, it will be left unchanged.
+        """
+        return await self.invoke("updateModelTemplates", model=model)
+
+    async def updateModelStyling(self, model: dict) -> None:
+        """Modify the CSS styling of an existing model by name."""
+        return await self.invoke("updateModelStyling", model=model)
+
+    async def findAndReplaceInModels(self, model: dict) -> int:
+        """Find and replace string in existing model by model name. Customise to replace
+        in front, back or css by setting to true/false.
+        """
+        return await self.invoke("findAndReplaceInModels", model=model)
+
+    async def modelTemplateRename(
+        self, modelName: str, oldTemplateName: str, newTemplateName: str
+    ) -> None:
+        """Renames a template in an existing model."""
+        return await self.invoke(
+            "modelTemplateRename",
+            modelName=modelName,
+            oldTemplateName=oldTemplateName,
+            newTemplateName=newTemplateName,
+        )
+
+    async def modelTemplateReposition(
+        self, modelName: str, templateName: str, index: int
+    ) -> None:
+        """Repositions a template in an existing model.
+
+        The value of `index` starts at 0. For example, an index of `0` puts the template
+        in the first position, and an index of `2` puts the template in the third
+        position.
+        """
+        return await self.invoke(
+            "modelTemplateReposition",
+            modelName=modelName,
+            templateName=templateName,
+            index=index,
+        )
+
+    async def modelTemplateAdd(self, modelName: str, template: dict) -> None:
+        """Adds a template to an existing model by name. If you want to update an existing
+        template, use `updateModelTemplates`.
+        """
+        return await self.invoke(
+            "modelTemplateAdd", modelName=modelName, template=template
+        )
+
+    async def modelTemplateRemove(
+        self, modelName: str, templateName: str
+    ) -> None:
+        """Removes a template from an existing model."""
+        return await self.invoke(
+            "modelTemplateRemove",
+            modelName=modelName,
+            templateName=templateName,
+        )
+
+    async def modelFieldRename(
+        self, modelName: str, oldFieldName: str, newFieldName: str
+    ) -> None:
+        """Rename the field name of a given model."""
+        return await self.invoke(
+            "modelFieldRename",
+            modelName=modelName,
+            oldFieldName=oldFieldName,
+            newFieldName=newFieldName,
+        )
+
+    async def modelFieldReposition(
+        self, modelName: str, fieldName: str, index: int
+    ) -> None:
+        """Reposition the field within the field list of a given model.
+
+        The value of `index` starts at 0. For example, an index of `0` puts the field in
+        the first position, and an index of `2` puts the field in the third position.
+        """
+        return await self.invoke(
+            "modelFieldReposition",
+            modelName=modelName,
+            fieldName=fieldName,
+            index=index,
+        )
+
+    async def modelFieldAdd(
+        self, modelName: str, fieldName: str, index: int
+    ) -> None:
+        """Creates a new field within a given model.
+
+        Optionally, the `index` value can be provided, which works exactly the same as the
+        index in `modelFieldReposition`. By default, the field is added to the end of the
+        field list.
+        """
+        return await self.invoke(
+            "modelFieldAdd",
+            modelName=modelName,
+            fieldName=fieldName,
+            index=index,
+        )
+
+    async def modelFieldRemove(self, modelName: str, fieldName: str) -> None:
+        """Deletes a field within a given model."""
+        return await self.invoke(
+            "modelFieldRemove", modelName=modelName, fieldName=fieldName
+        )
+
+    async def modelFieldSetFont(
+        self, modelName: str, fieldName: str, font: str
+    ) -> None:
+        """Sets the font for a field within a given model."""
+        return await self.invoke(
+            "modelFieldSetFont",
+            modelName=modelName,
+            fieldName=fieldName,
+            font=font,
+        )
+
+    async def modelFieldSetFontSize(
+        self, modelName: str, fieldName: str, fontSize: int
+    ) -> None:
+        """Sets the font size for a field within a given model."""
+        return await self.invoke(
+            "modelFieldSetFontSize",
+            modelName=modelName,
+            fieldName=fieldName,
+            fontSize=fontSize,
+        )
+
+    async def modelFieldSetDescription(
+        self, modelName: str, fieldName: str, description: str
+    ) -> bool:
+        """Sets the description (the text seen in the gui editor when a field is empty)
+        for a field within a given model.
+
+        Older versions of Anki (2.1.49 and below) do not have field descriptions. In that
+        case, this will return with `False`.
+        """
+        return await self.invoke(
+            "modelFieldSetDescription",
+            modelName=modelName,
+            fieldName=fieldName,
+            description=description,
+        )
+
+    # Note Actions
+
+    async def addNote(self, note: dict) -> int:
+        """Creates a note using the given deck and model, with the provided field values
+        and tags. Returns the identifier of the created note created on success, and
+        `None` on failure.
+
+        Anki-Connect can download audio, video, and picture files and embed them in newly
+        created notes. The corresponding `audio`, `video`, and `picture` note members are
+        optional and can be omitted. If you choose to include any of them, they should
+        contain a single object or an array of objects with the mandatory `filename` field
+        and one of `data`, `path` or `url`. Refer to the documentation of `storeMediaFile`
+        for an explanation of these fields. The `skipHash` field can be optionally
+        provided to skip the inclusion of files with an MD5 hash that matches the provided
+        value. This is useful for avoiding the saving of error pages and stub files. The
+        `fields` member is a list of fields that should play audio or video, or show a
+        picture when the card is displayed in Anki. The `allowDuplicate` member inside
+        `options` group can be set to true to enable adding duplicate cards. Normally
+        duplicate cards can not be added and trigger exception.
+
+        The `duplicateScope` member inside `options` can be used to specify the scope for
+        which duplicates are checked. A value of `"deck"` will only check for duplicates
+        in the target deck; any other value will check the entire collection.
+
+        The `duplicateScopeOptions` object can be used to specify some additional
+        settings:
+
+        * `duplicateScopeOptions.deckName` will specify which deck to use for checking
+        duplicates in. If undefined or `None`, the target deck will be used.
+        * `duplicateScopeOptions.checkChildren` will change whether or not duplicate cards
+        are checked in child decks. The default value is `False`.
+        * `duplicateScopeOptions.checkAllModels` specifies whether duplicate checks are
+        performed across all note types. The default value is `False`.
+        """
+        return await self.invoke("addNote", note=note)
+
+    async def addNotes(self, notes: list) -> list:
+        """Creates multiple notes using the given deck and model, with the provided field
+        values and tags. Returns an array of identifiers of the created notes (notes that
+        could not be created will have a `None` identifier). Please see the documentation
+        for `addNote` for an explanation of objects in the `notes` array.
+        """
+        return await self.invoke("addNotes", notes=notes)
+
+    async def canAddNotes(self, notes: list) -> list:
+        """Accepts an array of objects which define parameters for candidate notes (see
+        `addNote`) and returns an array of booleans indicating whether or not the
+        parameters at the corresponding index could be used to create a new note.
+        """
+        return await self.invoke("canAddNotes", notes=notes)
+
+    async def canAddNotesWithErrorDetail(self, notes: list) -> list:
+        """Accepts an array of objects which define parameters for candidate notes (see
+        `addNote`) and returns an array of objects with fields `canAdd` and `error`.
+
+        * `canAdd` indicates whether or not the parameters at the corresponding index
+        could be used to create a new note.
+        * `error` contains an explanation of why a note cannot be added.
+        """
+        return await self.invoke("canAddNotesWithErrorDetail", notes=notes)
+
+    async def updateNoteFields(self, note: dict) -> None:
+        """Modify the fields of an existing note. You can also include audio, video, or
+        picture files which will be added to the note with an optional `audio`, `video`,
+        or `picture` property. Please see the documentation for `addNote` for an
+        explanation of objects in the `audio`, `video`, or `picture` array.
+
+        > **Warning**: You must not be viewing the note that you are updating on your Anki
+        browser, otherwise the fields will not update. See [this
+        issue](https://github.com/FooSoft/anki-connect/issues/82) for further details.
+        """
+        return await self.invoke("updateNoteFields", note=note)
+
+    async def updateNote(self, note: dict) -> None:
+        """Modify the fields and/or tags of an existing note. In other words, combines
+        `updateNoteFields` and `updateNoteTags`. Please see their documentation for an
+        explanation of all properties.
+
+        Either `fields` or `tags` property can be omitted without affecting the other.
+        Thus valid requests to `updateNoteFields` also work with `updateNote`. The note
+        must have the `fields` property in order to update the optional audio, video, or
+        picture objects.
+
+        If neither `fields` nor `tags` are provided, the method will fail. Fields are
+        updated first and are not rolled back if updating tags fails. Tags are not updated
+        if updating fields fails.
+
+        > **Warning** You must not be viewing the note that you are updating on your Anki
+        browser, otherwise the fields will not update. See [this
+        issue](https://github.com/FooSoft/anki-connect/issues/82) for further details.
+        """
+        return await self.invoke("updateNote", note=note)
+
+    async def updateNoteTags(self, note: int, tags: list) -> None:
+        """Set a note's tags by note ID. Old tags will be removed."""
+        return await self.invoke("updateNoteTags", note=note, tags=tags)
+
+    async def getNoteTags(self, note: int) -> list:
+        """Get a note's tags by note ID."""
+        return await self.invoke("getNoteTags", note=note)
+
+    async def addTags(self, notes: list, tags: str) -> None:
+        """Adds tags to notes by note ID."""
+        return await self.invoke("addTags", notes=notes, tags=tags)
+
+    async def removeTags(self, notes: list, tags: str) -> None:
+        """Remove tags from notes by note ID."""
+        return await self.invoke("removeTags", notes=notes, tags=tags)
+
+    async def getTags(self) -> list:
+        """Gets the complete list of tags for the current user."""
+        return await self.invoke("getTags")
+
+    async def clearUnusedTags(self) -> None:
+        """Clears all the unused tags in the notes for the current user."""
+        return await self.invoke("clearUnusedTags")
+
+    async def replaceTags(
+        self, notes: list, tag_to_replace: str, replace_with_tag: str
+    ) -> None:
+        """Replace tags in notes by note ID."""
+        return await self.invoke(
+            "replaceTags",
+            notes=notes,
+            tag_to_replace=tag_to_replace,
+            replace_with_tag=replace_with_tag,
+        )
+
+    async def replaceTagsInAllNotes(
+        self, tag_to_replace: str, replace_with_tag: str
+    ) -> None:
+        """Replace tags in all the notes for the current user."""
+        return await self.invoke(
+            "replaceTagsInAllNotes",
+            tag_to_replace=tag_to_replace,
+            replace_with_tag=replace_with_tag,
+        )
+
+    async def findNotes(self, query: str) -> list:
+        """Returns an array of note IDs for a given query. Query syntax is [documented
+        here](https://docs.ankiweb.net/searching.html).
+        """
+        return await self.invoke("findNotes", query=query)
+
+    async def notesInfo(self, notes: list) -> list:
+        """Returns a list of objects containing for each note ID the note fields, tags,
+        note type and the cards belonging to the note.
+        """
+        return await self.invoke("notesInfo", notes=notes)
+
+    async def deleteNotes(self, notes: list) -> None:
+        """Deletes notes with the given ids. If a note has several cards associated with
+        it, all associated cards will be deleted.
+        """
+        return await self.invoke("deleteNotes", notes=notes)
+
+    async def removeEmptyNotes(self) -> None:
+        """Removes all the empty notes for the current user."""
+        return await self.invoke("removeEmptyNotes")
+
+    # Statistic Actions
+
+    async def getNumCardsReviewedToday(self) -> int:
+        """Gets the count of cards that have been reviewed in the current day (with day
+        start time as configured by user in anki)
+        """
+        return await self.invoke("getNumCardsReviewedToday")
+
+    async def getNumCardsReviewedByDay(self) -> list:
+        """Gets the number of cards reviewed as a list of pairs of `(dateString, number)`"""
+        return await self.invoke("getNumCardsReviewedByDay")
+
+    async def getCollectionStatsHTML(self, wholeCollection: bool) -> str:
+        """Gets the collection statistics report"""
+        return await self.invoke(
+            "getCollectionStatsHTML", wholeCollection=wholeCollection
+        )
+
+    async def cardReviews(self, deck: str, startID: int) -> list:
+        """Requests all card reviews for a specified deck after a certain time. `startID`
+        is the latest unix time not included in the result. Returns a list of 9-tuples
+        `(reviewTime, cardID, usn, buttonPressed, newInterval, previousInterval,
+        newFactor, reviewDuration, reviewType)`
+        """
+        return await self.invoke("cardReviews", deck=deck, startID=startID)
+
+    async def getReviewsOfCards(self, cards: list) -> dict:
+        """Requests all card reviews for each card ID. Returns a dictionary mapping each
+        card ID to a list of dictionaries of the format:
+        ```
+        {
+            "id": reviewTime,
+            "usn": usn,
+            "ease": buttonPressed,
+            "ivl": newInterval,
+            "lastIvl": previousInterval,
+            "factor": newFactor,
+            "time": reviewDuration,
+            "type": reviewType,
+        }
+        ```
+        The reason why these key values are used instead of the more descriptive
+        counterparts is because these are the exact key values used in Anki's database.
+        """
+        return await self.invoke("getReviewsOfCards", cards=cards)
+
+    async def getLatestReviewID(self, deck: str) -> int:
+        """Returns the unix time of the latest review for the given deck. 0 if no review
+        has ever been made for the deck.
+        """
+        return await self.invoke("getLatestReviewID", deck=deck)
+
+    async def insertReviews(self, reviews: list) -> None:
+        """Inserts the given reviews into the database. Required format: list of 9-tuples
+        `(reviewTime, cardID, usn, buttonPressed, newInterval, previousInterval,
+        newFactor, reviewDuration, reviewType)`
+        """
+        return await self.invoke("insertReviews", reviews=reviews)
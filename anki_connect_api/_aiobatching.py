@@ -0,0 +1,82 @@
+import asyncio
+
+from ._protocol import check_response, make_request
+
+
+class AsyncBatcher:
+    """Coalesces calls made concurrently from several tasks into a single
+    `multi` request.
+
+    The first call of a batch waits up to `window` seconds for others to
+    join, or until `max_size` calls have been collected, then sends all of
+    them at once. Every caller gets its own result or exception back.
+    """
+
+    def __init__(self, invoke, key=None, window=0.002, max_size=32):
+        self._invoke = invoke
+        self._key = key
+        self.window = window
+        self.max_size = max_size
+        self._batch = []
+        self._timer = None
+        self._tasks = set()
+
+    async def submit(self, action: str, params: dict):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._batch.append((action, params, future))
+        if len(self._batch) >= self.max_size:
+            self._close_batch()
+        elif len(self._batch) == 1:
+            self._timer = loop.call_later(self.window, self._close_batch)
+        return await future
+
+    def _close_batch(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._batch = self._batch, []
+        if batch:
+            task = asyncio.ensure_future(self._flush(batch))
+            # keep a reference, the event loop only holds a weak one
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _flush(self, batch):
+        if len(batch) == 1:
+            action, params, future = batch[0]
+            try:
+                result = await self._invoke(action, **params)
+            except Exception as e:
+                _set_exception(future, e)
+            else:
+                _set_result(future, result)
+            return
+        try:
+            responses = await self._invoke('multi', actions=[
+                make_request(action, params, self._key)
+                for action, params, _ in batch
+            ])
+            if len(responses) != len(batch):
+                raise Exception(
+                    'multi returned an unexpected number of results'
+                )
+        except Exception as e:
+            for _, _, future in batch:
+                _set_exception(future, e)
+            return
+        for (_, _, future), response in zip(batch, responses):
+            try:
+                _set_result(future, check_response(response))
+            except Exception as e:
+                _set_exception(future, e)
+
+
+def _set_result(future, result):
+    if not future.done():
+        future.set_result(result)
+
+
+def _set_exception(future, error):
+    if not future.done():
+        future.set_exception(error)
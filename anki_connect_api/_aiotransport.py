@@ -0,0 +1,205 @@
+import asyncio
+import collections
+import socket
+import time
+import urllib.parse
+
+
+class _Connection:
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    def is_stale(self):
+        return self.reader.at_eof() or self.writer.is_closing()
+
+    def close(self):
+        self.writer.close()
+
+    def abort(self):
+        # shut the socket down, which unlike closing the transport doesn't
+        # need the event loop. The socket is closed once the transport is
+        # garbage collected.
+        try:
+            self.writer.get_extra_info('socket').shutdown(socket.SHUT_RDWR)
+        except (AttributeError, OSError):
+            pass
+
+
+class AsyncConnectionPool:
+    """An asyncio pool of persistent HTTP/1.1 connections to a single
+    Anki-Connect server.
+
+    Any number of coroutines may call `request()` concurrently, at most
+    `maxsize` of them have a request on the wire while the others wait for a
+    free connection. Idle connections are dropped when they have been unused
+    for longer than `idle_timeout` seconds or when the server has closed them.
+
+    If the server closes a reused connection before any of the answer
+    arrived, the request is sent once more on a new connection, and
+    connections are not reused anymore, like in `ConnectionPool`.
+    """
+
+    def __init__(self, url, maxsize=10, timeout=None, idle_timeout=30.0):
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme != 'http':
+            raise ValueError(f'unsupported URL scheme: {parts.scheme!r}')
+        self.url = url
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        self._host = parts.hostname
+        self._port = parts.port or 80
+        self._path = parts.path or '/'
+        self._idle = collections.deque()
+        self._slots = None
+        self._loop = None
+        self._keep_alive = True
+
+    async def request(self, body: bytes) -> bytes:
+        """POST `body` to the server and return the raw response body.
+        `body` can also be an iterable of bytes with a `len()`, which is
+        sent chunk by chunk."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # connections and semaphores can't be shared between event loops
+            self._drop_idle()
+            self._loop = loop
+            self._slots = asyncio.Semaphore(self.maxsize)
+        async with self._slots:
+            return await asyncio.wait_for(self._request(body), self.timeout)
+
+    def close(self):
+        """Close all idle connections."""
+        if self._loop is not None and self._loop.is_closed():
+            self._drop_idle()
+        while self._idle:
+            self._idle.pop()[0].close()
+
+    def _drop_idle(self):
+        # the connections may belong to an event loop which is closed, so
+        # they are aborted without going through it
+        idle, self._idle = self._idle, collections.deque()
+        for conn, _ in idle:
+            conn.abort()
+
+    async def _request(self, body):
+        conn, reused = await self._checkout()
+        try:
+            data, keep_alive = await self._roundtrip(conn, body, reused)
+        except _Disconnected:
+            conn.close()
+            # the server closed the kept-alive connection without answering,
+            # mostly because it closes connections after every response and
+            # did so while the request was on its way. It is sent once more
+            # on a new connection, where errors are not retried.
+            self._keep_alive = False
+            conn = await self._connect()
+            try:
+                data, keep_alive = await self._roundtrip(conn, body, False)
+            except BaseException:
+                conn.close()
+                raise
+        except BaseException:
+            conn.close()
+            raise
+        if keep_alive and self._keep_alive:
+            self._idle.append((conn, time.monotonic()))
+        else:
+            conn.close()
+        return data
+
+    async def _connect(self):
+        reader, writer = await asyncio.open_connection(self._host, self._port)
+        sock = writer.get_extra_info('socket')
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return _Connection(reader, writer)
+
+    async def _checkout(self):
+        now = time.monotonic()
+        while self._idle:
+            conn, last_used = self._idle.pop()
+            if now - last_used < self.idle_timeout and not conn.is_stale():
+                return conn, True
+            conn.close()
+        return await self._connect(), False
+
+    async def _roundtrip(self, conn, body, reused):
+        reader, writer = conn.reader, conn.writer
+        head = (
+            f'POST {self._path} HTTP/1.1\r\n'
+            f'Host: {self._host}:{self._port}\r\n'
+            'Content-Type: application/json\r\n'
+            f'Content-Length: {len(body)}\r\n'
+            '\r\n'
+        )
+        try:
+            if isinstance(body, bytes):
+                writer.write(head.encode('latin-1') + body)
+            else:
+                writer.write(head.encode('latin-1'))
+                for chunk in body:
+                    writer.write(chunk)
+                    await writer.drain()
+            await writer.drain()
+            status_line = await reader.readline()
+        except ConnectionError:
+            if reused:
+                raise _Disconnected
+            raise
+        if not status_line:
+            if reused:
+                raise _Disconnected
+            raise ConnectionError('server closed the connection')
+
+        version, status, reason = _parse_status_line(status_line)
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        connection = headers.get('connection', '').lower()
+        if version == 'HTTP/1.1':
+            keep_alive = connection != 'close'
+        else:
+            keep_alive = connection == 'keep-alive'
+        if 'chunked' in headers.get('transfer-encoding', '').lower():
+            data = await _read_chunked(reader)
+        elif 'content-length' in headers:
+            data = await reader.readexactly(int(headers['content-length']))
+        else:
+            data = await reader.read()
+            keep_alive = False
+        if status >= 400:
+            raise Exception(f'HTTP error {status}: {reason}')
+        return data, keep_alive
+
+
+class _Disconnected(Exception):
+    """A reused connection was closed before the answer arrived."""
+
+
+def _parse_status_line(line):
+    try:
+        version, status, reason = line.decode('latin-1').split(None, 2)
+    except ValueError:
+        version, status = line.decode('latin-1').split(None, 1)
+        reason = ''
+    return version, int(status), reason.strip()
+
+
+async def _read_chunked(reader):
+    chunks = []
+    while True:
+        size = int((await reader.readline()).split(b';')[0], 16)
+        if size == 0:
+            # skip trailers
+            while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                pass
+            return b''.join(chunks)
+        chunks.append(await reader.readexactly(size))
+        await reader.readexactly(2)
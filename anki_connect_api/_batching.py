@@ -0,0 +1,89 @@
+import threading
+import time
+
+from ._protocol import check_response, make_request
+
+
+class _Call:
+    __slots__ = ('action', 'params', 'done', 'result', 'error')
+
+    def __init__(self, action, params):
+        self.action = action
+        self.params = params
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class Batcher:
+    """Coalesces calls made concurrently from several threads into a single
+    `multi` request.
+
+    The first call of a batch waits up to `window` seconds for others to
+    join, or until `max_size` calls have been collected, then sends all of
+    them at once. Every caller gets its own result or exception back.
+    """
+
+    def __init__(self, invoke, key=None, window=0.002, max_size=32):
+        self._invoke = invoke
+        self._key = key
+        self.window = window
+        self.max_size = max_size
+        self._cond = threading.Condition()
+        self._batch = []
+
+    def submit(self, action: str, params: dict):
+        call = _Call(action, params)
+        with self._cond:
+            batch = self._batch
+            batch.append(call)
+            leader = len(batch) == 1
+            if len(batch) >= self.max_size:
+                self._batch = []
+                self._cond.notify_all()
+        if leader:
+            with self._cond:
+                deadline = time.monotonic() + self.window
+                while self._batch is batch:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._batch = []
+                        break
+                    self._cond.wait(remaining)
+            self._flush(batch)
+        else:
+            call.done.wait()
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def _flush(self, batch):
+        try:
+            if len(batch) == 1:
+                call = batch[0]
+                try:
+                    call.result = self._invoke(call.action, **call.params)
+                except Exception as e:
+                    call.error = e
+                return
+            try:
+                responses = self._invoke('multi', actions=[
+                    make_request(call.action, call.params, self._key)
+                    for call in batch
+                ])
+                if len(responses) != len(batch):
+                    raise Exception(
+                        'multi returned an unexpected number of results'
+                    )
+            except Exception as e:
+                for call in batch:
+                    call.error = e
+                return
+            for call, response in zip(batch, responses):
+                try:
+                    call.result = check_response(response)
+                except Exception as e:
+                    call.error = e
+        finally:
+            for call in batch:
+                call.done.set()
@@ -0,0 +1,253 @@
+import collections
+import copy
+import json
+import threading
+import time
+
+# read-only actions returning data that rarely changes
+METADATA_ACTIONS = frozenset((
+    'deckNames', 'deckNamesAndIds', 'getDeckConfig', 'modelNames',
+    'modelNamesAndIds', 'findModelsById', 'findModelsByName',
+    'modelFieldNames', 'modelFieldDescriptions', 'modelFieldFonts',
+    'modelFieldsOnTemplates', 'modelTemplates', 'modelStyling',
+))
+
+# actions which change decks, deck options or models, or replace the
+# collection as a whole
+METADATA_WRITES = frozenset((
+    'createDeck', 'changeDeck', 'deleteDecks', 'saveDeckConfig',
+    'setDeckConfigId', 'cloneDeckConfigId', 'removeDeckConfigId',
+    'createModel', 'updateModelTemplates', 'updateModelStyling',
+    'findAndReplaceInModels', 'modelTemplateRename', 'modelTemplateReposition',
+    'modelTemplateAdd', 'modelTemplateRemove', 'modelFieldRename',
+    'modelFieldReposition', 'modelFieldAdd', 'modelFieldRemove',
+    'modelFieldSetFont', 'modelFieldSetFontSize', 'modelFieldSetDescription',
+    'updateNoteModel', 'importPackage', 'reloadCollection', 'loadProfile',
+    'sync', 'guiImportFile', 'guiCheckDatabase',
+))
+
+# actions which may change which cards and notes a search finds
+COLLECTION_WRITES = METADATA_WRITES | frozenset((
+    'addNote', 'addNotes', 'updateNoteFields', 'updateNote', 'updateNoteTags',
+    'addTags', 'removeTags', 'replaceTags', 'replaceTagsInAllNotes',
+    'clearUnusedTags', 'deleteNotes', 'removeEmptyNotes', 'setEaseFactors',
+    'setSpecificValueOfCard', 'suspend', 'unsuspend', 'forgetCards',
+    'relearnCards', 'answerCards', 'insertReviews', 'guiAnswerCard',
+    'guiUndo',
+))
+
+
+def run(handler, send):
+    """Drive the generator returned by a cache's `handle()`: every
+    (action, params) it yields is sent with `send(action, params)` and the
+    result or exception is passed back into it."""
+    try:
+        request = next(handler)
+        while True:
+            try:
+                result = send(*request)
+            except Exception as e:
+                request = handler.throw(e)
+            else:
+                request = handler.send(result)
+    except StopIteration as stop:
+        return stop.value
+
+
+async def arun(handler, send):
+    """`run()` for coroutine `send` functions."""
+    try:
+        request = next(handler)
+        while True:
+            try:
+                result = await send(*request)
+            except Exception as e:
+                request = handler.throw(e)
+            else:
+                request = handler.send(result)
+    except StopIteration as stop:
+        return stop.value
+
+
+def params_key(params: dict) -> str:
+    return json.dumps(params, sort_keys=True, separators=(',', ':'))
+
+
+def normalize_query(query: str) -> str:
+    """Collapse runs of whitespace outside of quotes in an Anki search, so
+    equivalent searches share a cache entry."""
+    parts = []
+    quote = None
+    escaped = False
+    space = False
+    for char in query.strip():
+        if quote is None and not escaped and char.isspace():
+            space = True
+            continue
+        if space:
+            parts.append(' ')
+            space = False
+        parts.append(char)
+        if escaped:
+            escaped = False
+        elif char == '\\':
+            escaped = True
+        elif quote is None and char in '"\'':
+            quote = char
+        elif char == quote:
+            quote = None
+    return ''.join(parts)
+
+
+def affects(action: str, params: dict, writes) -> bool:
+    """Return whether `action`, or one of the actions of a `multi`, is in
+    `writes`."""
+    if action == 'multi':
+        return any(
+            affects(sub.get('action'), sub.get('params') or {}, writes)
+            for sub in params.get('actions', ())
+        )
+    return action in writes
+
+
+class ReadThroughCache:
+    """Cache for the results of the read-only `actions`, each kept for at
+    most `ttl` seconds (forever if `None`). The cache is cleared whenever
+    the client sends one of the actions in `writes`. It keeps at most
+    `max_entries` results, dropping the oldest ones first.
+
+    Caches are passed to a client as `caches` and see all its calls. Their
+    `handle(action, params)` generator yields the requests it needs sent
+    and returns the result, so the same cache works with `AnkiClient` and
+    `AsyncAnkiClient`.
+    """
+
+    def __init__(
+        self, actions, writes, ttl: float = None, max_entries: int = None
+    ):
+        self.actions = frozenset(actions)
+        self.writes = frozenset(writes)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries = collections.OrderedDict()
+        self._generation = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def key(self, action: str, params: dict):
+        return action, params_key(params)
+
+    def copy(self, result):
+        """Return a copy of a cached result, so callers can't modify it."""
+        return copy.deepcopy(result)
+
+    def handle(self, action: str, params: dict):
+        if affects(action, params, self.writes):
+            try:
+                return (yield action, params)
+            finally:
+                self.clear()
+        if action not in self.actions:
+            return (yield action, params)
+        key = self.key(action, params)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (entry[0] is None or entry[0] > now):
+                self.hits += 1
+                return self.copy(entry[1])
+            self.misses += 1
+            generation = self._generation
+        result = yield action, params
+        expires = None if self.ttl is None else now + self.ttl
+        with self._lock:
+            # don't store results which may predate a concurrent write
+            if generation == self._generation:
+                self._insert(key, expires, result, now)
+        return self.copy(result)
+
+    def _insert(self, key, expires, result, now):
+        # entries are kept in the order they were stored, which with a
+        # single ttl is also the order in which they expire
+        entries = self._entries
+        entries[key] = (expires, result)
+        entries.move_to_end(key)
+        while entries:
+            oldest = next(iter(entries.values()))[0]
+            full = (
+                self.max_entries is not None
+                and len(entries) > self.max_entries
+            )
+            if not full and (oldest is None or oldest > now):
+                break
+            entries.popitem(last=False)
+
+
+class MetadataCache(ReadThroughCache):
+    """Read-through cache for deck and model metadata like `deckNames`,
+    `modelNames` or `modelFieldNames`, which hardly ever changes. Results
+    are kept for `ttl` seconds and dropped as soon as the client creates,
+    changes or deletes a deck or model, imports, syncs or switches the
+    profile. Changes made in Anki itself are only noticed after `ttl`.
+    At most `max_entries` results are kept.
+
+    Example::
+        >>> client = AnkiClient(caches=[MetadataCache(ttl=600)])
+        >>> client.deckNames()  # sent to Anki
+        ["Default"]
+        >>> client.deckNames()  # answered from the cache
+        ["Default"]
+        >>> client.createDeck("Japanese")  # clears the cache
+        1519323742721
+    """
+
+    def __init__(
+        self,
+        ttl: float = 300.0,
+        actions=METADATA_ACTIONS,
+        writes=METADATA_WRITES,
+        max_entries: int = 1000
+    ):
+        super().__init__(actions, writes, ttl, max_entries)
+
+
+class QueryCache(ReadThroughCache):
+    """Cache for the results of `findCards` and `findNotes`, keyed by the
+    search with whitespace normalized. Any call of the client which may
+    change the results, like `addNotes`, `changeDeck`, `suspend` or
+    `answerCards`, drops all cached searches. Changes made in Anki itself,
+    like reviews, are only noticed after `max_age` seconds, if given. The
+    results of at most `max_entries` searches are kept.
+
+    Example::
+        >>> client = AnkiClient(caches=[QueryCache(max_age=30)])
+        >>> client.findCards("deck:Japanese is:due")  # sent to Anki
+        [1494723142483, 1494703460437]
+        >>> client.findCards("deck:Japanese  is:due")  # from the cache
+        [1494723142483, 1494703460437]
+    """
+
+    def __init__(
+        self,
+        max_age: float = None,
+        actions=('findCards', 'findNotes'),
+        writes=COLLECTION_WRITES,
+        max_entries: int = 256
+    ):
+        super().__init__(actions, writes, max_age, max_entries)
+
+    def key(self, action: str, params: dict):
+        query = normalize_query(params.get('query') or '')
+        return action, params_key({**params, 'query': query})
+
+    def copy(self, result):
+        return list(result)
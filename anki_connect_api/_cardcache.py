@@ -0,0 +1,336 @@
+import collections
+import math
+import threading
+import time
+
+from ._codec import get_codec
+
+# actions which may change the records of any card or note: changes of
+# models, deleting decks with their cards, and replacing the collection
+RECORD_WRITES = frozenset((
+    'deleteDecks', 'updateModelTemplates', 'updateModelStyling',
+    'findAndReplaceInModels', 'modelTemplateRename',
+    'modelTemplateReposition', 'modelTemplateAdd', 'modelTemplateRemove',
+    'modelFieldRename', 'modelFieldReposition', 'modelFieldAdd',
+    'modelFieldRemove', 'modelFieldSetFont', 'modelFieldSetFontSize',
+    'modelFieldSetDescription', 'replaceTagsInAllNotes', 'importPackage',
+    'reloadCollection', 'loadProfile', 'sync', 'guiImportFile',
+    'guiCheckDatabase',
+))
+
+# actions changing notes, which doesn't change the modification time of
+# their cards
+NOTE_WRITES = frozenset((
+    'updateNoteFields', 'updateNote', 'updateNoteModel', 'updateNoteTags',
+    'addTags', 'removeTags', 'replaceTags', 'deleteNotes',
+))
+
+# rough per entry overhead of the dict, key and tuple in bytes
+ENTRY_OVERHEAD = 200
+
+
+def written_notes(action: str, params: dict):
+    """Ids of the notes changed by a call of `action`, `None` if all of them
+    may have changed, or an empty set."""
+    if action == 'multi':
+        notes = set()
+        for sub in params.get('actions', ()):
+            sub_notes = written_notes(
+                sub.get('action'), sub.get('params') or {}
+            )
+            if sub_notes is None:
+                return None
+            notes |= sub_notes
+        return notes
+    if action in RECORD_WRITES:
+        return None
+    if action not in NOTE_WRITES:
+        return set()
+    if 'notes' in params:
+        return set(params['notes'])
+    # updateNoteTags takes the id itself, the others a note with an id
+    note = params.get('note')
+    if isinstance(note, dict):
+        note = note.get('id')
+    return {note}
+
+
+def written_cards(action: str, params: dict) -> set:
+    """Ids of the cards moved to another deck by a call of `action`."""
+    if action == 'multi':
+        cards = set()
+        for sub in params.get('actions', ()):
+            cards |= written_cards(sub.get('action'), sub.get('params') or {})
+        return cards
+    if action == 'changeDeck':
+        return set(params.get('cards', ()))
+    return set()
+
+
+class LRUStore:
+    """Encoded records in memory, evicting the least recently used ones when
+    there are more than `max_items` or they take more than `max_bytes`.
+
+    Records are stored as {id: (mod, owner, data)}, where `owner` is the id
+    of the note the record belongs to."""
+
+    def __init__(self, max_items: int = None, max_bytes: int = None):
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.meta = {}
+        self._entries = collections.OrderedDict()
+        self._owned = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_many(self, ids) -> dict:
+        found = {}
+        for id_ in ids:
+            entry = self._entries.get(id_)
+            if entry is not None:
+                self._entries.move_to_end(id_)
+                found[id_] = entry
+        return found
+
+    def put_many(self, entries: dict):
+        for id_, entry in entries.items():
+            self._remove(id_)
+            self._entries[id_] = entry
+            self._owned.setdefault(entry[1], set()).add(id_)
+            self.bytes += len(entry[2]) + ENTRY_OVERHEAD
+        while self._entries and (
+            self.max_items is not None and len(self._entries) > self.max_items
+            or self.max_bytes is not None and self.bytes > self.max_bytes
+        ):
+            self._remove(next(iter(self._entries)))
+
+    def discard(self, ids):
+        for id_ in ids:
+            self._remove(id_)
+
+    def discard_owners(self, owners):
+        """Remove the records belonging to the notes `owners`."""
+        for owner in owners:
+            for id_ in self._owned.get(owner, ()).copy():
+                self._remove(id_)
+
+    def _remove(self, id_):
+        entry = self._entries.pop(id_, None)
+        if entry is not None:
+            self.bytes -= len(entry[2]) + ENTRY_OVERHEAD
+            owned = self._owned[entry[1]]
+            owned.discard(id_)
+            if not owned:
+                del self._owned[entry[1]]
+
+    def get_meta(self, key: str):
+        return self.meta.get(key)
+
+    def set_meta(self, key: str, value):
+        self.meta[key] = value
+
+    def clear(self):
+        self._entries.clear()
+        self._owned.clear()
+        self.meta.clear()
+        self.bytes = 0
+
+
+class RecordCache:
+    """Base of the caches for the records returned by `action` for a list
+    of ids in the param `param`. Only records which are missing or outdated
+    according to `validate()` are fetched, the others are decoded from the
+    store in one go. Records without the field `id_field`, like the empty
+    ones of deleted cards or notes, are not stored."""
+
+    action = None
+    param = None
+    id_field = None
+
+    def __init__(self, store, codec=None):
+        self.store = store
+        self.codec = get_codec(codec)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    def clear(self):
+        with self._lock:
+            self.store.clear()
+            self._generation += 1
+
+    def invalidate(self, action: str, params: dict):
+        """Drop the records affected by a call of `action`."""
+        notes = written_notes(action, params)
+        if notes is None:
+            self.clear()
+        elif notes:
+            with self._lock:
+                self.store.discard_owners(notes)
+                self._generation += 1
+
+    def validate(self, ids):
+        """Generator returning {id: mod} of `ids` as currently stored by
+        Anki, or `None` if all records in the store are up to date."""
+        return None
+        yield
+
+    def owner(self, id_, record):
+        raise NotImplementedError
+
+    def handle(self, action: str, params: dict):
+        if action != self.action or not params.get(self.param):
+            try:
+                return (yield action, params)
+            finally:
+                self.invalidate(action, params)
+        ids = params[self.param]
+        current = yield from self.validate(ids)
+        unique = dict.fromkeys(ids)
+        with self._lock:
+            generation = self._generation
+            stored = self.store.get_many(
+                unique if current is None else current
+            )
+            cached = {
+                id_: entry[2] for id_, entry in stored.items()
+                if current is None or entry[0] == current[id_]
+            }
+            missing = [id_ for id_ in unique if id_ not in cached]
+            self.hits += len(cached)
+            self.misses += len(missing)
+        records = {}
+        if cached:
+            data = b'[' + b','.join(cached.values()) + b']'
+            records = dict(zip(cached, self.codec.loads(data)))
+        if missing:
+            fetched = yield self.action, {**params, self.param: missing}
+            entries = {}
+            for id_, record in zip(missing, fetched):
+                records[id_] = record
+                if record and self.id_field in record:
+                    entries[id_] = (
+                        record.get('mod'), self.owner(id_, record),
+                        self.codec.dumps(record),
+                    )
+            with self._lock:
+                # a concurrent write may have changed the fetched records
+                if generation == self._generation:
+                    self.store.put_many(entries)
+        return [records[id_] for id_ in ids]
+
+
+class CardCache(RecordCache):
+    """Incremental cache for `cardsInfo`.
+
+    Every `cardsInfo` call first asks Anki for the `cardsModTime` of the
+    requested cards, which is much faster, and then only fetches the cards
+    which are not cached or were modified since. The rest is served from
+    `store`, by default an `LRUStore` in memory keeping at most `max_cards`
+    cards or `max_bytes` bytes, or e.g. a persistent `SQLiteStore`.
+
+    Editing a note doesn't change the modification time of its cards, so
+    cards are also dropped when the client edits or deletes their notes,
+    and all of them when it changes a model. Cards moved with `changeDeck`
+    are dropped too, as a move within the second they were fetched in
+    doesn't show in their modification time.
+    Changes of note fields made in Anki itself are not noticed.
+
+    Example::
+        >>> client = AnkiClient(caches=[CardCache(max_bytes=200_000_000)])
+        >>> cards = client.findCards("deck:current")
+        >>> infos = client.cardsInfo(cards)  # fetches all cards
+        >>> infos = client.cardsInfo(cards)  # fetches only changed cards
+    """
+
+    action = 'cardsInfo'
+    param = 'cards'
+    id_field = 'cardId'
+
+    def __init__(
+        self,
+        max_cards: int = None,
+        max_bytes: int = None,
+        codec=None,
+        store=None
+    ):
+        if store is None:
+            store = LRUStore(max_cards, max_bytes)
+        super().__init__(store, codec)
+
+    def invalidate(self, action: str, params: dict):
+        cards = written_cards(action, params)
+        if cards:
+            with self._lock:
+                self.store.discard(cards)
+                self._generation += 1
+        super().invalidate(action, params)
+
+    def validate(self, ids):
+        mods = yield 'cardsModTime', {'cards': ids}
+        # deleted cards are returned as {} and fetched like unknown ones
+        return {item['cardId']: item['mod'] for item in mods if item}
+
+    def owner(self, id_, record):
+        return record.get('note')
+
+
+class NoteCache(RecordCache):
+    """Incremental cache for `notesInfo`.
+
+    Anki-Connect can't tell the modification time of notes cheaply, so at
+    most every `check_interval` seconds the notes edited since the last
+    check are searched for with `edited:N` and dropped from the cache.
+    Notes the client changes itself are dropped right away. `store` is an
+    `LRUStore` with at most `max_notes` notes or `max_bytes` bytes by
+    default, or e.g. a persistent `SQLiteStore`.
+
+    Example::
+        >>> store = SQLiteStore("anki-cache.sqlite", "notes")
+        >>> client = AnkiClient(caches=[NoteCache(store=store)])
+        >>> infos = client.notesInfo(notes)  # only fetches changed notes
+    """
+
+    action = 'notesInfo'
+    param = 'notes'
+    id_field = 'noteId'
+
+    def __init__(
+        self,
+        check_interval: float = 60.0,
+        max_notes: int = None,
+        max_bytes: int = None,
+        codec=None,
+        store=None
+    ):
+        if store is None:
+            store = LRUStore(max_notes, max_bytes)
+        super().__init__(store, codec)
+        self.check_interval = check_interval
+
+    def validate(self, ids):
+        now = time.time()
+        with self._lock:
+            checked = self.store.get_meta('checked')
+        if checked is not None and now - checked < self.check_interval:
+            return None
+        if checked is None:
+            # nothing is known about the age of the stored notes
+            self.clear()
+        else:
+            # edited:1 finds the notes edited since the start of the
+            # current day in Anki, not within the last 24 hours
+            days = math.ceil((now - checked) / 86400) + 1
+            edited = yield 'findNotes', {'query': f'edited:{days}'}
+            with self._lock:
+                self.store.discard_owners(edited)
+                self._generation += 1
+        with self._lock:
+            self.store.set_meta('checked', now)
+        return None
+
+    def owner(self, id_, record):
+        return id_
@@ -0,0 +1,157 @@
+import collections
+import gzip
+import hashlib
+import json
+import threading
+import time
+
+
+def _open(path, mode):
+    if str(path).endswith('.gz'):
+        return gzip.open(path, mode + 't', encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+
+def request_hash(action: str, params: dict) -> str:
+    """Hash identifying a request independently of the API key and of the
+    order of the params."""
+    data = json.dumps(
+        [action, params], sort_keys=True, separators=(',', ':'),
+        ensure_ascii=False
+    )
+    return hashlib.sha1(data.encode()).hexdigest()
+
+
+def _parse_request(body):
+    if not isinstance(body, bytes):
+        body = b''.join(body)
+    request = json.loads(body)
+    return request['action'], request.get('params', {})
+
+
+class RecordingTransport:
+    """Transport forwarding requests to `transport` and appending each
+    action, its params, the raw response and the time it took to the
+    cassette at `path`, one JSON object per line. The API key is not
+    recorded. Paths ending in `.gz` are compressed.
+
+    Usually created by passing `record=path` to `AnkiClient`.
+
+    Example::
+        >>> client = AnkiClient(record="session.jsonl.gz")
+        >>> client.deckNames()
+        ["Default", "My other deck"]
+        >>> client.close()
+    """
+
+    def __init__(self, path, transport):
+        self.path = path
+        self.transport = transport
+        self._lock = threading.Lock()
+        self._file = _open(path, 'a')
+
+    def request(self, body: bytes) -> bytes:
+        start = time.perf_counter()
+        data = self.transport.request(body)
+        self._write(body, data, time.perf_counter() - start)
+        return data
+
+    def _write(self, body, data, seconds):
+        action, params = _parse_request(body)
+        line = json.dumps({
+            'action': action,
+            'params': params,
+            'hash': request_hash(action, params),
+            'seconds': round(seconds, 6),
+            'response': data.decode('utf-8'),
+        }, ensure_ascii=False, separators=(',', ':'))
+        with self._lock:
+            self._file.write(line + '\n')
+
+    def close(self):
+        self.transport.close()
+        with self._lock:
+            self._file.close()
+
+
+class AsyncRecordingTransport(RecordingTransport):
+    """`RecordingTransport` for `AsyncAnkiClient`."""
+
+    async def request(self, body: bytes) -> bytes:
+        start = time.perf_counter()
+        data = await self.transport.request(body)
+        self._write(body, data, time.perf_counter() - start)
+        return data
+
+
+class ReplayTransport:
+    """Transport answering requests from a cassette written by
+    `RecordingTransport`, without a running Anki.
+
+    With `match='sequence'` the responses are served in the recorded order
+    and the action of each request must be the recorded one. With
+    `match='hash'` each response is looked up by action and params;
+    requests made several times get the recorded responses in order, the
+    last one repeating. If `latency` is true, every response is delayed by
+    the time the original request took.
+
+    Example::
+        >>> client = AnkiClient(transport=ReplayTransport("session.jsonl.gz"))
+        >>> client.deckNames()
+        ["Default", "My other deck"]
+    """
+
+    def __init__(self, path, match: str = 'sequence', latency: bool = False):
+        if match not in ('sequence', 'hash'):
+            raise ValueError(f'unknown match mode {match!r}')
+        self.path = path
+        self.match = match
+        self.latency = latency
+        self._lock = threading.Lock()
+        with _open(path, 'r') as f:
+            self.entries = [json.loads(line) for line in f if line.strip()]
+        self._position = 0
+        self._by_hash = collections.defaultdict(collections.deque)
+        for entry in self.entries:
+            self._by_hash[entry['hash']].append(entry)
+
+    def _lookup(self, body):
+        action, params = _parse_request(body)
+        with self._lock:
+            if self.match == 'hash':
+                entries = self._by_hash.get(request_hash(action, params))
+                if not entries:
+                    raise Exception(
+                        f'no recorded response for {action} in cassette'
+                    )
+                return entries.popleft() if len(entries) > 1 else entries[0]
+            if self._position >= len(self.entries):
+                raise Exception(f'cassette exhausted at {action}')
+            entry = self.entries[self._position]
+            if entry['action'] != action:
+                raise Exception(
+                    f'expected {entry["action"]} at position '
+                    f'{self._position} of cassette, got {action}'
+                )
+            self._position += 1
+            return entry
+
+    def request(self, body: bytes) -> bytes:
+        entry = self._lookup(body)
+        if self.latency:
+            time.sleep(entry['seconds'])
+        return entry['response'].encode('utf-8')
+
+    def close(self):
+        pass
+
+
+class AsyncReplayTransport(ReplayTransport):
+    """`ReplayTransport` for `AsyncAnkiClient`."""
+
+    async def request(self, body: bytes) -> bytes:
+        import asyncio
+        entry = self._lookup(body)
+        if self.latency:
+            await asyncio.sleep(entry['seconds'])
+        return entry['response'].encode('utf-8')
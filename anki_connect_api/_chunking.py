@@ -0,0 +1,111 @@
+def _concat(results):
+    merged = []
+    for result in results:
+        merged.extend(result)
+    return merged
+
+
+def _unique(results):
+    return list(dict.fromkeys(_concat(results)))
+
+
+def _update(results):
+    merged = {}
+    for result in results:
+        merged.update(result)
+    return merged
+
+
+def _extend_values(results):
+    merged = {}
+    for result in results:
+        for key, values in result.items():
+            merged.setdefault(key, []).extend(values)
+    return merged
+
+
+def _none(results):
+    return None
+
+
+# Actions which accept long lists, mapped to the names of the list parameters
+# that are split in parallel, and the function that merges the results of the
+# chunks back together.
+CHUNKABLE = {
+    'getEaseFactors': (('cards',), _concat),
+    'setEaseFactors': (('cards', 'easeFactors'), _concat),
+    'suspend': (('cards',), any),
+    'unsuspend': (('cards',), any),
+    'areSuspended': (('cards',), _concat),
+    'areDue': (('cards',), _concat),
+    'getIntervals': (('cards',), _concat),
+    'cardsToNotes': (('cards',), _unique),
+    'cardsModTime': (('cards',), _concat),
+    'cardsInfo': (('cards',), _concat),
+    'forgetCards': (('cards',), _none),
+    'relearnCards': (('cards',), _none),
+    'answerCards': (('answers',), _concat),
+    'getDecks': (('cards',), _extend_values),
+    'changeDeck': (('cards',), _none),
+    'setDeckConfigId': (('decks',), all),
+    'getDeckStats': (('decks',), _update),
+    'findModelsById': (('modelIds',), _concat),
+    'findModelsByName': (('modelNames',), _concat),
+    'addNotes': (('notes',), _concat),
+    'canAddNotes': (('notes',), _concat),
+    'canAddNotesWithErrorDetail': (('notes',), _concat),
+    'addTags': (('notes',), _none),
+    'removeTags': (('notes',), _none),
+    'replaceTags': (('notes',), _none),
+    'notesInfo': (('notes',), _concat),
+    'deleteNotes': (('notes',), _none),
+    'getReviewsOfCards': (('cards',), _update),
+    'insertReviews': (('reviews',), _none),
+}
+
+
+def size_for(chunk_size, action: str):
+    """Chunk size for `action`, `chunk_size` is either a number, a dict
+    mapping action names to numbers, with an optional `None` default, or an
+    object with a `size_for(action)` method like `AdaptiveChunkSize`."""
+    if isinstance(chunk_size, dict):
+        return chunk_size.get(action, chunk_size.get(None))
+    if hasattr(chunk_size, 'size_for'):
+        return chunk_size.size_for(action)
+    return chunk_size
+
+
+def count(action: str, params: dict):
+    """Number of items in a call of a chunkable action, `None` otherwise."""
+    if action not in CHUNKABLE:
+        return None
+    items = params.get(CHUNKABLE[action][0][0])
+    return len(items) if isinstance(items, list) else None
+
+
+def split(action: str, params: dict, size):
+    """Split the list parameters of `action` into chunks of `size` items.
+
+    Returns a list of parameter dicts, or `None` if the call doesn't need to
+    be split."""
+    if not size or action not in CHUNKABLE:
+        return None
+    names, _ = CHUNKABLE[action]
+    if any(not isinstance(params.get(name), list) for name in names):
+        return None
+    length = len(params[names[0]])
+    if length <= size:
+        return None
+    if any(len(params[name]) != length for name in names[1:]):
+        raise Exception(
+            f'{action}: parameters {", ".join(names)} differ in length'
+        )
+    return [
+        {**params, **{name: params[name][i:i + size] for name in names}}
+        for i in range(0, length, size)
+    ]
+
+
+def merge(action: str, results: list):
+    """Merge the results of the chunks in the order of the input."""
+    return CHUNKABLE[action][1](results)
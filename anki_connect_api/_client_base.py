@@ -0,0 +1,434 @@
+import contextlib
+import io
+import time
+
+from ._cache import arun, run
+from ._chunking import count, merge, size_for, split
+from ._codec import get_codec
+from ._profiling import Profile, _CountingReader, observe
+from ._protocol import decode_response, encode_request
+
+
+class _ClientBase:
+    """Settings and profiling shared by the sync and the async client."""
+
+    def __init__(
+        self, url, key, pool_size, chunk_size, chunk_workers, codec,
+        metrics, caches
+    ):
+        if url is None:
+            from . import URL as url
+        self.url = url
+        self.key = key
+        self.pool_size = pool_size
+        self.codec = get_codec(codec)
+        self.metrics = metrics
+        self.caches = tuple(caches)
+        self.chunk_size = chunk_size
+        self.chunk_workers = chunk_workers
+        self._profiles = ()
+
+    @contextlib.contextmanager
+    def profile(self):
+        """Collect the phase timings of all requests sent by this client
+        while the block is executed, see `Profile`."""
+        profile = Profile()
+        self._profiles += (profile,)
+        try:
+            yield profile
+        finally:
+            self._profiles = tuple(
+                p for p in self._profiles if p is not profile
+            )
+
+
+class BaseClient(_ClientBase):
+    """Sends the calls of `AnkiClient`, which adds the action methods."""
+
+    def __init__(
+        self,
+        url: str = None,
+        key: str = None,
+        timeout: float = None,
+        transport=None,
+        *,
+        pool_size: int = 4,
+        batch_window: float = None,
+        batch_size: int = 32,
+        chunk_size=None,
+        chunk_workers: int = 1,
+        codec: str = None,
+        metrics=None,
+        record=None,
+        caches=()
+    ):
+        super().__init__(
+            url, key, pool_size, chunk_size, chunk_workers, codec, metrics,
+            caches,
+        )
+        if transport is None:
+            from ._transport import ConnectionPool
+            transport = ConnectionPool(self.url, pool_size, timeout)
+        if record is not None:
+            from ._cassette import RecordingTransport
+            transport = RecordingTransport(record, transport)
+        self.transport = transport
+        self._batcher = None
+        if batch_window is not None:
+            from ._batching import Batcher
+            self._batcher = Batcher(
+                self._request, key, batch_window, batch_size
+            )
+        self._executor = None
+        if chunk_workers > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            self._executor = ThreadPoolExecutor(chunk_workers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.transport.close()
+        if self._executor is not None:
+            self._executor.shutdown()
+
+    def invoke(self, action: str, **params):
+        if self.caches:
+            return self._cached(0, action, params)
+        return self._invoke(action, params)
+
+    def stream(self, action: str, **params):
+        """Like `invoke`, but decodes the response while it is received and
+        yields the items of the result one at a time: the elements of an
+        array, or the (key, value) pairs of an object. Memory use is bounded
+        by the largest item instead of the whole result.
+
+        The connection is returned to the pool once the response has been
+        received completely. Consume the stream to the end or `close()` it,
+        e.g. with `contextlib.closing()`: one abandoned before keeps its
+        connection until it is garbage collected.
+
+        Example::
+            >>> for card in client.stream("cardsInfo", cards=cards):
+            ...     print(card["cardId"])
+        """
+        from ._streaming import iter_response
+        start = time.perf_counter()
+        body = encode_request(action, params, self.key, self.codec)
+        with self._exchange(action, body, start) as response:
+            yield from iter_response(response.read)
+
+    def storeMediaFileFrom(
+        self, filename: str, source, deleteExisting: bool = True
+    ) -> str:
+        """Like `storeMediaFile`, but reads the contents from `source`, a
+        path or a binary file object, and base64-encodes them while the
+        request is sent. Memory use doesn't grow with the size of the file.
+
+        Example::
+            >>> client.storeMediaFileFrom("_video.mp4", "/path/to/video.mp4")
+            "_video.mp4"
+        """
+        from ._media import Base64Body
+        params = {'filename': filename, 'deleteExisting': deleteExisting}
+
+        def send(action, sent):
+            if sent is not params:
+                return self._invoke(action, sent)
+            body = Base64Body(
+                action, params, 'data', source, self.key, self.codec
+            )
+            with body:
+                return self._post(action, body)
+
+        return self._cached(0, 'storeMediaFile', params, send)
+
+    def retrieveMediaFileTo(self, filename: str, target):
+        """Like `retrieveMediaFile`, but decodes the contents while they are
+        received and writes them to `target`, a path or a binary file
+        object. Memory use doesn't grow with the size of the file. Returns
+        the number of bytes written, or `False` if the file does not exist.
+
+        Example::
+            >>> client.retrieveMediaFileTo("_video.mp4", "/path/to/video.mp4")
+            104857600
+        """
+        from ._media import write_response
+        params = {'filename': filename, 'target': target}
+
+        def send(action, sent):
+            if sent is not params:
+                return self._invoke(action, sent)
+            start = time.perf_counter()
+            body = encode_request(
+                'retrieveMediaFile', {'filename': filename}, self.key,
+                self.codec,
+            )
+            with self._exchange('retrieveMediaFile', body, start) as response:
+                return write_response(response.read, target)
+
+        # passed through the caches as an action of its own, so MediaCache
+        # can serve it without encoding the file
+        return self._cached(0, 'retrieveMediaFileTo', params, send)
+
+    def _cached(self, index, action, params, send=None):
+        if index == len(self.caches):
+            return (send or self._invoke)(action, params)
+        return run(
+            self.caches[index].handle(action, params),
+            lambda action, params: self._cached(
+                index + 1, action, params, send
+            ),
+        )
+
+    def _invoke(self, action, params):
+        chunks = split(action, params, size_for(self.chunk_size, action))
+        if chunks is not None:
+            return merge(action, self._map(action, chunks))
+        return self._call(action, params)
+
+    def _map(self, action, chunks):
+        # the chunks are sent past the batcher, which would merge them
+        # back into a single request
+        if self._executor is None:
+            return [self._call(action, chunk, False) for chunk in chunks]
+        return list(self._executor.map(
+            lambda chunk: self._call(action, chunk, False), chunks
+        ))
+
+    def _call(self, action, params, batch=True):
+        if hasattr(self.chunk_size, 'record'):
+            items = count(action, params)
+            if items is not None:
+                start = time.perf_counter()
+                result = self._send(action, params, batch)
+                self.chunk_size.record(
+                    action, items, time.perf_counter() - start
+                )
+                return result
+        return self._send(action, params, batch)
+
+    def _send(self, action, params, batch=True):
+        if batch and self._batcher is not None:
+            return self._batcher.submit(action, params)
+        return self._request(action, **params)
+
+    def _request(self, action, **params):
+        if self.metrics is None and not self._profiles:
+            body = encode_request(action, params, self.key, self.codec)
+            return decode_response(self.transport.request(body), self.codec)
+        start = time.perf_counter()
+        body = encode_request(action, params, self.key, self.codec)
+        return self._post(action, body, start)
+
+    def _post(self, action, body, start=None):
+        if self.metrics is None and not self._profiles:
+            return decode_response(self.transport.request(body), self.codec)
+        with self._exchange(action, body, start) as response:
+            return decode_response(response.read(), self.codec)
+
+    @contextlib.contextmanager
+    def _exchange(self, action, body, start=None):
+        """Send the request `body` and yield the response, a binary file
+        object to `read()` it from. Every request except the plain ones
+        without metrics and profiles goes through here, so they are all
+        observed. Decoding while the response is read, like `stream()`
+        does, counts as reading."""
+        if self.metrics is None and not self._profiles:
+            if not hasattr(self.transport, 'stream'):
+                yield io.BytesIO(self.transport.request(body))
+                return
+            with self.transport.stream(body) as response:
+                yield response
+            return
+        times = [start, time.perf_counter(), None, None, None]
+        if start is None:
+            times[0] = times[1]
+        response = None
+        error = True
+        try:
+            if hasattr(self.transport, 'stream'):
+                with self.transport.stream(body) as raw:
+                    times[2] = time.perf_counter()
+                    response = _CountingReader(raw)
+                    yield response
+            else:
+                data = self.transport.request(body)
+                times[2] = time.perf_counter()
+                response = _CountingReader(io.BytesIO(data))
+                yield response
+            error = False
+        except GeneratorExit:
+            # a stream which was closed before its end
+            error = False
+            raise
+        finally:
+            times[4] = time.perf_counter()
+            if response is not None:
+                times[3] = response.done or times[4]
+            observe(
+                self, action, times, len(body),
+                0 if response is None else response.size, error,
+            )
+
+
+class AsyncBaseClient(_ClientBase):
+    """Sends the calls of `AsyncAnkiClient`, which adds the action methods.
+
+    asyncio is only imported once an instance is created, so that the sync
+    client doesn't pay for it.
+    """
+
+    def __init__(
+        self,
+        url: str = None,
+        key: str = None,
+        timeout: float = None,
+        transport=None,
+        *,
+        pool_size: int = 10,
+        batch_window: float = None,
+        batch_size: int = 32,
+        chunk_size=None,
+        chunk_workers: int = 1,
+        codec: str = None,
+        metrics=None,
+        record=None,
+        caches=()
+    ):
+        super().__init__(
+            url, key, pool_size, chunk_size, chunk_workers, codec, metrics,
+            caches,
+        )
+        if transport is None:
+            from ._aiotransport import AsyncConnectionPool
+            transport = AsyncConnectionPool(self.url, pool_size, timeout)
+        if record is not None:
+            from ._cassette import AsyncRecordingTransport
+            transport = AsyncRecordingTransport(record, transport)
+        self.transport = transport
+        self._batcher = None
+        if batch_window is not None:
+            from ._aiobatching import AsyncBatcher
+            self._batcher = AsyncBatcher(
+                self._request, key, batch_window, batch_size
+            )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        self.transport.close()
+
+    async def invoke(self, action: str, **params):
+        if self.caches:
+            return await self._cached(0, action, params)
+        return await self._invoke(action, params)
+
+    async def storeMediaFileFrom(
+        self, filename: str, source, deleteExisting: bool = True
+    ) -> str:
+        """Like `storeMediaFile`, but reads the contents from `source`, a
+        path or a binary file object, and base64-encodes them while the
+        request is sent. Memory use doesn't grow with the size of the file.
+
+        Example::
+            >>> await client.storeMediaFileFrom("_video.mp4", "video.mp4")
+            "_video.mp4"
+        """
+        from ._media import Base64Body
+        params = {'filename': filename, 'deleteExisting': deleteExisting}
+
+        async def send(action, sent):
+            if sent is not params:
+                return await self._invoke(action, sent)
+            body = Base64Body(
+                action, params, 'data', source, self.key, self.codec
+            )
+            with body:
+                return await self._post(action, body)
+
+        return await self._cached(0, 'storeMediaFile', params, send)
+
+    async def _cached(self, index, action, params, send=None):
+        if index == len(self.caches):
+            return await (send or self._invoke)(action, params)
+        return await arun(
+            self.caches[index].handle(action, params),
+            lambda action, params: self._cached(
+                index + 1, action, params, send
+            ),
+        )
+
+    async def _invoke(self, action, params):
+        chunks = split(action, params, size_for(self.chunk_size, action))
+        if chunks is not None:
+            return merge(action, await self._map(action, chunks))
+        return await self._call(action, params)
+
+    async def _map(self, action, chunks):
+        # the chunks are sent past the batcher, which would merge them
+        # back into a single request
+        if self.chunk_workers <= 1:
+            return [
+                await self._call(action, chunk, False) for chunk in chunks
+            ]
+        import asyncio
+        slots = asyncio.Semaphore(self.chunk_workers)
+
+        async def call(chunk):
+            async with slots:
+                return await self._call(action, chunk, False)
+
+        return await asyncio.gather(*map(call, chunks))
+
+    async def _call(self, action, params, batch=True):
+        if hasattr(self.chunk_size, 'record'):
+            items = count(action, params)
+            if items is not None:
+                start = time.perf_counter()
+                result = await self._send(action, params, batch)
+                self.chunk_size.record(
+                    action, items, time.perf_counter() - start
+                )
+                return result
+        return await self._send(action, params, batch)
+
+    async def _send(self, action, params, batch=True):
+        if batch and self._batcher is not None:
+            return await self._batcher.submit(action, params)
+        return await self._request(action, **params)
+
+    async def _request(self, action, **params):
+        if self.metrics is None and not self._profiles:
+            body = encode_request(action, params, self.key, self.codec)
+            data = await self.transport.request(body)
+            return decode_response(data, self.codec)
+        start = time.perf_counter()
+        body = encode_request(action, params, self.key, self.codec)
+        return await self._post(action, body, start)
+
+    async def _post(self, action, body, start=None):
+        if self.metrics is None and not self._profiles:
+            data = await self.transport.request(body)
+            return decode_response(data, self.codec)
+        times = [start, time.perf_counter(), None, None, None]
+        if start is None:
+            times[0] = times[1]
+        data = b''
+        error = True
+        try:
+            data = await self.transport.request(body)
+            times[2] = times[3] = time.perf_counter()
+            result = decode_response(data, self.codec)
+            error = False
+            return result
+        finally:
+            times[4] = time.perf_counter()
+            observe(self, action, times, len(body), len(data), error)
@@ -0,0 +1,75 @@
+class Codec:
+    """A JSON implementation: `dumps(obj)` returns UTF-8 encoded bytes and
+    `loads(data)` accepts bytes."""
+
+    def __init__(self, name, dumps, loads):
+        self.name = name
+        self.dumps = dumps
+        self.loads = loads
+
+    def __repr__(self):
+        return f'<Codec {self.name}>'
+
+
+def _json_dumps(obj):
+    import json
+    return json.dumps(obj).encode('utf-8')
+
+
+def _make_json():
+    import json
+    return Codec('json', _json_dumps, json.loads)
+
+
+def _make_orjson():
+    import orjson
+
+    def dumps(obj):
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # e.g. integers beyond 64 bit, which the stdlib can handle
+            return _json_dumps(obj)
+
+    return Codec('orjson', dumps, orjson.loads)
+
+
+def _make_ujson():
+    import ujson
+
+    def dumps(obj):
+        try:
+            return ujson.dumps(obj, ensure_ascii=False).encode('utf-8')
+        except OverflowError:
+            # integers beyond 64 bit, like for orjson
+            return _json_dumps(obj)
+
+    return Codec('ujson', dumps, ujson.loads)
+
+
+_factories = {
+    'orjson': _make_orjson,
+    'ujson': _make_ujson,
+    'json': _make_json,
+}
+_codecs = {}
+
+
+def get_codec(codec=None) -> Codec:
+    """Return the `Codec` called `codec` ('orjson', 'ujson' or 'json'), or
+    the fastest one installed if `codec` is `None`. `Codec` instances are
+    returned as they are."""
+    if isinstance(codec, Codec):
+        return codec
+    if codec is not None and codec not in _factories:
+        raise ValueError(f'unknown codec: {codec!r}')
+    names = _factories if codec is None else (codec,)
+    for name in names:
+        if name not in _codecs:
+            try:
+                _codecs[name] = _factories[name]()
+            except ImportError:
+                if codec is not None:
+                    raise
+                continue
+        return _codecs[name]
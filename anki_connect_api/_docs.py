@@ -1,58 +1,22 @@
-__version__ = '24.2.26.0'
+"""Documentation of the action functions, attached by
+`anki_connect_api.load_docs()`."""
 
-import json
-import urllib.request
-
-URL = 'http://127.0.0.1:8765'
-
-
-def invoke(action: str, **params):
-    requestJson = json.dumps({
-        'action': action,
-        'version': 6,
-        'params': params
-    }).encode('utf-8')
-    response = json.load(
-        urllib.request.urlopen(urllib.request.Request(URL, requestJson))
-    )
-    if len(response) != 2:
-        raise Exception('response has an unexpected number of fields')
-    if 'error' not in response:
-        raise Exception('response is missing required error field')
-    if 'result' not in response:
-        raise Exception('response is missing required result field')
-    if response['error'] is not None:
-        raise Exception(response['error'])
-    return response['result']
-
-
-# Card Actions
-
-
-def getEaseFactors(cards: list) -> list:
-    """Returns an array with the ease factor for each of the given cards (in the same
+DOCS = {
+    'getEaseFactors': """Returns an array with the ease factor for each of the given cards (in the same
     order).
 
     Example::
         >>> getEaseFactors([1483959291685, 1483959293217])
         [4100, 3900]
-    """
-    return invoke("getEaseFactors", cards=cards)
-
-
-def setEaseFactors(cards: list, easeFactors: list) -> list:
-    """Sets ease factor of cards by card ID; returns `True` if successful (all cards
+    """,
+    'setEaseFactors': """Sets ease factor of cards by card ID; returns `True` if successful (all cards
     existed) or `False` otherwise.
 
     Example::
         >>> setEaseFactors([1483959291685, 1483959293217], [4100, 3900])
         [True, True]
-    """
-    return invoke("setEaseFactors", cards=cards, easeFactors=easeFactors)
-
-
-def setSpecificValueOfCard(card: int, keys: list, newValues: list) -> list:
-    """Sets specific value of a single card. Given the risk of wreaking havor in the
+    """,
+    'setSpecificValueOfCard': """Sets specific value of a single card. Given the risk of wreaking havor in the
     database when changing some of the values of a card, some of the keys require the
     argument "warning_check" set to True. This can be used to set a card's flag, change
     it's ease factor, change the review order in a filtered deck and change the column
@@ -63,58 +27,36 @@ def setSpecificValueOfCard(card: int, keys: list, newValues: list) -> list:
     Example::
         >>> setSpecificValueOfCard(1483959291685, ["flags", "odue"], ["1", "-100"])
         [True, True]
-    """
-    return invoke(
-        "setSpecificValueOfCard", card=card, keys=keys, newValues=newValues
-    )
-
-
-def suspend(cards: list) -> bool:
-    """Suspend cards by card ID; returns `True` if successful (at least one card wasn't
+    """,
+    'suspend': """Suspend cards by card ID; returns `True` if successful (at least one card wasn't
     already suspended) or `False` otherwise.
 
     Example::
         >>> suspend([1483959291685, 1483959293217])
         True
-    """
-    return invoke("suspend", cards=cards)
-
-
-def unsuspend(cards: list) -> bool:
-    """Unsuspend cards by card ID; returns `True` if successful (at least one card was
+    """,
+    'unsuspend': """Unsuspend cards by card ID; returns `True` if successful (at least one card was
     previously suspended) or `False` otherwise.
 
     Example::
         >>> unsuspend([1483959291685, 1483959293217])
         True
-    """
-    return invoke("unsuspend", cards=cards)
-
-
-def suspended(card: int) -> bool:
-    """Check if card is suspended by its ID. Returns `True` if suspended, `False`
+    """,
+    'suspended': """Check if card is suspended by its ID. Returns `True` if suspended, `False`
     otherwise.
 
     Example::
         >>> suspended(1483959293217)
         True
-    """
-    return invoke("suspended", card=card)
-
-
-def areSuspended(cards: list) -> list:
-    """Returns an array indicating whether each of the given cards is suspended (in the
+    """,
+    'areSuspended': """Returns an array indicating whether each of the given cards is suspended (in the
     same order). If card doesn't exist returns `None`.
 
     Example::
         >>> areSuspended([1483959291685, 1483959293217, 1234567891234])
         [False, True, None]
-    """
-    return invoke("areSuspended", cards=cards)
-
-
-def areDue(cards: list) -> list:
-    """Returns an array indicating whether each of the given cards is due (in the same
+    """,
+    'areDue': """Returns an array indicating whether each of the given cards is due (in the same
     order). *Note*: cards in the learning queue with a large interval (over 20 minutes)
     are treated as not due until the time of their interval has passed, to match the way
     Anki treats them when reviewing.
@@ -122,12 +64,8 @@ def areDue(cards: list) -> list:
     Example::
         >>> areDue([1483959291685, 1483959293217])
         [False, True]
-    """
-    return invoke("areDue", cards=cards)
-
-
-def getIntervals(cards: list, complete: bool = False) -> list:
-    """Returns an array of the most recent intervals for each given card ID, or a
+    """,
+    'getIntervals': """Returns an array of the most recent intervals for each given card ID, or a
     2-dimensional array of all the intervals for each given card ID when `complete` is
     `True`. Negative intervals are in seconds and positive intervals in days.
 
@@ -140,45 +78,29 @@ def getIntervals(cards: list, complete: bool = False) -> list:
             [-120, -180, -240, -300, -360, -14400],
             [-120, -180, -240, -300, -360, -14400, 1, 3]
         ]
-    """
-    return invoke("getIntervals", cards=cards, complete=complete)
-
-
-def findCards(query: str) -> list:
-    """Returns an array of card IDs for a given query. Functionally identical to
+    """,
+    'findCards': """Returns an array of card IDs for a given query. Functionally identical to
     `guiBrowse` but doesn't use the GUI for better performance.
 
     Example::
         >>> findCards("deck:current")
         [1494723142483, 1494703460437, 1494703479525]
-    """
-    return invoke("findCards", query=query)
-
-
-def cardsToNotes(cards: list) -> list:
-    """Returns an unordered array of note IDs for the given card IDs. For cards with the
+    """,
+    'cardsToNotes': """Returns an unordered array of note IDs for the given card IDs. For cards with the
     same note, the ID is only given once in the array.
 
     Example::
         >>> cardsToNotes([1502098034045, 1502098034048, 1502298033753])
         [1502098029797, 1502298025183]
-    """
-    return invoke("cardsToNotes", cards=cards)
-
-
-def cardsModTime(cards: list) -> list:
-    """Returns a list of objects containings for each card ID the modification time. This
+    """,
+    'cardsModTime': """Returns a list of objects containings for each card ID the modification time. This
     function is about 15 times faster than executing `cardsInfo`.
 
     Example::
         >>> cardsModTime([1498938915662, 1502098034048])
         [{"cardId": 1498938915662, "mod": 1629454092}]
-    """
-    return invoke("cardsModTime", cards=cards)
-
-
-def cardsInfo(cards: list) -> list:
-    """Returns a list of objects containing for each card ID the card fields, front and
+    """,
+    'cardsInfo': """Returns a list of objects containing for each card ID the card fields, front and
     back sides including CSS, note type, the note that the card belongs to, and deck name,
     last modification timestamp as well as ease and interval.
 
@@ -231,30 +153,18 @@ def cardsInfo(cards: list) -> list:
                 "left": 6,
             },
         ]
-    """
-    return invoke("cardsInfo", cards=cards)
-
-
-def forgetCards(cards: list) -> None:
-    """Forget cards, making the cards new again.
+    """,
+    'forgetCards': """Forget cards, making the cards new again.
 
     Example::
         >>> forgetCards([1498938915662, 1502098034048])
-    """
-    return invoke("forgetCards", cards=cards)
-
-
-def relearnCards(cards: list) -> None:
-    """Make cards be "relearning".
+    """,
+    'relearnCards': """Make cards be "relearning".
 
     Example::
         >>> relearnCards([1498938915662, 1502098034048])
-    """
-    return invoke("relearnCards", cards=cards)
-
-
-def answerCards(answers: list) -> list:
-    """Answer cards. Ease is between 1 (Again) and 4 (Easy). Will start the timer
+    """,
+    'answerCards': """Answer cards. Ease is between 1 (Again) and 4 (Easy). Will start the timer
     immediately before answering. Returns `True` if card exists, `False` otherwise.
 
     Example::
@@ -262,34 +172,20 @@ def answerCards(answers: list) -> list:
         ...     [{"cardId": 1498938915662, "ease": 2}, {"cardId": 1502098034048, "ease": 4}]
         ... )
         [True, True]
-    """
-    return invoke("answerCards", answers=answers)
-
-# Deck Actions
-
-
-def deckNames() -> list:
-    """Gets the complete list of deck names for the current user.
+    """,
+    'deckNames': """Gets the complete list of deck names for the current user.
 
     Example::
         >>> deckNames()
         ["Default"]
-    """
-    return invoke("deckNames")
-
-
-def deckNamesAndIds() -> dict:
-    """Gets the complete list of deck names and their respective IDs for the current user.
+    """,
+    'deckNamesAndIds': """Gets the complete list of deck names and their respective IDs for the current user.
 
     Example::
         >>> deckNamesAndIds()
         {"Default": 1}
-    """
-    return invoke("deckNamesAndIds")
-
-
-def getDecks(cards: list) -> dict:
-    """Accepts an array of card IDs and returns an object with each deck name as a key,
+    """,
+    'getDecks': """Accepts an array of card IDs and returns an object with each deck name as a key,
     and its value an array of the given cards which belong to it.
 
     Example::
@@ -298,42 +194,26 @@ def getDecks(cards: list) -> dict:
             "Default": [1502032366472],
             "Japanese::JLPT N3": [1502298036657, 1502298033753],
         }
-    """
-    return invoke("getDecks", cards=cards)
-
-
-def createDeck(deck: str) -> int:
-    """Create a new empty deck. Will not overwrite a deck that exists with the same name.
+    """,
+    'createDeck': """Create a new empty deck. Will not overwrite a deck that exists with the same name.
 
     Example::
         >>> createDeck("Japanese::Tokyo")
         1519323742721
-    """
-    return invoke("createDeck", deck=deck)
-
-
-def changeDeck(cards: list, deck: str) -> None:
-    """Moves cards with the given IDs to a different deck, creating the deck if it doesn't
+    """,
+    'changeDeck': """Moves cards with the given IDs to a different deck, creating the deck if it doesn't
     exist yet.
 
     Example::
         >>> changeDeck([1502098034045, 1502098034048, 1502298033753], "Japanese::JLPT N3")
-    """
-    return invoke("changeDeck", cards=cards, deck=deck)
-
-
-def deleteDecks(decks: list, cardsToo: bool) -> None:
-    """Deletes decks with the given names. The argument `cardsToo` *must* be specified and
+    """,
+    'deleteDecks': """Deletes decks with the given names. The argument `cardsToo` *must* be specified and
     set to `True`.
 
     Example::
         >>> deleteDecks(["Japanese::JLPT N5", "Easy Spanish"], True)
-    """
-    return invoke("deleteDecks", decks=decks, cardsToo=cardsToo)
-
-
-def getDeckConfig(deck: str) -> dict:
-    """Gets the configuration group object for the given deck.
+    """,
+    'getDeckConfig': """Gets the configuration group object for the given deck.
 
     Example::
         >>> getDeckConfig("Default")
@@ -373,12 +253,8 @@ def getDeckConfig(deck: str) -> dict:
             "replayq": True,
             "usn": -1,
         }
-    """
-    return invoke("getDeckConfig", deck=deck)
-
-
-def saveDeckConfig(config: dict) -> bool:
-    """Saves the given configuration group, returning `True` on success or `False` if the
+    """,
+    'saveDeckConfig': """Saves the given configuration group, returning `True` on success or `False` if the
     ID of the configuration group is invalid (such as when it does not exist).
 
     Example::
@@ -421,24 +297,16 @@ def saveDeckConfig(config: dict) -> bool:
         ...     }
         ... )
         True
-    """
-    return invoke("saveDeckConfig", config=config)
-
-
-def setDeckConfigId(decks: list, configId: int) -> bool:
-    """Changes the configuration group for the given decks to the one with the given ID.
+    """,
+    'setDeckConfigId': """Changes the configuration group for the given decks to the one with the given ID.
     Returns `True` on success or `False` if the given configuration group or any of the
     given decks do not exist.
 
     Example::
         >>> setDeckConfigId(["Default"], 1)
         True
-    """
-    return invoke("setDeckConfigId", decks=decks, configId=configId)
-
-
-def cloneDeckConfigId(name: str, cloneFrom: int) -> int:
-    """Creates a new configuration group with the given name, cloning from the group with
+    """,
+    'cloneDeckConfigId': """Creates a new configuration group with the given name, cloning from the group with
     the given ID, or from the default group if this is unspecified. Returns the ID of the
     new configuration group, or `False` if the specified group to clone from does not
     exist.
@@ -446,24 +314,16 @@ def cloneDeckConfigId(name: str, cloneFrom: int) -> int:
     Example::
         >>> cloneDeckConfigId("Copy of Default", 1)
         1502972374573
-    """
-    return invoke("cloneDeckConfigId", name=name, cloneFrom=cloneFrom)
-
-
-def removeDeckConfigId(configId: int) -> bool:
-    """Removes the configuration group with the given ID, returning `True` if successful,
+    """,
+    'removeDeckConfigId': """Removes the configuration group with the given ID, returning `True` if successful,
     or `False` if attempting to remove either the default configuration group (ID = 1) or
     a configuration group that does not exist.
 
     Example::
         >>> removeDeckConfigId(1502972374573)
         True
-    """
-    return invoke("removeDeckConfigId", configId=configId)
-
-
-def getDeckStats(decks: list) -> dict:
-    """Gets statistics such as total cards and cards due for the given decks.
+    """,
+    'getDeckStats': """Gets statistics such as total cards and cards due for the given decks.
 
     Example::
         >>> getDeckStats(["Japanese::JLPT N5", "Easy Spanish"])
@@ -485,14 +345,8 @@ def getDeckStats(decks: list) -> dict:
                 "total_in_deck": 852,
             },
         }
-    """
-    return invoke("getDeckStats", decks=decks)
-
-# Graphical Actions
-
-
-def guiBrowse(query: str, reorderCards: dict) -> list:
-    """Invokes the *Card Browser* dialog and searches for a given query. Returns an array
+    """,
+    'guiBrowse': """Invokes the *Card Browser* dialog and searches for a given query. Returns an array
     of identifiers of the cards that were found. Query syntax is [documented
     here](https://docs.ankiweb.net/searching.html).
 
@@ -506,35 +360,23 @@ def guiBrowse(query: str, reorderCards: dict) -> list:
     Example::
         >>> guiBrowse("deck:current", {"order": "descending", "columnId": "noteCrt"})
         [1494723142483, 1494703460437, 1494703479525]
-    """
-    return invoke("guiBrowse", query=query, reorderCards=reorderCards)
-
-
-def guiSelectNote(note: int) -> bool:
-    """Finds the open instance of the *Card Browser* dialog and selects a note given a
+    """,
+    'guiSelectNote': """Finds the open instance of the *Card Browser* dialog and selects a note given a
     note identifier. Returns `True` if the *Card Browser* is open, `False` otherwise.
 
     Example::
         >>> guiSelectNote(1494723142483)
         True
-    """
-    return invoke("guiSelectNote", note=note)
-
-
-def guiSelectedNotes() -> list:
-    """Finds the open instance of the *Card Browser* dialog and returns an array of
+    """,
+    'guiSelectedNotes': """Finds the open instance of the *Card Browser* dialog and returns an array of
     identifiers of the notes that are selected. Returns an empty list if the browser is
     not open.
 
     Example::
         >>> guiSelectedNotes()
         [1494723142483, 1494703460437, 1494703479525]
-    """
-    return invoke("guiSelectedNotes")
-
-
-def guiAddCards(note: dict) -> int:
-    """Invokes the *Add Cards* dialog, presets the note using the given deck and model,
+    """,
+    'guiAddCards': """Invokes the *Add Cards* dialog, presets the note using the given deck and model,
     with the provided field values and tags. Invoking it multiple times closes the old
     window and _reopen the window_ with the new provided values.
 
@@ -565,12 +407,8 @@ def guiAddCards(note: dict) -> int:
         ...     }
         ... )
         1496198395707
-    """  # noqa: E501
-    return invoke("guiAddCards", note=note)
-
-
-def guiEditNote(note: int) -> None:
-    """Opens the *Edit* dialog with a note corresponding to given note ID. The dialog is
+    """,  # noqa: E501
+    'guiEditNote': """Opens the *Edit* dialog with a note corresponding to given note ID. The dialog is
     similar to the *Edit Current* dialog, but:
 
     * has a Preview button to preview the cards for the note
@@ -580,12 +418,8 @@ def guiEditNote(note: int) -> None:
 
     Example::
         >>> guiEditNote(1649198355435)
-    """
-    return invoke("guiEditNote", note=note)
-
-
-def guiCurrentCard() -> dict:
-    """Returns information about the current card or `None` if not in review mode.
+    """,
+    'guiCurrentCard': """Returns information about the current card or `None` if not in review mode.
 
     Example::
         >>> guiCurrentCard()
@@ -604,142 +438,85 @@ def guiCurrentCard() -> dict:
             "buttons": [1, 2, 3],
             "nextReviews": ["<1m", "<10m", "4d"],
         }
-    """
-    return invoke("guiCurrentCard")
-
-
-def guiStartCardTimer() -> bool:
-    """Starts or resets the `timerStarted` value for the current card. This is useful for
+    """,
+    'guiStartCardTimer': """Starts or resets the `timerStarted` value for the current card. This is useful for
     deferring the start time to when it is displayed via the API, allowing the recorded
     time taken to answer the card to be more accurate when calling `guiAnswerCard`.
 
     Example::
         >>> guiStartCardTimer()
         True
-    """
-    return invoke("guiStartCardTimer")
-
-
-def guiShowQuestion() -> bool:
-    """Shows question text for the current card; returns `True` if in review mode or
+    """,
+    'guiShowQuestion': """Shows question text for the current card; returns `True` if in review mode or
     `False` otherwise.
 
     Example::
         >>> guiShowQuestion()
         True
-    """
-    return invoke("guiShowQuestion")
-
-
-def guiShowAnswer() -> bool:
-    """Shows answer text for the current card; returns `True` if in review mode or `False`
+    """,
+    'guiShowAnswer': """Shows answer text for the current card; returns `True` if in review mode or `False`
     otherwise.
 
     Example::
         >>> guiShowAnswer()
         True
-    """
-    return invoke("guiShowAnswer")
-
-
-def guiAnswerCard(ease: int) -> bool:
-    """Answers the current card; returns `True` if succeeded or `False` otherwise. Note
+    """,
+    'guiAnswerCard': """Answers the current card; returns `True` if succeeded or `False` otherwise. Note
     that the answer for the current card must be displayed before before any answer can be
     accepted by Anki.
 
     Example::
         >>> guiAnswerCard(1)
         True
-    """
-    return invoke("guiAnswerCard", ease=ease)
-
-
-def guiUndo() -> bool:
-    """Undo the last action / card; returns `True` if succeeded or `False` otherwise.
+    """,
+    'guiUndo': """Undo the last action / card; returns `True` if succeeded or `False` otherwise.
 
     Example::
         >>> guiUndo()
         True
-    """
-    return invoke("guiUndo")
-
-
-def guiDeckOverview(name: str) -> bool:
-    """Opens the *Deck Overview* dialog for the deck with the given name; returns `True`
+    """,
+    'guiDeckOverview': """Opens the *Deck Overview* dialog for the deck with the given name; returns `True`
     if succeeded or `False` otherwise.
 
     Example::
         >>> guiDeckOverview("Default")
         True
-    """
-    return invoke("guiDeckOverview", name=name)
-
-
-def guiDeckBrowser() -> None:
-    """Opens the *Deck Browser* dialog.
+    """,
+    'guiDeckBrowser': """Opens the *Deck Browser* dialog.
 
     Example::
         >>> guiDeckBrowser()
-    """
-    return invoke("guiDeckBrowser")
-
-
-def guiDeckReview(name: str) -> bool:
-    """Starts review for the deck with the given name; returns `True` if succeeded or
+    """,
+    'guiDeckReview': """Starts review for the deck with the given name; returns `True` if succeeded or
     `False` otherwise.
 
     Example::
         >>> guiDeckReview("Default")
         True
-    """
-    return invoke("guiDeckReview", name=name)
-
-
-def guiImportFile(path: str) -> None:
-    """Invokes the *Import... (Ctrl+Shift+I)* dialog with an optional file path. Brings up
+    """,
+    'guiImportFile': """Invokes the *Import... (Ctrl+Shift+I)* dialog with an optional file path. Brings up
     the dialog for user to review the import. Supports all file types that Anki supports.
     Brings open file dialog if no path is provided. Forward slashes must be used in the
     path on Windows. Only supported for Anki 2.1.52+.
 
     Example::
         >>> guiImportFile("C:/Users/Desktop/cards.txt")
-    """
-    return invoke("guiImportFile", path=path)
-
-
-def guiExitAnki() -> None:
-    """Schedules a request to gracefully close Anki. This operation is asynchronous, so it
+    """,
+    'guiExitAnki': """Schedules a request to gracefully close Anki. This operation is asynchronous, so it
     will return immediately and won't wait until the Anki process actually terminates.
 
     Example::
         >>> guiExitAnki()
-    """
-    return invoke("guiExitAnki")
-
-
-def guiCheckDatabase() -> bool:
-    """Requests a database check, but returns immediately without waiting for the check to
+    """,
+    'guiCheckDatabase': """Requests a database check, but returns immediately without waiting for the check to
     complete. Therefore, the action will always return `True` even if errors are detected
     during the database check.
 
     Example::
         >>> guiCheckDatabase()
         True
-    """
-    return invoke("guiCheckDatabase")
-
-# Media Actions
-
-
-def storeMediaFile(
-    filename: str,
-    *,
-    data: str = None,
-    path: str = None,
-    url: str = None,
-    deleteExisting: bool = True
-) -> str:
-    """Stores a file with the specified base64-encoded contents inside the media folder.
+    """,
+    'storeMediaFile': """Stores a file with the specified base64-encoded contents inside the media folder.
     Alternatively you can specify a absolute file path, or a url from where the file shell
     be downloaded. If more than one of `data`, `path` and `url` are provided, the `data`
     field will be used first, then `path`, and finally `url`. To prevent Anki from
@@ -758,77 +535,33 @@ def storeMediaFile(
 
         >>> storeMediaFile("_hello.txt", url="https://url.to.file")
         "_hello.txt"
-    """
-    if data is not None:
-        return invoke(
-            "storeMediaFile",
-            filename=filename,
-            data=data,
-            deleteExisting=deleteExisting,
-        )
-    elif path is not None:
-        return invoke(
-            "storeMediaFile",
-            filename=filename,
-            path=str(path),
-            deleteExisting=deleteExisting,
-        )
-    elif url is not None:
-        return invoke(
-            "storeMediaFile",
-            filename=filename,
-            url=url,
-            deleteExisting=deleteExisting,
-        )
-    else:
-        raise Exception("one argument of data, path or url must be supplied")
-
-
-def retrieveMediaFile(filename: str) -> str:
-    """Retrieves the base64-encoded contents of the specified file, returning `False` if
+    """,
+    'retrieveMediaFile': """Retrieves the base64-encoded contents of the specified file, returning `False` if
     the file does not exist.
 
     Example::
         >>> retrieveMediaFile("_hello.txt")
         "SGVsbG8sIHdvcmxkIQ=="
-    """
-    return invoke("retrieveMediaFile", filename=filename)
-
-
-def getMediaFilesNames(pattern: str) -> list:
-    """Gets the names of media files matched the pattern. Returning all names by default.
+    """,
+    'getMediaFilesNames': """Gets the names of media files matched the pattern. Returning all names by default.
 
     Example::
         >>> getMediaFilesNames("_hell*.txt")
         ["_hello.txt"]
-    """
-    return invoke("getMediaFilesNames", pattern=pattern)
-
-
-def getMediaDirPath() -> str:
-    """Gets the full path to the `collection.media` folder of the currently opened
+    """,
+    'getMediaDirPath': """Gets the full path to the `collection.media` folder of the currently opened
     profile.
 
     Example::
         >>> getMediaDirPath()
         "/home/user/.local/share/Anki2/Main/collection.media"
-    """
-    return invoke("getMediaDirPath")
-
-
-def deleteMediaFile(filename: str) -> None:
-    """Deletes the specified file inside the media folder.
+    """,
+    'deleteMediaFile': """Deletes the specified file inside the media folder.
 
     Example::
         >>> deleteMediaFile("_hello.txt")
-    """
-    return invoke("deleteMediaFile", filename=filename)
-
-# Miscellaneous Actions
-
-
-def requestPermission() -> dict:
-    """Requests permission to use the API exposed by this plugin. This method does not
+    """,
+    'requestPermission': """Requests permission to use the API exposed by this plugin. This method does not
     require the API key, and is the only one that accepts requests from any origin; the
     other methods only accept requests from trusted origins, which are listed under
     `webCorsOriginList` in the add-on config. `localhost` is trusted by default.
@@ -844,31 +577,24 @@ def requestPermission() -> dict:
     origin is trusted, the fields `requireApiKey` (`True` if required) and `version` will
     also be returned.
 
-    This should be the first call you make to make sure that your application and Anki-
-    Connect are able to communicate properly with each other. New versions of Anki-Connect
-    are backwards compatible; as long as you are using actions which are available in the
-    reported Anki-Connect version or earlier, everything should work fine.
+    This should be the first call you make to make sure that your application and
+    Anki-Connect are able to communicate properly with each other. New versions of
+    Anki-Connect are backwards compatible; as long as you are using actions which are
+    available in the reported Anki-Connect version or earlier, everything should work
+    fine.
 
     Example::
         >>> requestPermission()
         {"permission": "granted", "requireApiKey": False, "version": 6}
-    """
-    return invoke("requestPermission")
-
-
-def version() -> int:
-    """Gets the version of the API exposed by this plugin. Currently versions `1` through
+    """,
+    'version': """Gets the version of the API exposed by this plugin. Currently versions `1` through
     `6` are defined.
 
     Example::
         >>> version()
         6
-    """
-    return invoke("version")
-
-
-def apiReflect(scopes: list, actions: list) -> dict:
-    """Gets information about the AnkiConnect APIs available. The request supports the
+    """,
+    'apiReflect': """Gets information about the AnkiConnect APIs available. The request supports the
     following params:
 
     * `scopes` - An array of scopes to get reflection information about. The only
@@ -884,41 +610,25 @@ def apiReflect(scopes: list, actions: list) -> dict:
     Example::
         >>> apiReflect(["actions", "invalidType"], ["apiReflect", "invalidMethod"])
         {"scopes": ["actions"], "actions": ["apiReflect"]}
-    """
-    return invoke("apiReflect", scopes=scopes, actions=actions)
-
-
-def sync() -> None:
-    """Synchronizes the local Anki collections with AnkiWeb.
+    """,
+    'sync': """Synchronizes the local Anki collections with AnkiWeb.
 
     Example::
         >>> sync()
-    """
-    return invoke("sync")
-
-
-def getProfiles() -> list:
-    """Retrieve the list of profiles.
+    """,
+    'getProfiles': """Retrieve the list of profiles.
 
     Example::
         >>> getProfiles()
         ["User 1"]
-    """
-    return invoke("getProfiles")
-
-
-def loadProfile(name: str) -> bool:
-    """Selects the profile specified in request.
+    """,
+    'loadProfile': """Selects the profile specified in request.
 
     Example::
         >>> loadProfile("user1")
         True
-    """
-    return invoke("loadProfile", name=name)
-
-
-def multi(actions: list) -> list:
-    """Performs multiple actions in one request, returning an array with the response of
+    """,
+    'multi': """Performs multiple actions in one request, returning an array with the response of
     each action (in the given order).
 
     Example::
@@ -940,59 +650,35 @@ def multi(actions: list) -> list:
             {"result": None, "error": "unsupported action"},
             {"result": None, "error": "unsupported action"},
         ]
-    """
-    return invoke("multi", actions=actions)
-
-
-def exportPackage(deck: str, path: str, includeSched: bool) -> bool:
-    """Exports a given deck in `.apkg` format. Returns `True` if successful or `False`
+    """,
+    'exportPackage': """Exports a given deck in `.apkg` format. Returns `True` if successful or `False`
     otherwise. The optional property `includeSched` (default is `False`) can be specified
     to include the cards' scheduling data.
 
     Example::
         >>> exportPackage("Default", "/data/Deck.apkg", True)
         True
-    """
-    return invoke(
-        "exportPackage", deck=deck, path=path, includeSched=includeSched
-    )
-
-
-def importPackage(path: str) -> bool:
-    """Imports a file in `.apkg` format into the collection. Returns `True` if successful
+    """,
+    'importPackage': """Imports a file in `.apkg` format into the collection. Returns `True` if successful
     or `False` otherwise. Note that the file path is relative to Anki's collection.media
     folder, not to the client.
 
     Example::
         >>> importPackage("/data/Deck.apkg")
         True
-    """
-    return invoke("importPackage", path=path)
-
-
-def reloadCollection() -> None:
-    """Tells anki to reload all data from the database.
+    """,
+    'reloadCollection': """Tells anki to reload all data from the database.
 
     Example::
         >>> reloadCollection()
-    """
-    return invoke("reloadCollection")
-
-# Model Actions
-
-
-def modelNames() -> list:
-    """Gets the complete list of model names for the current user.
+    """,
+    'modelNames': """Gets the complete list of model names for the current user.
 
     Example::
         >>> modelNames()
         ["Basic", "Basic (and reversed card)"]
-    """
-    return invoke("modelNames")
-
-
-def modelNamesAndIds() -> dict:
-    """Gets the complete list of model names and their corresponding IDs for the current
+    """,
+    'modelNamesAndIds': """Gets the complete list of model names and their corresponding IDs for the current
     user.
 
     Example::
@@ -1003,12 +689,8 @@ def modelNamesAndIds() -> dict:
             "Basic (optional reversed card)": 1483883011631,
             "Cloze": 1483883011630,
         }
-    """
-    return invoke("modelNamesAndIds")
-
-
-def findModelsById(modelIds: list) -> list:
-    r"""Gets a list of models  for the provided model IDs from the current user.
+    """,
+    'findModelsById': r"""Gets a list of models  for the provided model IDs from the current user.
 
     Example::
         >>> findModelsById([1704387367119, 1704387398570])
@@ -1148,12 +830,8 @@ def findModelsById(modelIds: list) -> list:
                 "originalStockKind": 1,
             },
         ]
-    """  # noqa: E501
-    return invoke("findModelsById", modelIds=modelIds)
-
-
-def findModelsByName(modelNames: list) -> list:
-    r"""Gets a list of models for the provided model names from the current user.
+    """,  # noqa: E501
+    'findModelsByName': r"""Gets a list of models for the provided model names from the current user.
 
     Example::
         >>> findModelsByName(["Basic", "Basic (and reversed card)"])
@@ -1293,61 +971,35 @@ def findModelsByName(modelNames: list) -> list:
                 "originalStockKind": 1,
             },
         ]
-    """  # noqa: E501
-    return invoke("findModelsByName", modelNames=modelNames)
-
-
-def modelFieldNames(modelName: str) -> list:
-    """Gets the complete list of field names for the provided model name.
+    """,  # noqa: E501
+    'modelFieldNames': """Gets the complete list of field names for the provided model name.
 
     Example::
         >>> modelFieldNames("Basic")
         ["Front", "Back"]
-    """
-    return invoke("modelFieldNames", modelName=modelName)
-
-
-def modelFieldDescriptions(modelName: str) -> list:
-    """Gets the complete list of field descriptions (the text seen in the gui editor when
+    """,
+    'modelFieldDescriptions': """Gets the complete list of field descriptions (the text seen in the gui editor when
     a field is empty) for the provided model name.
 
     Example::
         >>> modelFieldDescriptions("Basic")
         ["", ""]
-    """
-    return invoke("modelFieldDescriptions", modelName=modelName)
-
-
-def modelFieldFonts(modelName: str) -> dict:
-    """Gets the complete list of fonts along with their font sizes.
+    """,
+    'modelFieldFonts': """Gets the complete list of fonts along with their font sizes.
 
     Example::
         >>> modelFieldFonts("Basic")
         {"Front": {"font": "Arial", "size": 20}, "Back": {"font": "Arial", "size": 20}}
-    """
-    return invoke("modelFieldFonts", modelName=modelName)
-
-
-def modelFieldsOnTemplates(modelName: str) -> dict:
-    """Returns an object indicating the fields on the question and answer side of each
+    """,
+    'modelFieldsOnTemplates': """Returns an object indicating the fields on the question and answer side of each
     card template for the given model name. The question side is given first in each
     array.
 
     Example::
         >>> modelFieldsOnTemplates("Basic (and reversed card)")
         {"Card 1": [["Front"], ["Back"]], "Card 2": [["Back"], ["Front"]]}
-    """
-    return invoke("modelFieldsOnTemplates", modelName=modelName)
-
-
-def createModel(
-    modelName: str,
-    inOrderFields: list,
-    css: str,
-    isCloze: bool,
-    cardTemplates: list,
-) -> dict:
-    r"""Creates a new model to be used in Anki. User must provide the `modelName`,
+    """,
+    'createModel': r"""Creates a new model to be used in Anki. User must provide the `modelName`,
     `inOrderFields` and `cardTemplates` to be used in the model. There are optional fields
     `css` and `isCloze`. If not specified, `css` will use the default Anki css and
     `isCloze` will be equal to `False`. If `isCloze` is `True` then model will be created
@@ -1416,19 +1068,8 @@ def createModel(
             "id": 1551462107104,
             "req": [[0, "none", []]],
         }
-    """  # noqa: E501
-    return invoke(
-        "createModel",
-        modelName=modelName,
-        inOrderFields=inOrderFields,
-        css=css,
-        isCloze=isCloze,
-        cardTemplates=cardTemplates,
-    )
-
-
-def modelTemplates(modelName: str) -> dict:
-    r"""Returns an object indicating the template content for each card connected to the
+    """,  # noqa: E501
+    'modelTemplates': r"""Returns an object indicating the template content for each card connected to the
     provided model by name.
 
     Example::
@@ -1443,24 +1084,16 @@ def modelTemplates(modelName: str) -> dict:
                 "Back": "{{FrontSide}}\n\n<hr id=answer>\n\n{{Front}}",
             },
         }
-    """
-    return invoke("modelTemplates", modelName=modelName)
-
-
-def modelStyling(modelName: str) -> dict:
-    r"""Gets the CSS styling for the provided model by name.
+    """,
+    'modelStyling': r"""Gets the CSS styling for the provided model by name.
 
     Example::
         >>> modelStyling("Basic (and reversed card)")
         {
             "css": ".card {\n font-family: arial;\n font-size: 20px;\n text-align: center;\n color: black;\n background-color: white;\n}\n"
         }
-    """  # noqa: E501
-    return invoke("modelStyling", modelName=modelName)
-
-
-def updateModelTemplates(model: dict) -> None:
-    """Modify the templates of an existing model by name. Only specifies cards and
+    """,  # noqa: E501
+    'updateModelTemplates': """Modify the templates of an existing model by name. Only specifies cards and
     specified sides will be modified. If an existing card or side is not included in the
     request, it will be left unchanged.
 
@@ -1473,21 +1106,13 @@ def updateModelTemplates(model: dict) -> None:
         ...         },
         ...     }
         ... )
-    """
-    return invoke("updateModelTemplates", model=model)
-
-
-def updateModelStyling(model: dict) -> None:
-    """Modify the CSS styling of an existing model by name.
+    """,
+    'updateModelStyling': """Modify the CSS styling of an existing model by name.
 
     Example::
         >>> updateModelStyling({"name": "Custom", "css": "p { color: blue; }"})
-    """
-    return invoke("updateModelStyling", model=model)
-
-
-def findAndReplaceInModels(model: dict) -> int:
-    """Find and replace string in existing model by model name. Customise to replace in
+    """,
+    'findAndReplaceInModels': """Find and replace string in existing model by model name. Customise to replace in
     front, back or css by setting to true/false.
 
     Example::
@@ -1502,47 +1127,21 @@ def findAndReplaceInModels(model: dict) -> int:
         ...     }
         ... )
         1
-    """
-    return invoke("findAndReplaceInModels", model=model)
-
-
-def modelTemplateRename(
-    modelName: str, oldTemplateName: str, newTemplateName: str
-) -> None:
-    """Renames a template in an existing model.
+    """,
+    'modelTemplateRename': """Renames a template in an existing model.
 
     Example::
         >>> modelTemplateRename("Basic", "Card 1", "Card 1 renamed")
-    """
-    return invoke(
-        "modelTemplateRename",
-        modelName=modelName,
-        oldTemplateName=oldTemplateName,
-        newTemplateName=newTemplateName,
-    )
-
-
-def modelTemplateReposition(
-    modelName: str, templateName: str, index: int
-) -> None:
-    """Repositions a template in an existing model.
+    """,
+    'modelTemplateReposition': """Repositions a template in an existing model.
 
     The value of `index` starts at 0. For example, an index of `0` puts the template in
     the first position, and an index of `2` puts the template in the third position.
 
     Example::
         >>> modelTemplateReposition("Basic", "Card 1", 1)
-    """
-    return invoke(
-        "modelTemplateReposition",
-        modelName=modelName,
-        templateName=templateName,
-        index=index,
-    )
-
-
-def modelTemplateAdd(modelName: str, template: dict) -> None:
-    """Adds a template to an existing model by name. If you want to update an existing
+    """,
+    'modelTemplateAdd': """Adds a template to an existing model by name. If you want to update an existing
     template, use `updateModelTemplates`.
 
     Example::
@@ -1554,56 +1153,26 @@ def modelTemplateAdd(modelName: str, template: dict) -> None:
         ...         "Back": "Back html {{Field2}}",
         ...     },
         ... )
-    """
-    return invoke("modelTemplateAdd", modelName=modelName, template=template)
-
-
-def modelTemplateRemove(modelName: str, templateName: str) -> None:
-    """Removes a template from an existing model.
+    """,
+    'modelTemplateRemove': """Removes a template from an existing model.
 
     Example::
         >>> modelTemplateRemove("Basic", "Card 1")
-    """
-    return invoke(
-        "modelTemplateRemove", modelName=modelName, templateName=templateName
-    )
-
-
-def modelFieldRename(
-    modelName: str, oldFieldName: str, newFieldName: str
-) -> None:
-    """Rename the field name of a given model.
+    """,
+    'modelFieldRename': """Rename the field name of a given model.
 
     Example::
         >>> modelFieldRename("Basic", "Front", "FrontRenamed")
-    """
-    return invoke(
-        "modelFieldRename",
-        modelName=modelName,
-        oldFieldName=oldFieldName,
-        newFieldName=newFieldName,
-    )
-
-
-def modelFieldReposition(modelName: str, fieldName: str, index: int) -> None:
-    """Reposition the field within the field list of a given model.
+    """,
+    'modelFieldReposition': """Reposition the field within the field list of a given model.
 
     The value of `index` starts at 0. For example, an index of `0` puts the field in the
     first position, and an index of `2` puts the field in the third position.
 
     Example::
         >>> modelFieldReposition("Basic", "Back", 0)
-    """
-    return invoke(
-        "modelFieldReposition",
-        modelName=modelName,
-        fieldName=fieldName,
-        index=index,
-    )
-
-
-def modelFieldAdd(modelName: str, fieldName: str, index: int) -> None:
-    """Creates a new field within a given model.
+    """,
+    'modelFieldAdd': """Creates a new field within a given model.
 
     Optionally, the `index` value can be provided, which works exactly the same as the
     index in `modelFieldReposition`. By default, the field is added to the end of the
@@ -1611,52 +1180,23 @@ def modelFieldAdd(modelName: str, fieldName: str, index: int) -> None:
 
     Example::
         >>> modelFieldAdd("Basic", "NewField", 0)
-    """
-    return invoke(
-        "modelFieldAdd", modelName=modelName, fieldName=fieldName, index=index
-    )
-
-
-def modelFieldRemove(modelName: str, fieldName: str) -> None:
-    """Deletes a field within a given model.
+    """,
+    'modelFieldRemove': """Deletes a field within a given model.
 
     Example::
         >>> modelFieldRemove("Basic", "Front")
-    """
-    return invoke("modelFieldRemove", modelName=modelName, fieldName=fieldName)
-
-
-def modelFieldSetFont(modelName: str, fieldName: str, font: str) -> None:
-    """Sets the font for a field within a given model.
+    """,
+    'modelFieldSetFont': """Sets the font for a field within a given model.
 
     Example::
         >>> modelFieldSetFont("Basic", "Front", "Courier")
-    """
-    return invoke(
-        "modelFieldSetFont", modelName=modelName, fieldName=fieldName, font=font
-    )
-
-
-def modelFieldSetFontSize(
-    modelName: str, fieldName: str, fontSize: int
-) -> None:
-    """Sets the font size for a field within a given model.
+    """,
+    'modelFieldSetFontSize': """Sets the font size for a field within a given model.
 
     Example::
         >>> modelFieldSetFontSize("Basic", "Front", 10)
-    """
-    return invoke(
-        "modelFieldSetFontSize",
-        modelName=modelName,
-        fieldName=fieldName,
-        fontSize=fontSize,
-    )
-
-
-def modelFieldSetDescription(
-    modelName: str, fieldName: str, description: str
-) -> bool:
-    """Sets the description (the text seen in the gui editor when a field is empty) for a
+    """,
+    'modelFieldSetDescription': """Sets the description (the text seen in the gui editor when a field is empty) for a
     field within a given model.
 
     Older versions of Anki (2.1.49 and below) do not have field descriptions. In that
@@ -1665,19 +1205,8 @@ def modelFieldSetDescription(
     Example::
         >>> modelFieldSetDescription("Basic", "Front", "example field description")
         True
-    """
-    return invoke(
-        "modelFieldSetDescription",
-        modelName=modelName,
-        fieldName=fieldName,
-        description=description,
-    )
-
-# Note Actions
-
-
-def addNote(note: dict) -> int:
-    """Creates a note using the given deck and model, with the provided field values and
+    """,
+    'addNote': """Creates a note using the given deck and model, with the provided field values and
     tags. Returns the identifier of the created note created on success, and `None` on
     failure.
 
@@ -1750,12 +1279,8 @@ def addNote(note: dict) -> int:
         ...     }
         ... )
         1496198395707
-    """  # noqa: E501
-    return invoke("addNote", note=note)
-
-
-def addNotes(notes: list) -> list:
-    """Creates multiple notes using the given deck and model, with the provided field
+    """,  # noqa: E501
+    'addNotes': """Creates multiple notes using the given deck and model, with the provided field
     values and tags. Returns an array of identifiers of the created notes (notes that
     could not be created will have a `None` identifier). Please see the documentation for
     `addNote` for an explanation of objects in the `notes` array.
@@ -1796,12 +1321,8 @@ def addNotes(notes: list) -> list:
         ...     ]
         ... )
         [1496198395707, None]
-    """  # noqa: E501
-    return invoke("addNotes", notes=notes)
-
-
-def canAddNotes(notes: list) -> list:
-    """Accepts an array of objects which define parameters for candidate notes (see
+    """,  # noqa: E501
+    'canAddNotes': """Accepts an array of objects which define parameters for candidate notes (see
     `addNote`) and returns an array of booleans indicating whether or not the parameters
     at the corresponding index could be used to create a new note.
 
@@ -1817,12 +1338,8 @@ def canAddNotes(notes: list) -> list:
         ...     ]
         ... )
         [True]
-    """
-    return invoke("canAddNotes", notes=notes)
-
-
-def canAddNotesWithErrorDetail(notes: list) -> list:
-    """Accepts an array of objects which define parameters for candidate notes (see
+    """,
+    'canAddNotesWithErrorDetail': """Accepts an array of objects which define parameters for candidate notes (see
     `addNote`) and returns an array of objects with fields `canAdd` and `error`.
 
     * `canAdd` indicates whether or not the parameters at the corresponding index could be
@@ -1850,12 +1367,8 @@ def canAddNotesWithErrorDetail(notes: list) -> list:
             {"canAdd": False, "error": "cannot create note because it is a duplicate"},
             {"canAdd": True},
         ]
-    """
-    return invoke("canAddNotesWithErrorDetail", notes=notes)
-
-
-def updateNoteFields(note: dict) -> None:
-    """Modify the fields of an existing note. You can also include audio, video, or
+    """,
+    'updateNoteFields': """Modify the fields of an existing note. You can also include audio, video, or
     picture files which will be added to the note with an optional `audio`, `video`, or
     `picture` property. Please see the documentation for `addNote` for an explanation of
     objects in the `audio`, `video`, or `picture` array.
@@ -1879,12 +1392,8 @@ def updateNoteFields(note: dict) -> None:
         ...         ],
         ...     }
         ... )
-    """  # noqa: E501
-    return invoke("updateNoteFields", note=note)
-
-
-def updateNote(note: dict) -> None:
-    """Modify the fields and/or tags of an existing note. In other words, combines
+    """,  # noqa: E501
+    'updateNote': """Modify the fields and/or tags of an existing note. In other words, combines
     `updateNoteFields` and `updateNoteTags`. Please see their documentation for an
     explanation of all properties.
 
@@ -1909,110 +1418,59 @@ def updateNote(note: dict) -> None:
         ...         "tags": ["new", "tags"],
         ...     }
         ... )
-    """
-    return invoke("updateNote", note=note)
-
-
-def updateNoteTags(note: int, tags: list) -> None:
-    """Set a note's tags by note ID. Old tags will be removed.
+    """,
+    'updateNoteTags': """Set a note's tags by note ID. Old tags will be removed.
 
     Example::
         >>> updateNoteTags(1483959289817, ["european-languages"])
-    """
-    return invoke("updateNoteTags", note=note, tags=tags)
-
-
-def getNoteTags(note: int) -> list:
-    """Get a note's tags by note ID.
+    """,
+    'getNoteTags': """Get a note's tags by note ID.
 
     Example::
         >>> getNoteTags(1483959289817)
         ["european-languages"]
-    """
-    return invoke("getNoteTags", note=note)
-
-
-def addTags(notes: list, tags: str) -> None:
-    """Adds tags to notes by note ID.
+    """,
+    'addTags': """Adds tags to notes by note ID.
 
     Example::
         >>> addTags([1483959289817, 1483959291695], "european-languages")
-    """
-    return invoke("addTags", notes=notes, tags=tags)
-
-
-def removeTags(notes: list, tags: str) -> None:
-    """Remove tags from notes by note ID.
+    """,
+    'removeTags': """Remove tags from notes by note ID.
 
     Example::
         >>> removeTags([1483959289817, 1483959291695], "european-languages")
-    """
-    return invoke("removeTags", notes=notes, tags=tags)
-
-
-def getTags() -> list:
-    """Gets the complete list of tags for the current user.
+    """,
+    'getTags': """Gets the complete list of tags for the current user.
 
     Example::
         >>> getTags()
         ["european-languages", "idioms"]
-    """
-    return invoke("getTags")
-
-
-def clearUnusedTags() -> None:
-    """Clears all the unused tags in the notes for the current user.
+    """,
+    'clearUnusedTags': """Clears all the unused tags in the notes for the current user.
 
     Example::
         >>> clearUnusedTags()
-    """
-    return invoke("clearUnusedTags")
-
-
-def replaceTags(
-    notes: list, tag_to_replace: str, replace_with_tag: str
-) -> None:
-    """Replace tags in notes by note ID.
+    """,
+    'replaceTags': """Replace tags in notes by note ID.
 
     Example::
         >>> replaceTags(
         ...     [1483959289817, 1483959291695], "european-languages", "french-languages"
         ... )
-    """
-    return invoke(
-        "replaceTags",
-        notes=notes,
-        tag_to_replace=tag_to_replace,
-        replace_with_tag=replace_with_tag,
-    )
-
-
-def replaceTagsInAllNotes(tag_to_replace: str, replace_with_tag: str) -> None:
-    """Replace tags in all the notes for the current user.
+    """,
+    'replaceTagsInAllNotes': """Replace tags in all the notes for the current user.
 
     Example::
         >>> replaceTagsInAllNotes("european-languages", "french-languages")
-    """
-    return invoke(
-        "replaceTagsInAllNotes",
-        tag_to_replace=tag_to_replace,
-        replace_with_tag=replace_with_tag,
-    )
-
-
-def findNotes(query: str) -> list:
-    """Returns an array of note IDs for a given query. Query syntax is [documented
+    """,
+    'findNotes': """Returns an array of note IDs for a given query. Query syntax is [documented
     here](https://docs.ankiweb.net/searching.html).
 
     Example::
         >>> findNotes("deck:current")
         [1483959289817, 1483959291695]
-    """
-    return invoke("findNotes", query=query)
-
-
-def notesInfo(notes: list) -> list:
-    """Returns a list of objects containing for each note ID the note fields, tags, note
+    """,
+    'notesInfo': """Returns a list of objects containing for each note ID the note fields, tags, note
     type and the cards belonging to the note.
 
     Example::
@@ -2028,64 +1486,38 @@ def notesInfo(notes: list) -> list:
                 },
             }
         ]
-    """
-    return invoke("notesInfo", notes=notes)
-
-
-def deleteNotes(notes: list) -> None:
-    """Deletes notes with the given ids. If a note has several cards associated with it,
+    """,
+    'deleteNotes': """Deletes notes with the given ids. If a note has several cards associated with it,
     all associated cards will be deleted.
 
     Example::
         >>> deleteNotes([1502298033753])
-    """
-    return invoke("deleteNotes", notes=notes)
-
-
-def removeEmptyNotes() -> None:
-    """Removes all the empty notes for the current user.
+    """,
+    'removeEmptyNotes': """Removes all the empty notes for the current user.
 
     Example::
         >>> removeEmptyNotes()
-    """
-    return invoke("removeEmptyNotes")
-
-# Statistic Actions
-
-
-def getNumCardsReviewedToday() -> int:
-    """Gets the count of cards that have been reviewed in the current day (with day start
+    """,
+    'getNumCardsReviewedToday': """Gets the count of cards that have been reviewed in the current day (with day start
     time as configured by user in anki)
 
     Example::
         >>> getNumCardsReviewedToday()
         0
-    """
-    return invoke("getNumCardsReviewedToday")
-
-
-def getNumCardsReviewedByDay() -> list:
-    """Gets the number of cards reviewed as a list of pairs of `(dateString, number)`
+    """,
+    'getNumCardsReviewedByDay': """Gets the number of cards reviewed as a list of pairs of `(dateString, number)`
 
     Example::
         >>> getNumCardsReviewedByDay()
         [["2021-02-28", 124], ["2021-02-27", 261]]
-    """
-    return invoke("getNumCardsReviewedByDay")
-
-
-def getCollectionStatsHTML(wholeCollection: bool) -> str:
-    """Gets the collection statistics report
+    """,
+    'getCollectionStatsHTML': """Gets the collection statistics report
 
     Example::
         >>> getCollectionStatsHTML(True)
         "<center> lots of HTML here </center>"
-    """
-    return invoke("getCollectionStatsHTML", wholeCollection=wholeCollection)
-
-
-def cardReviews(deck: str, startID: int) -> list:
-    """Requests all card reviews for a specified deck after a certain time. `startID` is
+    """,
+    'cardReviews': """Requests all card reviews for a specified deck after a certain time. `startID` is
     the latest unix time not included in the result. Returns a list of 9-tuples
     `(reviewTime, cardID, usn, buttonPressed, newInterval, previousInterval, newFactor,
     reviewDuration, reviewType)`
@@ -2096,12 +1528,8 @@ def cardReviews(deck: str, startID: int) -> list:
             [1594194095746, 1485369733217, -1, 3, 4, -60, 2500, 6157, 0],
             [1594201393292, 1485369902086, -1, 1, -60, -60, 0, 4846, 0],
         ]
-    """
-    return invoke("cardReviews", deck=deck, startID=startID)
-
-
-def getReviewsOfCards(cards: list) -> dict:
-    """Requests all card reviews for each card ID. Returns a dictionary mapping each card
+    """,
+    'getReviewsOfCards': """Requests all card reviews for each card ID. Returns a dictionary mapping each card
     ID to a list of dictionaries of the format:
     ```
     {
@@ -2144,23 +1572,15 @@ def getReviewsOfCards(cards: list) -> dict:
                 },
             ]
         }
-    """
-    return invoke("getReviewsOfCards", cards=cards)
-
-
-def getLatestReviewID(deck: str) -> int:
-    """Returns the unix time of the latest review for the given deck. 0 if no review has
+    """,
+    'getLatestReviewID': """Returns the unix time of the latest review for the given deck. 0 if no review has
     ever been made for the deck.
 
     Example::
         >>> getLatestReviewID("default")
         1594194095746
-    """
-    return invoke("getLatestReviewID", deck=deck)
-
-
-def insertReviews(reviews: list) -> None:
-    """Inserts the given reviews into the database. Required format: list of 9-tuples
+    """,
+    'insertReviews': """Inserts the given reviews into the database. Required format: list of 9-tuples
     `(reviewTime, cardID, usn, buttonPressed, newInterval, previousInterval, newFactor,
     reviewDuration, reviewType)`
 
@@ -2171,5 +1591,5 @@ def insertReviews(reviews: list) -> None:
         ...         [1594201393292, 1485369902086, -1, 1, -60, -60, 0, 4846, 0],
         ...     ]
         ... )
-    """
-    return invoke("insertReviews", reviews=reviews)
+    """,
+}
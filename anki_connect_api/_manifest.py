@@ -0,0 +1,151 @@
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from ._media import hash_file
+
+
+class MediaManifest:
+    """Index of the size, modification time and SHA-256 of every file in a
+    media folder like the `collection.media` returned by `getMediaDirPath`.
+
+    `scan()` brings the index up to date, hashing only the files which are
+    new or whose size or modification time changed, with up to `workers`
+    threads. If `path` is given, the index is kept in a SQLite database
+    there, so the next process only rescans. Don't put it into the media
+    folder itself.
+
+    The index is held in memory, so looking up the names of a content by
+    its hash takes constant time. A manifest can be shared by threads, like
+    the ones of `MediaUploader`.
+
+    Example::
+        >>> manifest = MediaManifest(client.getMediaDirPath(), "media.sqlite")
+        >>> manifest.scan()
+        {'files': 183204, 'hashed': 12, 'removed': 3, 'seconds': 1.9}
+        >>> manifest.names(hash_file("new-recording.mp3"))
+        {'recording-0815.mp3'}
+    """
+
+    def __init__(self, directory, path=None, workers: int = 4):
+        self.directory = os.fspath(directory)
+        self.workers = workers
+        self._entries = {}
+        self._by_hash = {}
+        self._lock = threading.Lock()
+        self._db = None
+        if path is not None:
+            self._db = sqlite3.connect(
+                path, timeout=30.0, check_same_thread=False
+            )
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS files (name TEXT PRIMARY KEY, '
+                'size INTEGER, mtime INTEGER, hash TEXT)'
+            )
+            for name, size, mtime, hash_ in self._db.execute(
+                'SELECT name, size, mtime, hash FROM files'
+            ):
+                self._add(name, (size, mtime, hash_))
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, name):
+        with self._lock:
+            return name in self._entries
+
+    def hash(self, name: str):
+        """Hash of the file `name` as of the last scan, or `None`."""
+        with self._lock:
+            entry = self._entries.get(name)
+        return None if entry is None else entry[2]
+
+    def names(self, hash_: str) -> set:
+        """Names of the files with the content of hash `hash_`."""
+        with self._lock:
+            return set(self._by_hash.get(hash_, ()))
+
+    def has(self, hash_: str) -> bool:
+        """Whether a file with the content of hash `hash_` exists."""
+        with self._lock:
+            return hash_ in self._by_hash
+
+    def _add(self, name, entry):
+        self._entries[name] = entry
+        self._by_hash.setdefault(entry[2], set()).add(name)
+
+    def _remove(self, name):
+        entry = self._entries.pop(name)
+        names = self._by_hash[entry[2]]
+        names.discard(name)
+        if not names:
+            del self._by_hash[entry[2]]
+
+    def scan(self) -> dict:
+        """Update the index from the media folder and return the number of
+        `files`, how many were `hashed` and `removed` and the `seconds` it
+        took."""
+        start = time.perf_counter()
+        stats = {}
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    stat = entry.stat()
+                    stats[entry.name] = (stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            changed = [
+                name for name, stat in stats.items()
+                if self._entries.get(name, (None, None))[:2] != stat
+            ]
+            removed = [name for name in self._entries if name not in stats]
+
+        def rehash(name):
+            try:
+                return hash_file(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                return None
+
+        with ThreadPoolExecutor(self.workers) as executor:
+            hashes = list(executor.map(rehash, changed))
+        updated = []
+        with self._lock:
+            for name, hash_ in zip(changed, hashes):
+                if name in self._entries:
+                    self._remove(name)
+                if hash_ is None:
+                    # deleted while scanning
+                    removed.append(name)
+                    continue
+                entry = (*stats[name], hash_)
+                self._add(name, entry)
+                updated.append((name, *entry))
+            for name in removed:
+                if name in self._entries:
+                    self._remove(name)
+            if self._db is not None:
+                with self._db:
+                    self._db.executemany(
+                        'DELETE FROM files WHERE name = ?',
+                        [(name,) for name in removed],
+                    )
+                    self._db.executemany(
+                        'INSERT OR REPLACE INTO files '
+                        '(name, size, mtime, hash) VALUES (?, ?, ?, ?)',
+                        updated,
+                    )
+            files = len(self._entries)
+        return {
+            'files': files,
+            'hashed': len(changed),
+            'removed': len(removed),
+            'seconds': time.perf_counter() - start,
+        }
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
@@ -0,0 +1,225 @@
+import base64
+import hashlib
+import json
+import mmap
+import os
+import uuid
+
+from ._protocol import encode_request
+from ._streaming import _Reader, check_fields
+
+# a multiple of 3, so the chunks can be encoded separately
+CHUNK_SIZE = 3 * 2**18
+
+# bytes read from the response at a time when decoding a file
+READ_SIZE = 2**20
+
+# files at least this large are hashed through a memory map instead of
+# being read into memory
+MMAP_SIZE = 2**20
+
+
+def hash_file(path) -> str:
+    """SHA-256 hex digest of the contents of the file at `path`."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < MMAP_SIZE:
+            return hashlib.sha256(f.read()).hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return hashlib.sha256(data).hexdigest()
+
+
+def probe_media_dir(media_dir):
+    """Check whether `media_dir`, the path of Anki's media folder returned
+    by `getMediaDirPath`, is that folder on this host too, and not e.g. a
+    folder of the same name on another host or outside of Anki's container.
+    A probe file is stored in Anki, looked for in `media_dir` and deleted
+    again.
+
+    Like the `handle()` of a cache, this is a generator yielding the
+    (action, params) to send and returning the answer, see `run()`.
+    """
+    if not media_dir or not os.path.isdir(media_dir):
+        return False
+    token = uuid.uuid4().hex
+    name = yield 'storeMediaFile', {
+        'filename': f'_anki_connect_api_probe_{token}.txt',
+        'data': base64.b64encode(token.encode('ascii')).decode('ascii'),
+    }
+    try:
+        with open(os.path.join(media_dir, name), 'rb') as f:
+            return f.read() == token.encode('ascii')
+    except OSError:
+        return False
+    finally:
+        yield 'deleteMediaFile', {'filename': name}
+
+
+class Base64Body:
+    """Body of the request for `action` with `params`, in which the param
+    `field` is the base64-encoded contents of `source`, a path or a binary
+    file object. The contents are read and encoded one chunk at a time
+    while the body is sent, so memory use doesn't depend on their size.
+
+    Transports send the body by iterating over it, `len()` is its size in
+    bytes. It can be iterated again to resend it, which needs a seekable
+    `source`.
+    """
+
+    def __init__(
+        self,
+        action: str,
+        params: dict,
+        field: str,
+        source,
+        key: str = None,
+        codec=None,
+        chunk_size: int = CHUNK_SIZE
+    ):
+        if chunk_size % 3:
+            raise ValueError('chunk_size must be a multiple of 3')
+        self.chunk_size = chunk_size
+        marker = uuid.uuid4().hex
+        body = encode_request(action, {**params, field: marker}, key, codec)
+        head, tail = body.split(marker.encode('ascii'))
+        self._head = head
+        self._tail = tail
+        if isinstance(source, (str, bytes, os.PathLike)):
+            self._file = open(source, 'rb')
+            self._owned = True
+        else:
+            self._file = source
+            self._owned = False
+        self._start = self._file.tell()
+        self.size = self._file.seek(0, os.SEEK_END) - self._start
+        self._file.seek(self._start)
+
+    def __len__(self):
+        encoded = (self.size + 2) // 3 * 4
+        return len(self._head) + encoded + len(self._tail)
+
+    def __iter__(self):
+        self._file.seek(self._start)
+        yield self._head
+        remaining = self.size
+        while remaining:
+            chunk = self._read(min(self.chunk_size, remaining))
+            remaining -= len(chunk)
+            yield base64.b64encode(chunk)
+        yield self._tail
+
+    def _read(self, size):
+        chunk = self._file.read(size)
+        while 0 < len(chunk) < size:
+            more = self._file.read(size - len(chunk))
+            if not more:
+                break
+            chunk += more
+        if len(chunk) < size:
+            raise Exception('file was truncated while it was sent')
+        return chunk
+
+    def close(self):
+        if self._owned:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class _Target:
+    """Writes to a binary file object, or to a file at a path which is
+    only created once there is something to write and removed again if
+    the download fails."""
+
+    def __init__(self, target):
+        self._target = target
+        self._file = None
+        if not isinstance(target, (str, bytes, os.PathLike)):
+            self._file = target
+        self.size = 0
+
+    def write(self, data):
+        if self._file is None:
+            self._file = open(self._target, 'wb')
+        self._file.write(data)
+        self.size += len(data)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._file is None or self._file is self._target:
+            return
+        self._file.close()
+        if exc_type is not None:
+            os.remove(self._target)
+
+
+def _decode_string(reader, target):
+    # base64 has no characters JSON needs to escape, but some encoders
+    # escape '/' as '\/'
+    pending = ''
+    while True:
+        buf = reader.buf
+        end = buf.find('"', reader.pos)
+        stop = len(buf) if end == -1 else end
+        if end == -1 and buf.endswith('\\'):
+            stop -= 1
+        pending += buf[reader.pos:stop].replace('\\/', '/')
+        usable = len(pending) // 4 * 4
+        if usable:
+            target.write(base64.b64decode(pending[:usable], validate=True))
+            pending = pending[usable:]
+        if end != -1:
+            reader.pos = end + 1
+            break
+        reader.pos = stop
+        if not reader.fill():
+            raise json.JSONDecodeError(
+                'Unterminated string', reader.buf, reader.pos
+            )
+    if pending:
+        target.write(base64.b64decode(pending, validate=True))
+
+
+def write_response(read, target):
+    """Decode the response of `retrieveMediaFile` from the binary
+    `read(size)` function and write the contents of the file to `target`,
+    a path or a binary file object, one chunk at a time.
+
+    Return the number of bytes written, or the result if it isn't a string
+    (`False` if the file doesn't exist).
+    """
+    reader = _Reader(read, READ_SIZE)
+    reader.expect('{')
+    fields = []
+    result = None
+    with _Target(target) as output:
+        if reader.peek() == '}':
+            reader.pos += 1
+        else:
+            while True:
+                key = reader.value()
+                reader.expect(':')
+                fields.append(key)
+                if key == 'result' and reader.peek() == '"':
+                    reader.pos += 1
+                    output.write(b'')
+                    _decode_string(reader, output)
+                    result = output.size
+                else:
+                    value = reader.value()
+                    if key == 'result':
+                        result = value
+                    elif key == 'error' and value is not None:
+                        raise Exception(value)
+                if reader.peek() == ',':
+                    reader.pos += 1
+                else:
+                    reader.expect('}')
+                    break
+        check_fields(fields)
+    return result
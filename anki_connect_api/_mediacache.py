@@ -0,0 +1,304 @@
+import base64
+import contextlib
+import hashlib
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+
+from ._media import _Target, hash_file, probe_media_dir
+
+MEDIA_WRITES = frozenset(('storeMediaFile', 'deleteMediaFile'))
+
+# retrieveMediaFileTo is passed through the caches like an action, with the
+# number of bytes written to `target` as its result
+RETRIEVALS = frozenset(('retrieveMediaFile', 'retrieveMediaFileTo'))
+
+
+def written_media(action: str, params: dict):
+    """Names of the media files changed by a call of `action`."""
+    if action == 'multi':
+        names = set()
+        for sub in params.get('actions', ()):
+            names |= written_media(sub.get('action'), sub.get('params') or {})
+        return names
+    if action in MEDIA_WRITES and params.get('filename'):
+        return {params['filename']}
+    return set()
+
+
+class MediaCache:
+    """Cache for `retrieveMediaFile`, keeping the decoded files in
+    `directory`. Files are stored once per content hash, so files with the
+    same content under different names take the space only once, and the
+    least recently used ones are removed when they take more than
+    `max_bytes` bytes.
+
+    When Anki shares its media folder with this host, which is checked
+    with a probe file like in `MediaUploader`, the folder returned by
+    `getMediaDirPath` is used to check with a `stat` of the original file
+    whether a cached file is still current. Pass `media_dir=False` to not
+    look for it, or the path where the folder is mounted. Otherwise the
+    names of the media files are listed at most every `check_interval`
+    seconds and deleted files are dropped; files replaced in Anki itself
+    under the same name are then only noticed once they are dropped from
+    the cache. Files the client stores or deletes itself are always
+    dropped right away.
+
+    `retrieveMediaFileTo` is served from the cache as well, copying the
+    cached file without encoding it, and files it downloads to a path are
+    added to the cache.
+
+    Example::
+        >>> client = AnkiClient(caches=[MediaCache("media-cache")])
+        >>> client.retrieveMediaFile("_hello.txt")  # fetched from Anki
+        "SGVsbG8sIHdvcmxkIQ=="
+        >>> client.retrieveMediaFile("_hello.txt")  # read from the cache
+        "SGVsbG8sIHdvcmxkIQ=="
+    """
+
+    def __init__(
+        self,
+        directory,
+        max_bytes: int = 1_000_000_000,
+        check_interval: float = 60.0,
+        media_dir=None
+    ):
+        self.directory = os.fspath(directory)
+        self.max_bytes = max_bytes
+        self.check_interval = check_interval
+        self.media_dir = media_dir
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._checked = None
+        os.makedirs(self.directory, exist_ok=True)
+        self._db = sqlite3.connect(
+            os.path.join(self.directory, 'index.sqlite'), timeout=30.0,
+            isolation_level=None, check_same_thread=False,
+        )
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.executescript(
+            'CREATE TABLE IF NOT EXISTS files '
+            '(name TEXT PRIMARY KEY, hash TEXT, stat TEXT);'
+            'CREATE INDEX IF NOT EXISTS files_hash ON files (hash);'
+            'CREATE TABLE IF NOT EXISTS blobs '
+            '(hash TEXT PRIMARY KEY, size INTEGER, used REAL);'
+            'CREATE INDEX IF NOT EXISTS blobs_used ON blobs (used);'
+        )
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute('SELECT COUNT(*) FROM files').fetchone()[0]
+
+    @property
+    def bytes(self) -> int:
+        with self._lock:
+            return self._db.execute(
+                'SELECT COALESCE(SUM(size), 0) FROM blobs'
+            ).fetchone()[0]
+
+    def _blob_path(self, hash_):
+        return os.path.join(self.directory, hash_[:2], hash_)
+
+    @contextlib.contextmanager
+    def _transaction(self):
+        with self._lock:
+            self._db.execute('BEGIN IMMEDIATE')
+            try:
+                yield self._db
+            except BaseException:
+                self._db.execute('ROLLBACK')
+                raise
+            self._db.execute('COMMIT')
+
+    def clear(self):
+        with self._transaction() as db:
+            hashes = [row[0] for row in db.execute('SELECT hash FROM blobs')]
+            db.execute('DELETE FROM files')
+            db.execute('DELETE FROM blobs')
+            self._generation += 1
+        self._remove_blobs(hashes)
+
+    def discard(self, names):
+        """Drop the media files `names` from the cache."""
+        with self._transaction() as db:
+            db.executemany(
+                'DELETE FROM files WHERE name = ?', [(n,) for n in names]
+            )
+            self._generation += 1
+            orphans = self._orphans()
+        self._remove_blobs(orphans)
+
+    def _orphans(self):
+        hashes = [row[0] for row in self._db.execute(
+            'SELECT hash FROM blobs '
+            'WHERE hash NOT IN (SELECT hash FROM files)'
+        )]
+        self._db.executemany(
+            'DELETE FROM blobs WHERE hash = ?', [(h,) for h in hashes]
+        )
+        return hashes
+
+    def _remove_blobs(self, hashes):
+        for hash_ in hashes:
+            try:
+                os.remove(self._blob_path(hash_))
+            except FileNotFoundError:
+                pass
+
+    def _stat(self, name):
+        if not self.media_dir:
+            return None
+        try:
+            stat = os.stat(os.path.join(self.media_dir, name))
+        except OSError:
+            return None
+        return f'{stat.st_size}:{stat.st_mtime_ns}'
+
+    def _check(self):
+        if self.media_dir is None:
+            path = yield 'getMediaDirPath', {}
+            shared = yield from probe_media_dir(path)
+            self.media_dir = path if shared else False
+        now = time.monotonic()
+        if self.media_dir or (
+            self._checked is not None
+            and now - self._checked < self.check_interval
+        ):
+            return
+        self._checked = now
+        with self._lock:
+            names = [row[0] for row in self._db.execute(
+                'SELECT name FROM files'
+            )]
+        if names:
+            existing = set((yield 'getMediaFilesNames', {'pattern': '*'}))
+            self.discard([name for name in names if name not in existing])
+
+    def _open(self, name, stat):
+        """Open the cached file `name`, `None` if it isn't cached or
+        outdated. In the media folder, `stat` of the original file is
+        `None` once it has been deleted."""
+        with self._lock:
+            row = self._db.execute(
+                'SELECT hash, stat FROM files WHERE name = ?', (name,)
+            ).fetchone()
+            if row is None or self.media_dir and (
+                stat is None or row[1] != stat
+            ):
+                return None
+            self._db.execute(
+                'UPDATE blobs SET used = ? WHERE hash = ?',
+                (time.time(), row[0]),
+            )
+        try:
+            f = open(self._blob_path(row[0]), 'rb')
+        except FileNotFoundError:
+            return None
+        self.hits += 1
+        return f
+
+    def _write(self, name, stat, data, generation):
+        hash_ = hashlib.sha256(data).hexdigest()
+        self._add(
+            name, stat, hash_, len(data), generation, lambda f: f.write(data)
+        )
+
+    def _write_file(self, name, stat, path, generation):
+        def copy(f):
+            with open(path, 'rb') as source:
+                shutil.copyfileobj(source, f)
+
+        hash_ = hash_file(path)
+        self._add(
+            name, stat, hash_, os.path.getsize(path), generation, copy
+        )
+
+    def _add(self, name, stat, hash_, size, generation, fill):
+        path = self._blob_path(hash_)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, temp = tempfile.mkstemp(dir=os.path.dirname(path))
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    fill(f)
+                os.replace(temp, path)
+            except BaseException:
+                os.remove(temp)
+                raise
+        with self._transaction() as db:
+            # a concurrent call may have changed the file meanwhile
+            if generation != self._generation:
+                known = db.execute(
+                    'SELECT 1 FROM blobs WHERE hash = ?', (hash_,)
+                ).fetchone()
+                orphans = [] if known else [hash_]
+            else:
+                db.execute(
+                    'INSERT OR REPLACE INTO files (name, hash, stat) '
+                    'VALUES (?, ?, ?)', (name, hash_, stat),
+                )
+                db.execute(
+                    'INSERT OR REPLACE INTO blobs (hash, size, used) '
+                    'VALUES (?, ?, ?)', (hash_, size, time.time()),
+                )
+                orphans = self._evict() + self._orphans()
+        self._remove_blobs(orphans)
+
+    def _evict(self):
+        total = self._db.execute(
+            'SELECT COALESCE(SUM(size), 0) FROM blobs'
+        ).fetchone()[0]
+        evicted = []
+        rows = self._db.execute(
+            'SELECT hash, size FROM blobs ORDER BY used'
+        ).fetchall()
+        for hash_, size in rows:
+            if total <= self.max_bytes:
+                break
+            total -= size
+            evicted.append(hash_)
+        self._db.executemany(
+            'DELETE FROM files WHERE hash = ?', [(h,) for h in evicted]
+        )
+        self._db.executemany(
+            'DELETE FROM blobs WHERE hash = ?', [(h,) for h in evicted]
+        )
+        return evicted
+
+    def handle(self, action: str, params: dict):
+        name = params.get('filename')
+        if action not in RETRIEVALS or not name:
+            try:
+                return (yield action, params)
+            finally:
+                names = written_media(action, params)
+                if names:
+                    self.discard(names)
+        yield from self._check()
+        stat = self._stat(name)
+        f = self._open(name, stat)
+        if f is not None:
+            with f:
+                if action == 'retrieveMediaFile':
+                    return base64.b64encode(f.read()).decode('ascii')
+                with _Target(params['target']) as target:
+                    target.write(b'')
+                    shutil.copyfileobj(f, target)
+                return target.size
+        with self._lock:
+            self.misses += 1
+            generation = self._generation
+        result = yield action, params
+        if action == 'retrieveMediaFile':
+            if result:
+                self._write(name, stat, base64.b64decode(result), generation)
+        elif result is not False and isinstance(
+            params['target'], (str, bytes, os.PathLike)
+        ):
+            self._write_file(name, stat, params['target'], generation)
+        return result
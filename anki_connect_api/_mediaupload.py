@@ -0,0 +1,256 @@
+import collections
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from ._cache import run
+from ._media import hash_file, probe_media_dir
+
+
+class UploadManifest:
+    """Record of the media files uploaded before and of the hashes of local
+    files, in the SQLite database at `path`. Local files are only hashed
+    again when their size or modification time changed."""
+
+    def __init__(self, path, timeout: float = 30.0):
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            path, timeout=timeout, isolation_level=None,
+            check_same_thread=False,
+        )
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.executescript(
+            'CREATE TABLE IF NOT EXISTS uploaded '
+            '(name TEXT PRIMARY KEY, hash TEXT);'
+            'CREATE TABLE IF NOT EXISTS hashes '
+            '(path TEXT PRIMARY KEY, size INTEGER, mtime INTEGER, hash TEXT);'
+        )
+
+    def uploaded(self) -> dict:
+        """{name: hash} of the files uploaded before."""
+        with self._lock:
+            return dict(self._db.execute('SELECT name, hash FROM uploaded'))
+
+    def set_uploaded(self, name: str, hash_: str):
+        with self._lock:
+            self._db.execute(
+                'INSERT OR REPLACE INTO uploaded (name, hash) VALUES (?, ?)',
+                (name, hash_),
+            )
+
+    def forget(self, names):
+        """Forget the uploads of the files `names`, e.g. when they have
+        been deleted in Anki."""
+        with self._lock:
+            self._db.executemany(
+                'DELETE FROM uploaded WHERE name = ?', [(n,) for n in names]
+            )
+
+    def hash(self, path) -> str:
+        """Hash of the contents of the local file at `path`."""
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        with self._lock:
+            row = self._db.execute(
+                'SELECT size, mtime, hash FROM hashes WHERE path = ?',
+                (path,),
+            ).fetchone()
+        if row is not None and row[:2] == (stat.st_size, stat.st_mtime_ns):
+            return row[2]
+        hash_ = hash_file(path)
+        with self._lock:
+            self._db.execute(
+                'INSERT OR REPLACE INTO hashes (path, size, mtime, hash) '
+                'VALUES (?, ?, ?, ?)',
+                (path, stat.st_size, stat.st_mtime_ns, hash_),
+            )
+        return hash_
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+class _MemoryManifest:
+    def __init__(self):
+        self._uploaded = {}
+
+    def uploaded(self):
+        return dict(self._uploaded)
+
+    def set_uploaded(self, name, hash_):
+        self._uploaded[name] = hash_
+
+    def forget(self, names):
+        for name in names:
+            self._uploaded.pop(name, None)
+
+    def hash(self, path):
+        return hash_file(path)
+
+
+class MediaUploader:
+    """Uploads many media files with `client`, skipping the ones Anki
+    already has with the same contents.
+
+    Files are identified by the SHA-256 of their contents. A file is
+    skipped if a file with the same name exists in Anki and has the same
+    hash according to `manifest`, an `UploadManifest` or the path of one,
+    which records the uploads of previous runs. Without a manifest only
+    files uploaded by this uploader are known. When Anki shares the
+    filesystem, files of unknown hash are hashed in its media folder
+    instead. Pass a `MediaManifest` of that folder as `media_manifest` to
+    look the hashes up in it after a rescan, which also saves listing the
+    media files.
+
+    The other files are uploaded by up to `workers` threads. If `shared`
+    is true, Anki reads them from their path itself, which saves sending
+    them. By default this is done if Anki turns out to share the media
+    folder: a probe file stored with `storeMediaFile` must show up with
+    the same contents in the local folder at the path returned by
+    `getMediaDirPath`, which is deleted again right away. Otherwise the
+    files are sent with `storeMediaFileFrom`, as are the files of folders
+    Anki failed to read a file from.
+
+    Example::
+        >>> uploader = MediaUploader(client, manifest="uploads.sqlite")
+        >>> report = uploader.upload(glob.glob("audio/*.mp3"))
+        >>> report["uploaded"], report["skipped"], report["throughput"]
+        (1520, 38480, 31457280.0)
+    """
+
+    def __init__(
+        self,
+        client,
+        manifest=None,
+        workers: int = 4,
+        shared: bool = None,
+        progress=None,
+        media_manifest=None
+    ):
+        if manifest is None:
+            manifest = _MemoryManifest()
+        elif not hasattr(manifest, 'uploaded'):
+            manifest = UploadManifest(manifest)
+        self.client = client
+        self.manifest = manifest
+        self.workers = workers
+        self.shared = shared
+        self.progress = progress
+        self.media_manifest = media_manifest
+
+    def upload(self, files) -> dict:
+        """Upload `files`, a mapping of media file names to local paths or
+        an iterable of paths uploaded under their base name.
+
+        Returns a dict with the number of files `uploaded`, `skipped` and
+        `failed`, the `bytes` uploaded, the `seconds` it took, the
+        `throughput` in bytes per second and a list of `files` with the
+        `name`, `path`, `status`, `bytes`, `seconds` and `error` of every
+        file.
+        """
+        files = _by_name(files)
+        start = time.perf_counter()
+        media_dir = self.client.getMediaDirPath()
+        shared = self.shared
+        if shared is None:
+            shared = run(
+                probe_media_dir(media_dir),
+                lambda action, params: getattr(self.client, action)(**params),
+            )
+        if self.media_manifest is not None:
+            self.media_manifest.scan()
+            existing = self.media_manifest
+        else:
+            existing = set(self.client.getMediaFilesNames(pattern='*'))
+        known = self.manifest.uploaded()
+        self.manifest.forget([name for name in known if name not in existing])
+        # folders of files Anki failed to read from their path
+        unreadable = set()
+
+        def remote_hash(name):
+            if self.media_manifest is not None:
+                return self.media_manifest.hash(name)
+            if name in known:
+                return known[name]
+            if shared:
+                try:
+                    return hash_file(os.path.join(media_dir, name))
+                except OSError:
+                    pass
+            return None
+
+        def process(item):
+            name, path = item
+            result = {
+                'name': name, 'path': os.fspath(path), 'status': 'skipped',
+                'bytes': 0, 'seconds': 0.0, 'error': None,
+            }
+            file_start = time.perf_counter()
+            try:
+                hash_ = self.manifest.hash(path)
+                if name not in existing or remote_hash(name) != hash_:
+                    self._store(name, path, shared, unreadable)
+                    self.manifest.set_uploaded(name, hash_)
+                    result['status'] = 'uploaded'
+                    result['bytes'] = os.path.getsize(path)
+                elif name not in known:
+                    self.manifest.set_uploaded(name, hash_)
+            except Exception as e:
+                result['status'] = 'failed'
+                result['error'] = str(e)
+            result['seconds'] = time.perf_counter() - file_start
+            if self.progress is not None:
+                self.progress(result)
+            return result
+
+        with ThreadPoolExecutor(self.workers) as executor:
+            results = list(executor.map(process, files.items()))
+        return _report(results, time.perf_counter() - start)
+
+    def _store(self, name, path, shared, unreadable):
+        path = os.path.abspath(path)
+        folder = os.path.dirname(path)
+        if shared and folder not in unreadable:
+            try:
+                self.client.storeMediaFile(name, path=path)
+                return
+            except Exception:
+                # sharing the media folder doesn't mean Anki can read the
+                # folders of the files too, e.g. in another container
+                unreadable.add(folder)
+        self.client.storeMediaFileFrom(name, path)
+
+
+def _by_name(files) -> dict:
+    """{name: path} of `files`, a mapping or an iterable of paths uploaded
+    under their base name, which must be unique."""
+    if hasattr(files, 'items'):
+        return files
+    files = list(files)
+    by_name = {os.path.basename(path): path for path in files}
+    if len(by_name) < len(files):
+        names = collections.Counter(os.path.basename(path) for path in files)
+        duplicates = sorted(name for name, n in names.items() if n > 1)
+        raise ValueError(
+            f'files with the same base name: {", ".join(duplicates)}, '
+            'pass a mapping of names to paths instead'
+        )
+    return by_name
+
+
+def _report(results, seconds):
+    uploaded = sum(r['bytes'] for r in results)
+    return {
+        **{
+            status: sum(r['status'] == status for r in results)
+            for status in ('uploaded', 'skipped', 'failed')
+        },
+        'bytes': uploaded,
+        'seconds': seconds,
+        'throughput': uploaded / seconds if seconds else 0.0,
+        'files': results,
+    }
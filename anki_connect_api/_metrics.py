@@ -0,0 +1,126 @@
+import bisect
+import threading
+
+DEFAULT_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+    10.0,
+)
+
+
+class _ActionStats:
+    __slots__ = (
+        'count', 'errors', 'seconds', 'request_bytes', 'response_bytes',
+        'buckets',
+    )
+
+    def __init__(self, size):
+        self.count = 0
+        self.errors = 0
+        self.seconds = 0.0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.buckets = [0] * size
+
+
+class Metrics:
+    """Per action statistics of the requests sent by a client: number of
+    calls and errors, a latency histogram and the bytes sent and received.
+
+    Pass an instance as `metrics` to `AnkiClient` or assign it to
+    `anki_connect_api.METRICS`. Requests batched into `multi` are counted
+    as `multi`, chunked calls once per chunk and `retrieveMediaFileTo` as
+    `retrieveMediaFile`.
+
+    Example::
+        >>> metrics = Metrics()
+        >>> client = AnkiClient(metrics=metrics)
+        >>> client.deckNames()
+        ["Default"]
+        >>> metrics.snapshot()["deckNames"]["count"]
+        1
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._actions = {}
+
+    def record(
+        self,
+        action: str,
+        seconds: float,
+        request_bytes: int,
+        response_bytes: int,
+        error: bool = False
+    ):
+        index = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            stats = self._actions.get(action)
+            if stats is None:
+                stats = self._actions[action] = _ActionStats(
+                    len(self.buckets) + 1
+                )
+            stats.count += 1
+            stats.errors += error
+            stats.seconds += seconds
+            stats.request_bytes += request_bytes
+            stats.response_bytes += response_bytes
+            stats.buckets[index] += 1
+
+    def reset(self):
+        with self._lock:
+            self._actions = {}
+
+    def snapshot(self) -> dict:
+        """Return the statistics of every action as a dict. The histogram
+        maps the upper bounds of the buckets to the cumulative number of
+        calls, like Prometheus does."""
+        with self._lock:
+            snapshot = {}
+            for action, stats in sorted(self._actions.items()):
+                cumulative = 0
+                histogram = {}
+                bounds = self.buckets + (float('inf'),)
+                for bound, count in zip(bounds, stats.buckets):
+                    cumulative += count
+                    histogram[bound] = cumulative
+                snapshot[action] = {
+                    'count': stats.count,
+                    'errors': stats.errors,
+                    'seconds': stats.seconds,
+                    'request_bytes': stats.request_bytes,
+                    'response_bytes': stats.response_bytes,
+                    'histogram': histogram,
+                }
+            return snapshot
+
+    def prometheus(self, prefix: str = 'anki_connect') -> str:
+        """Return the statistics in the Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        lines = []
+
+        def counter(name, field, description):
+            lines.append(f'# HELP {prefix}_{name} {description}')
+            lines.append(f'# TYPE {prefix}_{name} counter')
+            for action, stats in snapshot.items():
+                lines.append(
+                    f'{prefix}_{name}{{action="{action}"}} {stats[field]}'
+                )
+
+        counter('requests_total', 'count', 'Requests sent to Anki-Connect.')
+        counter('errors_total', 'errors', 'Requests that failed.')
+        counter('request_bytes_total', 'request_bytes', 'Bytes sent.')
+        counter('response_bytes_total', 'response_bytes', 'Bytes received.')
+
+        name = f'{prefix}_request_duration_seconds'
+        lines.append(f'# HELP {name} Request latency.')
+        lines.append(f'# TYPE {name} histogram')
+        for action, stats in snapshot.items():
+            for bound, count in stats['histogram'].items():
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                lines.append(
+                    f'{name}_bucket{{action="{action}",le="{le}"}} {count}'
+                )
+            lines.append(f'{name}_sum{{action="{action}"}} {stats["seconds"]}')
+            lines.append(f'{name}_count{{action="{action}"}} {stats["count"]}')
+        return '\n'.join(lines) + '\n'
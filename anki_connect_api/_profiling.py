@@ -0,0 +1,105 @@
+import threading
+import time
+
+PHASES = ('serialize', 'network', 'read', 'decode')
+
+
+class Profile:
+    """Time spent in the phases of the calls made while the profile is
+    active, in total and per action:
+
+    - serialize: encoding the request to JSON
+    - network: sending it and waiting for Anki-Connect to answer
+    - read: receiving the response body
+    - decode: decoding the response from JSON
+
+    `AsyncAnkiClient` counts reading the response as part of `network`,
+    `stream()` and `retrieveMediaFileTo()` count decoding it as `read`, as
+    they decode the response while it is received.
+    Use `AnkiClient.profile()` or `anki_connect_api.profile()` to create one.
+
+    Example::
+        >>> with anki.profile() as p:
+        ...     infos = anki.cardsInfo(cards)
+        >>> print(p.report())
+        action             calls  serialize    network       read     decode
+        cardsInfo              1     0.4 ms   812.0 ms    21.7 ms    64.3 ms
+        total                  1     0.4 ms   812.0 ms    21.7 ms    64.3 ms
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.totals = dict.fromkeys(PHASES, 0.0)
+        self.actions = {}
+
+    def add(self, action: str, phases: dict):
+        with self._lock:
+            self.calls += 1
+            stats = self.actions.get(action)
+            if stats is None:
+                stats = self.actions[action] = dict.fromkeys(PHASES, 0.0)
+                stats['calls'] = 0
+            stats['calls'] += 1
+            for phase, seconds in phases.items():
+                stats[phase] += seconds
+                self.totals[phase] += seconds
+
+    def report(self) -> str:
+        """Return the totals per action as a table, in milliseconds."""
+        with self._lock:
+            rows = sorted(self.actions.items())
+            rows.append(('total', {**self.totals, 'calls': self.calls}))
+            lines = [
+                f'{"action":<18} {"calls":>5}'
+                + ''.join(f' {phase:>10}' for phase in PHASES)
+            ]
+            for action, stats in rows:
+                lines.append(
+                    f'{action:<18} {stats["calls"]:>5}'
+                    + ''.join(
+                        f' {stats[phase] * 1e3:>7.1f} ms' for phase in PHASES
+                    )
+                )
+            return '\n'.join(lines)
+
+
+class _CountingReader:
+    """Wraps the binary file object of a response, counting the bytes read
+    and noting the time the end was reached."""
+
+    def __init__(self, raw):
+        self._raw = raw
+        self.size = 0
+        self.done = None
+
+    def read(self, size=None):
+        # HTTPResponse takes -1 for a size, not for "all"
+        data = self._raw.read() if size is None else self._raw.read(size)
+        self.size += len(data)
+        if size is None or not data:
+            self.done = time.perf_counter()
+        return data
+
+
+def observe(client, action, times, request_bytes, response_bytes, error):
+    """Hand the timestamps of one request to the metrics and the active
+    profiles of `client`. `times` holds the start, and the end of
+    serialize, network, read and decode, `None` for phases not reached."""
+    end = times[-1]
+    if client.metrics is not None:
+        client.metrics.record(
+            action, end - times[0], request_bytes, response_bytes, error
+        )
+    if client._profiles:
+        phases = {}
+        previous = times[0]
+        for phase, timestamp in zip(PHASES, times[1:]):
+            if timestamp is None:
+                # the call failed during this phase
+                phases[phase] = end - previous
+                break
+            phases[phase] = timestamp - previous
+            previous = timestamp
+        for profile in client._profiles:
+            profile.add(action, phases)
@@ -0,0 +1,34 @@
+from ._codec import get_codec
+
+
+def make_request(action: str, params: dict, key: str = None) -> dict:
+    request = {
+        'action': action,
+        'version': 6,
+        'params': params
+    }
+    if key is not None:
+        request['key'] = key
+    return request
+
+
+def encode_request(
+    action: str, params: dict, key: str = None, codec=None
+) -> bytes:
+    return get_codec(codec).dumps(make_request(action, params, key))
+
+
+def check_response(response):
+    if len(response) != 2:
+        raise Exception('response has an unexpected number of fields')
+    if 'error' not in response:
+        raise Exception('response is missing required error field')
+    if 'result' not in response:
+        raise Exception('response is missing required result field')
+    if response['error'] is not None:
+        raise Exception(response['error'])
+    return response['result']
+
+
+def decode_response(data: bytes, codec=None):
+    return check_response(get_codec(codec).loads(data))
@@ -0,0 +1,145 @@
+import contextlib
+import json
+import sqlite3
+import threading
+import zlib
+
+# stay below the limit of host parameters of old SQLite versions
+_BATCH = 500
+
+
+def _batches(items):
+    items = list(items)
+    for i in range(0, len(items), _BATCH):
+        yield items[i:i + _BATCH]
+
+
+class SQLiteStore:
+    """Persistent store for `CardCache` and `NoteCache` in the SQLite
+    database at `path`, so the records survive restarts and cold starts
+    only fetch what changed. Records are kept in `table`, keyed by id with
+    their modification time, and compressed with zlib.
+
+    The database uses write-ahead logging and waits up to `timeout` seconds
+    for locks, so several processes can share it.
+
+    Example::
+        >>> client = AnkiClient(caches=[
+        ...     CardCache(store=SQLiteStore("anki-cache.sqlite", "cards")),
+        ...     NoteCache(store=SQLiteStore("anki-cache.sqlite", "notes")),
+        ... ])
+    """
+
+    def __init__(self, path, table: str = 'records', timeout: float = 30.0):
+        if not table.isidentifier():
+            raise ValueError(f'invalid table name: {table!r}')
+        self.path = path
+        self.table = table
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            path, timeout=timeout, isolation_level=None,
+            check_same_thread=False,
+        )
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA synchronous=NORMAL')
+        with self._transaction() as db:
+            db.execute(
+                f'CREATE TABLE IF NOT EXISTS {table} ('
+                'id INTEGER PRIMARY KEY, mod INTEGER, owner INTEGER, '
+                'data BLOB)'
+            )
+            db.execute(
+                f'CREATE INDEX IF NOT EXISTS {table}_owner '
+                f'ON {table} (owner)'
+            )
+            db.execute(
+                'CREATE TABLE IF NOT EXISTS meta '
+                '(key TEXT PRIMARY KEY, value TEXT)'
+            )
+
+    @contextlib.contextmanager
+    def _transaction(self):
+        with self._lock:
+            self._db.execute('BEGIN IMMEDIATE')
+            try:
+                yield self._db
+            except BaseException:
+                self._db.execute('ROLLBACK')
+                raise
+            self._db.execute('COMMIT')
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute(
+                f'SELECT COUNT(*) FROM {self.table}'
+            ).fetchone()[0]
+
+    def get_many(self, ids) -> dict:
+        found = {}
+        with self._lock:
+            for batch in _batches(ids):
+                rows = self._db.execute(
+                    f'SELECT id, mod, owner, data FROM {self.table} '
+                    f'WHERE id IN ({",".join("?" * len(batch))})',
+                    batch,
+                )
+                for id_, mod, owner, data in rows:
+                    found[id_] = (mod, owner, zlib.decompress(data))
+        return found
+
+    def put_many(self, entries: dict):
+        rows = [
+            (id_, mod, owner, zlib.compress(data, 1))
+            for id_, (mod, owner, data) in entries.items()
+        ]
+        with self._transaction() as db:
+            db.executemany(
+                f'INSERT OR REPLACE INTO {self.table} '
+                '(id, mod, owner, data) VALUES (?, ?, ?, ?)',
+                rows,
+            )
+
+    def discard(self, ids):
+        with self._transaction() as db:
+            for batch in _batches(ids):
+                db.execute(
+                    f'DELETE FROM {self.table} '
+                    f'WHERE id IN ({",".join("?" * len(batch))})',
+                    batch,
+                )
+
+    def discard_owners(self, owners):
+        with self._transaction() as db:
+            for batch in _batches(owners):
+                db.execute(
+                    f'DELETE FROM {self.table} '
+                    f'WHERE owner IN ({",".join("?" * len(batch))})',
+                    batch,
+                )
+
+    def get_meta(self, key: str):
+        with self._lock:
+            row = self._db.execute(
+                'SELECT value FROM meta WHERE key = ?',
+                (f'{self.table}.{key}',),
+            ).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def set_meta(self, key: str, value):
+        with self._transaction() as db:
+            db.execute(
+                'INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)',
+                (f'{self.table}.{key}', json.dumps(value)),
+            )
+
+    def clear(self):
+        with self._transaction() as db:
+            db.execute(f'DELETE FROM {self.table}')
+            db.execute(
+                "DELETE FROM meta WHERE key LIKE ? ESCAPE '\\'",
+                (self.table.replace('_', '\\_') + '.%',),
+            )
+
+    def close(self):
+        with self._lock:
+            self._db.close()
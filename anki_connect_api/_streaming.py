@@ -0,0 +1,142 @@
+import codecs
+import json
+
+_WHITESPACE = ' \t\n\r'
+_NUMBER_CHARS = '0123456789.eE+-'
+_decoder = json.JSONDecoder()
+
+
+class _Reader:
+    """Incrementally decodes JSON values from a binary `read(size)`
+    function, keeping only the not yet consumed part of the text."""
+
+    def __init__(self, read, chunk_size=65536):
+        self._read = read
+        self._chunk_size = chunk_size
+        self._utf8 = codecs.getincrementaldecoder('utf-8')()
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+
+    def fill(self):
+        if self.eof:
+            return False
+        # read at least as much as is buffered, so re-parsing a large value
+        # after every read stays linear in its size
+        data = self._read(max(self._chunk_size, len(self.buf) - self.pos))
+        self.buf = self.buf[self.pos:]
+        self.pos = 0
+        if data:
+            self.buf += self._utf8.decode(data)
+        else:
+            self.buf += self._utf8.decode(b'', final=True)
+            self.eof = True
+        return True
+
+    def peek(self):
+        """Skip whitespace and return the next character, '' at the end."""
+        while True:
+            buf, pos = self.buf, self.pos
+            while pos < len(buf) and buf[pos] in _WHITESPACE:
+                pos += 1
+            self.pos = pos
+            if pos < len(buf) or not self.fill():
+                return buf[pos:pos + 1]
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise json.JSONDecodeError(
+                f'Expecting {char!r}', self.buf, self.pos
+            )
+        self.pos += 1
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+            # a number cut off by the end of the buffer ("12", "0.", "1e")
+            # might continue in the next read
+            if (
+                end == len(self.buf) or self.buf[end] in _NUMBER_CHARS
+            ) and self.fill():
+                continue
+            self.pos = end
+            return value
+
+    def items(self):
+        """Yield the elements of an array, or the (key, value) pairs of an
+        object, one at a time."""
+        is_object = self.peek() == '{'
+        close = '}' if is_object else ']'
+        self.pos += 1
+        if self.peek() == close:
+            self.pos += 1
+            return
+        while True:
+            if is_object:
+                key = self.value()
+                self.expect(':')
+                yield key, self.value()
+            else:
+                yield self.value()
+            if self.peek() == ',':
+                self.pos += 1
+            else:
+                self.expect(close)
+                return
+
+
+def iter_response(read):
+    """Decode an Anki-Connect response from the binary `read(size)` function
+    and yield the items of its result one at a time.
+
+    If the result is an array its elements are yielded, if it is an object
+    its (key, value) pairs. The error field is checked wherever it appears.
+    If it comes after the result and isn't `None`, the exception is raised
+    after the items have been yielded.
+    """
+    reader = _Reader(read)
+    reader.expect('{')
+    fields = []
+    error = None
+    if reader.peek() == '}':
+        reader.pos += 1
+    else:
+        while True:
+            key = reader.value()
+            reader.expect(':')
+            fields.append(key)
+            if key == 'result' and reader.peek() in ('[', '{'):
+                yield from reader.items()
+            else:
+                value = reader.value()
+                if key == 'error':
+                    error = value
+                    if error is not None:
+                        raise Exception(error)
+                elif key == 'result' and value is not None:
+                    raise Exception(
+                        'result is neither an array nor an object'
+                    )
+            if reader.peek() == ',':
+                reader.pos += 1
+            else:
+                reader.expect('}')
+                break
+    check_fields(fields)
+
+
+def check_fields(fields):
+    """Check the names of the fields of a response decoded incrementally,
+    like `check_response` does for a complete one."""
+    if len(fields) != 2:
+        raise Exception('response has an unexpected number of fields')
+    if 'error' not in fields:
+        raise Exception('response is missing required error field')
+    if 'result' not in fields:
+        raise Exception('response is missing required result field')
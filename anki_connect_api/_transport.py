@@ -0,0 +1,178 @@
+import collections
+import contextlib
+import http.client
+import select
+import socket
+import threading
+import time
+import urllib.parse
+
+
+class _NoDelayConnection(http.client.HTTPConnection):
+    """HTTPConnection with Nagle's algorithm disabled, so small requests are
+    not held back waiting for the ACK of the previous segment."""
+
+    def connect(self):
+        super().connect()
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+
+class ConnectionPool:
+    """A thread-safe pool of persistent HTTP/1.1 connections to a single
+    Anki-Connect server.
+
+    At most `maxsize` connections are open at the same time, further callers
+    block until a connection is returned. Idle connections are dropped when
+    they have been unused for longer than `idle_timeout` seconds or when the
+    server has closed them in the meantime.
+
+    If the server closes a reused connection before any of the answer
+    arrived, the request is sent once more on a new connection. The server
+    evidently closes connections after every response without saying so,
+    like the one of Anki-Connect does, so connections are not reused
+    anymore.
+    """
+
+    def __init__(self, url, maxsize=4, timeout=None, idle_timeout=30.0):
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme != 'http':
+            raise ValueError(f'unsupported URL scheme: {parts.scheme!r}')
+        self.url = url
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        self._host = parts.hostname
+        self._port = parts.port or 80
+        self._path = parts.path or '/'
+        self._idle = collections.deque()
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(maxsize)
+        self._keep_alive = True
+
+    def request(self, body: bytes) -> bytes:
+        """POST `body` to the server and return the raw response body.
+        `body` can also be an iterable of bytes with a `len()`, which is
+        sent chunk by chunk."""
+        with self.stream(body) as response:
+            return response.read()
+
+    @contextlib.contextmanager
+    def stream(self, body: bytes):
+        """POST `body` to the server and yield the response, so its body can
+        be read incrementally. The connection is returned to the pool as
+        soon as the body has been read completely, even if the response is
+        kept, and closed if the context is left before."""
+        self._slots.acquire()
+        try:
+            response = self._send(body)
+        except BaseException:
+            self._slots.release()
+            raise
+        try:
+            if response.status >= 400:
+                raise Exception(
+                    f'HTTP error {response.status}: {response.reason}'
+                )
+            yield response
+        finally:
+            response.release()
+
+    def close(self):
+        """Close all idle connections."""
+        with self._lock:
+            while self._idle:
+                self._idle.pop()[0].close()
+
+    def _connect(self):
+        return _NoDelayConnection(self._host, self._port, timeout=self.timeout)
+
+    def _send(self, body):
+        conn, reused = self._checkout()
+        try:
+            try:
+                return _Response(self, conn, self._roundtrip(conn, body))
+            except ConnectionError:
+                conn.close()
+                if not reused:
+                    raise
+                # the server closed the kept-alive connection without
+                # answering, mostly because it closes connections after
+                # every response and did so while the request was on its
+                # way. It is sent once more on a new connection; errors on
+                # a new connection or while the body of the response is
+                # read are not retried.
+                self._keep_alive = False
+                conn = self._connect()
+                return _Response(self, conn, self._roundtrip(conn, body))
+        except BaseException:
+            conn.close()
+            raise
+
+    def _roundtrip(self, conn, body):
+        # bodies which aren't bytes are iterables of chunks with a known
+        # length, like `Base64Body`, and are sent without chunked encoding
+        conn.request('POST', self._path, body, {
+            'Content-Type': 'application/json',
+            'Content-Length': str(len(body)),
+        })
+        return conn.getresponse()
+
+    def _checkout(self):
+        now = time.monotonic()
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                conn, last_used = self._idle.pop()
+            if now - last_used < self.idle_timeout and not _is_stale(conn):
+                return conn, True
+            conn.close()
+        return self._connect(), False
+
+    def _checkin(self, conn):
+        with self._lock:
+            self._idle.append((conn, time.monotonic()))
+
+
+class _Response:
+    """Response of `ConnectionPool.stream()`, which gives the connection
+    back as soon as its body has been read completely."""
+
+    def __init__(self, pool, conn, raw):
+        self._pool = pool
+        self._conn = conn
+        self._raw = raw
+
+    def __getattr__(self, name):
+        return getattr(self._raw, name)
+
+    def read(self, size=None):
+        data = self._raw.read() if size is None else self._raw.read(size)
+        if self._raw.isclosed():
+            self.release()
+        return data
+
+    def release(self):
+        """Return the connection to the pool if the body has been read
+        completely, close it otherwise."""
+        conn, self._conn = self._conn, None
+        if conn is None:
+            return
+        raw = self._raw
+        if raw.isclosed() and not raw.will_close and self._pool._keep_alive:
+            self._pool._checkin(conn)
+        else:
+            conn.close()
+        self._pool._slots.release()
+
+
+def _is_stale(conn):
+    """An idle connection must not have anything to read. If it does, the
+    server has either closed it (EOF) or sent something unexpected."""
+    if conn.sock is None:
+        return True
+    try:
+        readable, _, _ = select.select([conn.sock], [], [], 0)
+    except (OSError, ValueError):
+        return True
+    return bool(readable)
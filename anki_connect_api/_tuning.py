@@ -0,0 +1,134 @@
+import math
+import threading
+
+
+class AdaptiveChunkSize:
+    """Chunk size controller which learns a good size per action from the
+    measured request latencies.
+
+    Pass an instance as `chunk_size` to `AnkiClient`. Every request of a
+    list-taking action reports its number of items and duration. The size
+    is then hill-climbed towards the one with the highest throughput (items
+    per second), while each request stays below `max_latency` seconds so
+    Anki's GUI stays responsive. Sizes are explored in powers of two between
+    `min_size` and `max_size`.
+
+    The learned state is a JSON-serializable dict, returned by `state()`,
+    which can be handed back to the constructor in the next run.
+
+    Example::
+        >>> tuner = AdaptiveChunkSize(max_latency=0.25)
+        >>> client = AnkiClient(chunk_size=tuner)
+        >>> infos = client.cardsInfo(cards)
+        >>> tuner.state()
+        {"cardsInfo": {"size": 512, "buckets": {"9": [10342.2, 0.05, 3]}}}
+    """
+
+    def __init__(
+        self,
+        initial_size: int = 100,
+        *,
+        min_size: int = 10,
+        max_size: int = 100000,
+        max_latency: float = 0.5,
+        smoothing: float = 0.3,
+        state: dict = None
+    ):
+        self.initial_size = initial_size
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_latency = max_latency
+        self.smoothing = smoothing
+        self._lock = threading.Lock()
+        self._actions = {}
+        if state is not None:
+            self.load_state(state)
+
+    def size_for(self, action: str) -> int:
+        with self._lock:
+            entry = self._actions.get(action)
+            if entry is None:
+                return self._clamp(self.initial_size)
+            return entry['size']
+
+    def record(self, action: str, items: int, seconds: float):
+        """Report that a request of `action` with `items` items took
+        `seconds` seconds."""
+        if items <= 0 or seconds <= 0:
+            return
+        with self._lock:
+            entry = self._actions.setdefault(
+                action, {'size': self._clamp(self.initial_size), 'buckets': {}}
+            )
+            bucket = _bucket(items)
+            stats = entry['buckets'].get(bucket)
+            throughput = items / seconds
+            if stats is None:
+                entry['buckets'][bucket] = [throughput, seconds, 1]
+            else:
+                a = self.smoothing
+                stats[0] += a * (throughput - stats[0])
+                stats[1] += a * (seconds - stats[1])
+                stats[2] += 1
+            # only requests of about the current size steer the controller
+            if bucket == _bucket(entry['size']):
+                entry['size'] = self._next_size(entry)
+
+    def state(self) -> dict:
+        """Return a copy of the learned state."""
+        with self._lock:
+            return {
+                action: {
+                    'size': entry['size'],
+                    'buckets': {
+                        str(bucket): list(stats)
+                        for bucket, stats in entry['buckets'].items()
+                    },
+                }
+                for action, entry in self._actions.items()
+            }
+
+    def load_state(self, state: dict):
+        """Restore a state previously returned by `state()`."""
+        with self._lock:
+            self._actions = {
+                action: {
+                    'size': self._clamp(entry['size']),
+                    'buckets': {
+                        int(bucket): list(stats)
+                        for bucket, stats in entry['buckets'].items()
+                    },
+                }
+                for action, entry in state.items()
+            }
+
+    def _next_size(self, entry):
+        size = entry['size']
+        buckets = entry['buckets']
+        throughput, latency, _ = buckets[_bucket(size)]
+        if latency > self.max_latency:
+            # too slow, shrink proportionally to get back below the ceiling
+            return self._clamp(size * self.max_latency / latency * 0.9)
+
+        smaller = buckets.get(_bucket(size) - 1)
+        if smaller is not None and smaller[0] > throughput * 1.1:
+            return self._clamp(size / 2)
+
+        larger = buckets.get(_bucket(size) + 1)
+        if larger is not None and (
+            larger[0] <= throughput or larger[1] > self.max_latency
+        ):
+            # already explored, doubling didn't pay off
+            return size
+        # grow, but only as far as the latency is predicted to stay in bounds
+        if 2 * latency > self.max_latency:
+            target = size * self.max_latency / latency * 0.9
+            return self._clamp(max(size, target))
+        return self._clamp(size * 2)
+
+    def _clamp(self, size):
+        return max(self.min_size, min(self.max_size, int(size)))
+
+
+def _bucket(items):
+    return int(math.log2(items))
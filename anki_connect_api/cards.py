@@ -0,0 +1,72 @@
+"""Card Actions
+
+The functions are loaded without documentation, call
+`anki_connect_api.load_docs()` to attach it.
+"""
+from . import invoke
+
+
+def getEaseFactors(cards: list) -> list:
+    return invoke("getEaseFactors", cards=cards)
+
+
+def setEaseFactors(cards: list, easeFactors: list) -> list:
+    return invoke("setEaseFactors", cards=cards, easeFactors=easeFactors)
+
+
+def setSpecificValueOfCard(card: int, keys: list, newValues: list) -> list:
+    return invoke(
+        "setSpecificValueOfCard", card=card, keys=keys, newValues=newValues
+    )
+
+
+def suspend(cards: list) -> bool:
+    return invoke("suspend", cards=cards)
+
+
+def unsuspend(cards: list) -> bool:
+    return invoke("unsuspend", cards=cards)
+
+
+def suspended(card: int) -> bool:
+    return invoke("suspended", card=card)
+
+
+def areSuspended(cards: list) -> list:
+    return invoke("areSuspended", cards=cards)
+
+
+def areDue(cards: list) -> list:
+    return invoke("areDue", cards=cards)
+
+
+def getIntervals(cards: list, complete: bool = False) -> list:
+    return invoke("getIntervals", cards=cards, complete=complete)
+
+
+def findCards(query: str) -> list:
+    return invoke("findCards", query=query)
+
+
+def cardsToNotes(cards: list) -> list:
+    return invoke("cardsToNotes", cards=cards)
+
+
+def cardsModTime(cards: list) -> list:
+    return invoke("cardsModTime", cards=cards)
+
+
+def cardsInfo(cards: list) -> list:
+    return invoke("cardsInfo", cards=cards)
+
+
+def forgetCards(cards: list) -> None:
+    return invoke("forgetCards", cards=cards)
+
+
+def relearnCards(cards: list) -> None:
+    return invoke("relearnCards", cards=cards)
+
+
+def answerCards(answers: list) -> list:
+    return invoke("answerCards", answers=answers)
@@ -0,0 +1,44 @@
+from ._actions import Actions
+from ._client_base import BaseClient
+
+
+class AnkiClient(Actions, BaseClient):
+    """Client for a single Anki-Connect server.
+
+    Every action is available as a method. Requests are sent over `transport`,
+    which defaults to a pool of up to `pool_size` persistent connections owned
+    by the client. `key` is sent along with every request if Anki-Connect is
+    configured to require an API key. Clients are thread-safe, so one process
+    can drive several Anki instances at the same time.
+
+    If `batch_window` is set, calls made concurrently from several threads
+    within that many seconds are sent together as one `multi` request of at
+    most `batch_size` actions. Each caller still gets its own result.
+
+    If `chunk_size` is set, actions taking long lists of cards, notes etc.
+    are split into requests of at most that many items, so that Anki stays
+    responsive, and the results are merged back in the order of the input.
+    `chunk_size` can also be a dict mapping action names to sizes, with the
+    key `None` as default, or an `AdaptiveChunkSize` which learns the sizes
+    from the measured latencies. Up to `chunk_workers` chunks are sent at the
+    same time. Note that chunked write actions are no longer atomic.
+
+    `codec` selects the JSON implementation: 'orjson', 'ujson' or 'json'.
+    By default the fastest one installed is used.
+
+    If `metrics` is a `Metrics` instance, the count, latency, size and errors
+    of every request are recorded in it. `profile()` breaks the time spent
+    in the requests of a block of code down into phases.
+
+    If `record` is a path, every request and response is appended to a
+    cassette there, which `ReplayTransport` can serve back without Anki.
+
+    `caches` is a sequence of caches like `MetadataCache` which answer calls
+    from local data where they can. Each call passes through them in order
+    before it is sent.
+
+    Example::
+        >>> with AnkiClient("http://127.0.0.1:8765", key="secret") as anki:
+        ...     anki.deckNames()
+        ["Default", "My other deck"]
+    """
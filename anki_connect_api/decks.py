@@ -0,0 +1,54 @@
+"""Deck Actions
+
+The functions are loaded without documentation, call
+`anki_connect_api.load_docs()` to attach it.
+"""
+from . import invoke
+
+
+def deckNames() -> list:
+    return invoke("deckNames")
+
+
+def deckNamesAndIds() -> dict:
+    return invoke("deckNamesAndIds")
+
+
+def getDecks(cards: list) -> dict:
+    return invoke("getDecks", cards=cards)
+
+
+def createDeck(deck: str) -> int:
+    return invoke("createDeck", deck=deck)
+
+
+def changeDeck(cards: list, deck: str) -> None:
+    return invoke("changeDeck", cards=cards, deck=deck)
+
+
+def deleteDecks(decks: list, cardsToo: bool) -> None:
+    return invoke("deleteDecks", decks=decks, cardsToo=cardsToo)
+
+
+def getDeckConfig(deck: str) -> dict:
+    return invoke("getDeckConfig", deck=deck)
+
+
+def saveDeckConfig(config: dict) -> bool:
+    return invoke("saveDeckConfig", config=config)
+
+
+def setDeckConfigId(decks: list, configId: int) -> bool:
+    return invoke("setDeckConfigId", decks=decks, configId=configId)
+
+
+def cloneDeckConfigId(name: str, cloneFrom: int) -> int:
+    return invoke("cloneDeckConfigId", name=name, cloneFrom=cloneFrom)
+
+
+def removeDeckConfigId(configId: int) -> bool:
+    return invoke("removeDeckConfigId", configId=configId)
+
+
+def getDeckStats(decks: list) -> dict:
+    return invoke("getDeckStats", decks=decks)
@@ -0,0 +1,74 @@
+"""Graphical Actions
+
+The functions are loaded without documentation, call
+`anki_connect_api.load_docs()` to attach it.
+"""
+from . import invoke
+
+
+def guiBrowse(query: str, reorderCards: dict) -> list:
+    return invoke("guiBrowse", query=query, reorderCards=reorderCards)
+
+
+def guiSelectNote(note: int) -> bool:
+    return invoke("guiSelectNote", note=note)
+
+
+def guiSelectedNotes() -> list:
+    return invoke("guiSelectedNotes")
+
+
+def guiAddCards(note: dict) -> int:
+    return invoke("guiAddCards", note=note)
+
+
+def guiEditNote(note: int) -> None:
+    return invoke("guiEditNote", note=note)
+
+
+def guiCurrentCard() -> dict:
+    return invoke("guiCurrentCard")
+
+
+def guiStartCardTimer() -> bool:
+    return invoke("guiStartCardTimer")
+
+
+def guiShowQuestion() -> bool:
+    return invoke("guiShowQuestion")
+
+
+def guiShowAnswer() -> bool:
+    return invoke("guiShowAnswer")
+
+
+def guiAnswerCard(ease: int) -> bool:
+    return invoke("guiAnswerCard", ease=ease)
+
+
+def guiUndo() -> bool:
+    return invoke("guiUndo")
+
+
+def guiDeckOverview(name: str) -> bool:
+    return invoke("guiDeckOverview", name=name)
+
+
+def guiDeckBrowser() -> None:
+    return invoke("guiDeckBrowser")
+
+
+def guiDeckReview(name: str) -> bool:
+    return invoke("guiDeckReview", name=name)
+
+
+def guiImportFile(path: str) -> None:
+    return invoke("guiImportFile", path=path)
+
+
+def guiExitAnki() -> None:
+    return invoke("guiExitAnki")
+
+
+def guiCheckDatabase() -> bool:
+    return invoke("guiCheckDatabase")
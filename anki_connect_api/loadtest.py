@@ -0,0 +1,284 @@
+"""Load generator sending a mix of actions from many workers at once and
+reporting throughput and latency percentiles per action.
+
+    python -m anki_connect_api.loadtest [--mix cardsModTime=70,notesInfo=20]
+        [--workers 50] [--duration 30] [--url URL | --standin N] [--asyncio]
+
+Note that `addNotes` really adds notes to the collection, tagged `loadtest`.
+"""
+import argparse
+import json
+import math
+import random
+import threading
+import time
+import uuid
+
+PERCENTILES = (50, 95, 99)
+
+
+def _cards(sample, rng, items):
+    cards = sample['cards']
+    return {'cards': rng.sample(cards, min(items, len(cards)))}
+
+
+def _notes(sample, rng, items):
+    notes = sample['notes']
+    return {'notes': rng.sample(notes, min(items, len(notes)))}
+
+
+def _add_notes(sample, rng, items):
+    return {'notes': [
+        {
+            'deckName': sample['deck'],
+            'modelName': 'Basic',
+            'fields': {'Front': f'loadtest {uuid.uuid4()}', 'Back': ''},
+            'tags': ['loadtest'],
+        }
+        for _ in range(items)
+    ]}
+
+
+# how to make the params of an action from the ids found in the collection,
+# actions not listed here are sent without params
+PARAMS = {
+    'cardsInfo': _cards,
+    'cardsModTime': _cards,
+    'areSuspended': _cards,
+    'areDue': _cards,
+    'getDecks': _cards,
+    'getEaseFactors': _cards,
+    'getIntervals': _cards,
+    'notesInfo': _notes,
+    'addNotes': _add_notes,
+    'findCards': lambda sample, rng, items: {'query': sample['query']},
+    'findNotes': lambda sample, rng, items: {'query': sample['query']},
+}
+
+
+def parse_mix(mix: str) -> dict:
+    """Parse 'action=weight,...' into a dict. The weight defaults to 1."""
+    weights = {}
+    for part in mix.split(','):
+        if not part.strip():
+            continue
+        action, _, weight = (s.strip() for s in part.partition('='))
+        try:
+            value = float(weight) if weight else 1.0
+        except ValueError:
+            value = None
+        if not action or value is None or not 0 <= value < math.inf:
+            raise ValueError(
+                f'invalid mix entry {part.strip()!r}, expected action=weight'
+                ' with a weight of at least 0'
+            )
+        weights[action] = value
+    if not sum(weights.values()):
+        raise ValueError(f'mix {mix!r} has no action with a weight above 0')
+    return weights
+
+
+def percentile(latencies, percent):
+    """Nearest-rank percentile of sorted latencies."""
+    if not latencies:
+        return None
+    rank = math.ceil(percent / 100 * len(latencies)) - 1
+    return latencies[max(0, min(rank, len(latencies) - 1))]
+
+
+class Recorder:
+    """Collects the latency of every call per action."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies = {}
+        self.errors = {}
+
+    def record(self, action, seconds, error):
+        with self._lock:
+            if error:
+                self.errors[action] = self.errors.get(action, 0) + 1
+            else:
+                self.latencies.setdefault(action, []).append(seconds)
+
+    def summary(self, duration: float) -> dict:
+        summary = {}
+        actions = sorted(set(self.latencies) | set(self.errors))
+        for action in actions:
+            latencies = sorted(self.latencies.get(action, []))
+            summary[action] = {
+                'calls': len(latencies),
+                'errors': self.errors.get(action, 0),
+                'throughput': len(latencies) / duration,
+                **{
+                    f'p{p}': percentile(latencies, p) for p in PERCENTILES
+                },
+            }
+        return summary
+
+
+def sample_collection(client, query, deck, size=1000):
+    """Ids of cards and notes to send requests for."""
+    cards = client.findCards(query)[:size]
+    notes = client.findNotes(query)[:size]
+    if not cards or not notes:
+        raise Exception(f'no cards or notes found for query {query!r}')
+    return {'cards': cards, 'notes': notes, 'query': query, 'deck': deck}
+
+
+def run_threads(client, weights, sample, workers, duration, items, seed=None):
+    recorder = Recorder()
+    actions = list(weights)
+    deadline = time.perf_counter() + duration
+
+    def work(worker):
+        rng = random.Random(None if seed is None else seed + worker)
+        while time.perf_counter() < deadline:
+            action = rng.choices(actions, weights=weights.values())[0]
+            params = PARAMS.get(action, lambda *args: {})(sample, rng, items)
+            start = time.perf_counter()
+            error = False
+            try:
+                client.invoke(action, **params)
+            except Exception:
+                error = True
+            recorder.record(action, time.perf_counter() - start, error)
+
+    threads = [
+        threading.Thread(target=work, args=(i,), daemon=True)
+        for i in range(workers)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return recorder.summary(time.perf_counter() - start)
+
+
+async def run_tasks(client, weights, sample, workers, duration, items,
+                    seed=None):
+    import asyncio
+
+    recorder = Recorder()
+    actions = list(weights)
+    deadline = time.perf_counter() + duration
+
+    async def work(worker):
+        rng = random.Random(None if seed is None else seed + worker)
+        while time.perf_counter() < deadline:
+            action = rng.choices(actions, weights=weights.values())[0]
+            params = PARAMS.get(action, lambda *args: {})(sample, rng, items)
+            start = time.perf_counter()
+            error = False
+            try:
+                await client.invoke(action, **params)
+            except Exception:
+                error = True
+            recorder.record(action, time.perf_counter() - start, error)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(work(i) for i in range(workers)))
+    return recorder.summary(time.perf_counter() - start)
+
+
+def report(summary) -> str:
+    lines = [
+        f'{"action":<18} {"calls":>7} {"errors":>6} {"calls/s":>9}'
+        + ''.join(f' {f"p{p}":>9}' for p in PERCENTILES)
+    ]
+    for action, stats in summary.items():
+        lines.append(
+            f'{action:<18} {stats["calls"]:>7} {stats["errors"]:>6} '
+            f'{stats["throughput"]:>9.1f}'
+            + ''.join(
+                f' {"-":>9}' if stats[f'p{p}'] is None
+                else f' {stats[f"p{p}"] * 1e3:>7.1f}ms'
+                for p in PERCENTILES
+            )
+        )
+    total_calls = sum(stats['calls'] for stats in summary.values())
+    total_errors = sum(stats['errors'] for stats in summary.values())
+    throughput = sum(stats['throughput'] for stats in summary.values())
+    lines.append(
+        f'{"total":<18} {total_calls:>7} {total_errors:>6} {throughput:>9.1f}'
+    )
+    return '\n'.join(lines)
+
+
+def main():
+    from . import URL
+    from .client import AnkiClient
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--url', default=URL)
+    parser.add_argument('--key')
+    parser.add_argument('--standin', type=int, metavar='CARDS',
+                        help='start a stand-in server with that many cards')
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help='per request latency of the stand-in')
+    parser.add_argument('--mix', default='cardsModTime=70,notesInfo=20,'
+                        'addNotes=10', help='action=weight,...')
+    parser.add_argument('--workers', type=int, default=50)
+    parser.add_argument('--duration', type=float, default=10.0)
+    parser.add_argument('--items', type=int, default=10,
+                        help='cards or notes per request')
+    parser.add_argument('--query', default='deck:*',
+                        help='search for the cards and notes to request')
+    parser.add_argument('--deck', default='Default',
+                        help='deck for added notes')
+    parser.add_argument('--pool-size', type=int)
+    parser.add_argument('--batch-window', type=float)
+    parser.add_argument('--asyncio', action='store_true',
+                        help='use AsyncAnkiClient tasks instead of threads')
+    parser.add_argument('--seed', type=int)
+    parser.add_argument('--json', action='store_true',
+                        help='print the results as JSON')
+    args = parser.parse_args()
+    try:
+        weights = parse_mix(args.mix)
+    except ValueError as e:
+        parser.error(str(e))
+
+    server = None
+    url = args.url
+    if args.standin is not None:
+        from .standin import Collection, StandIn
+        server = StandIn(
+            Collection(args.standin), latency=args.latency, key=args.key
+        ).start()
+        url = server.url
+
+    pool_size = args.pool_size or args.workers
+    options = dict(pool_size=pool_size, batch_window=args.batch_window)
+    try:
+        with AnkiClient(url, args.key) as client:
+            sample = sample_collection(client, args.query, args.deck)
+        if args.asyncio:
+            import asyncio
+            from .aio import AsyncAnkiClient
+
+            async def run():
+                async with AsyncAnkiClient(url, args.key, **options) as client:
+                    return await run_tasks(
+                        client, weights, sample, args.workers, args.duration,
+                        args.items, args.seed
+                    )
+            summary = asyncio.run(run())
+        else:
+            with AnkiClient(url, args.key, **options) as client:
+                summary = run_threads(
+                    client, weights, sample, args.workers, args.duration,
+                    args.items, args.seed
+                )
+    finally:
+        if server is not None:
+            server.close()
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        print(report(summary))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""Media Actions
+
+The functions are loaded without documentation, call
+`anki_connect_api.load_docs()` to attach it.
+"""
+from . import invoke
+
+
+def storeMediaFile(
+    filename: str,
+    *,
+    data: str = None,
+    path: str = None,
+    url: str = None,
+    deleteExisting: bool = True
+) -> str:
+    if data is not None:
+        return invoke(
+            "storeMediaFile",
+            filename=filename,
+            data=data,
+            deleteExisting=deleteExisting,
+        )
+    elif path is not None:
+        return invoke(
+            "storeMediaFile",
+            filename=filename,
+            path=str(path),
+            deleteExisting=deleteExisting,
+        )
+    elif url is not None:
+        return invoke(
+            "storeMediaFile",
+            filename=filename,
+            url=url,
+            deleteExisting=deleteExisting,
+        )
+    else:
+        raise Exception("one argument of data, path or url must be supplied")
+
+
+def retrieveMediaFile(filename: str) -> str:
+    return invoke("retrieveMediaFile", filename=filename)
+
+
+def getMediaFilesNames(pattern: str) -> list:
+    return invoke("getMediaFilesNames", pattern=pattern)
+
+
+def getMediaDirPath() -> str:
+    return invoke("getMediaDirPath")
+
+
+def deleteMediaFile(filename: str) -> None:
+    return invoke("deleteMediaFile", filename=filename)
@@ -0,0 +1,48 @@
+"""Miscellaneous Actions
+
+The functions are loaded without documentation, call
+`anki_connect_api.load_docs()` to attach it.
+"""
+from . import invoke
+
+
+def requestPermission() -> dict:
+    return invoke("requestPermission")
+
+
+def version() -> int:
+    return invoke("version")
+
+
+def apiReflect(scopes: list, actions: list) -> dict:
+    return invoke("apiReflect", scopes=scopes, actions=actions)
+
+
+def sync() -> None:
+    return invoke("sync")
+
+
+def getProfiles() -> list:
+    return invoke("getProfiles")
+
+
+def loadProfile(name: str) -> bool:
+    return invoke("loadProfile", name=name)
+
+
+def multi(actions: list) -> list:
+    return invoke("multi", actions=actions)
+
+
+def exportPackage(deck: str, path: str, includeSched: bool) -> bool:
+    return invoke(
+        "exportPackage", deck=deck, path=path, includeSched=includeSched
+    )
+
+
+def importPackage(path: str) -> bool:
+    return invoke("importPackage", path=path)
+
+
+def reloadCollection() -> None:
+    return invoke("reloadCollection")
@@ -0,0 +1,165 @@
+"""Model Actions
+
+The functions are loaded without documentation, call
+`anki_connect_api.load_docs()` to attach it.
+"""
+from . import invoke
+
+
+def modelNames() -> list:
+    return invoke("modelNames")
+
+
+def modelNamesAndIds() -> dict:
+    return invoke("modelNamesAndIds")
+
+
+def findModelsById(modelIds: list) -> list:
+    return invoke("findModelsById", modelIds=modelIds)
+
+
+def findModelsByName(modelNames: list) -> list:
+    return invoke("findModelsByName", modelNames=modelNames)
+
+
+def modelFieldNames(modelName: str) -> list:
+    return invoke("modelFieldNames", modelName=modelName)
+
+
+def modelFieldDescriptions(modelName: str) -> list:
+    return invoke("modelFieldDescriptions", modelName=modelName)
+
+
+def modelFieldFonts(modelName: str) -> dict:
+    return invoke("modelFieldFonts", modelName=modelName)
+
+
+def modelFieldsOnTemplates(modelName: str) -> dict:
+    return invoke("modelFieldsOnTemplates", modelName=modelName)
+
+
+def createModel(
+    modelName: str,
+    inOrderFields: list,
+    css: str,
+    isCloze: bool,
+    cardTemplates: list,
+) -> dict:
+    return invoke(
+        "createModel",
+        modelName=modelName,
+        inOrderFields=inOrderFields,
+        css=css,
+        isCloze=isCloze,
+        cardTemplates=cardTemplates,
+    )
+
+
+def modelTemplates(modelName: str) -> dict:
+    return invoke("modelTemplates", modelName=modelName)
+
+
+def modelStyling(modelName: str) -> dict:
+    return invoke("modelStyling", modelName=modelName)
+
+
+def updateModelTemplates(model: dict) -> None:
+    return invoke("updateModelTemplates", model=model)
+
+
+def updateModelStyling(model: dict) -> None:
+    return invoke("updateModelStyling", model=model)
+
+
+def findAndReplaceInModels(model: dict) -> int:
+    return invoke("findAndReplaceInModels", model=model)
+
+
+def modelTemplateRename(
+    modelName: str, oldTemplateName: str, newTemplateName: str
+) -> None:
+    return invoke(
+        "modelTemplateRename",
+        modelName=modelName,
+        oldTemplateName=oldTemplateName,
+        newTemplateName=newTemplateName,
+    )
+
+
+def modelTemplateReposition(
+    modelName: str, templateName: str, index: int
+) -> None:
+    return invoke(
+        "modelTemplateReposition",
+        modelName=modelName,
+        templateName=templateName,
+        index=index,
+    )
+
+
+def modelTemplateAdd(modelName: str, template: dict) -> None:
+    return invoke("modelTemplateAdd", modelName=modelName, template=template)
+
+
+def modelTemplateRemove(modelName: str, templateName: str) -> None:
+    return invoke(
+        "modelTemplateRemove", modelName=modelName, templateName=templateName
+    )
+
+
+def modelFieldRename(
+    modelName: str, oldFieldName: str, newFieldName: str
+) -> None:
+    return invoke(
+        "modelFieldRename",
+        modelName=modelName,
+        oldFieldName=oldFieldName,
+        newFieldName=newFieldName,
+    )
+
+
+def modelFieldReposition(modelName: str, fieldName: str, index: int) -> None:
+    return invoke(
+        "modelFieldReposition",
+        modelName=modelName,
+        fieldName=fieldName,
+        index=index,
+    )
+
+
+def modelFieldAdd(modelName: str, fieldName: str, index: int) -> None:
+    return invoke(
+        "modelFieldAdd", modelName=modelName, fieldName=fieldName, index=index
+    )
+
+
+def modelFieldRemove(modelName: str, fieldName: str) -> None:
+    return invoke("modelFieldRemove", modelName=modelName, fieldName=fieldName)
+
+
+def modelFieldSetFont(modelName: str, fieldName: str, font: str) -> None:
+    return invoke(
+        "modelFieldSetFont", modelName=modelName, fieldName=fieldName, font=font
+    )
+
+
+def modelFieldSetFontSize(
+    modelName: str, fieldName: str, fontSize: int
+) -> None:
+    return invoke(
+        "modelFieldSetFontSize",
+        modelName=modelName,
+        fieldName=fieldName,
+        fontSize=fontSize,
+    )
+
+
+def modelFieldSetDescription(
+    modelName: str, fieldName: str, description: str
+) -> bool:
+    return invoke(
+        "modelFieldSetDescription",
+        modelName=modelName,
+        fieldName=fieldName,
+        description=description,
+    )
@@ -0,0 +1,89 @@
+"""Note Actions
+
+The functions are loaded without documentation, call
+`anki_connect_api.load_docs()` to attach it.
+"""
+from . import invoke
+
+
+def addNote(note: dict) -> int:
+    return invoke("addNote", note=note)
+
+
+def addNotes(notes: list) -> list:
+    return invoke("addNotes", notes=notes)
+
+
+def canAddNotes(notes: list) -> list:
+    return invoke("canAddNotes", notes=notes)
+
+
+def canAddNotesWithErrorDetail(notes: list) -> list:
+    return invoke("canAddNotesWithErrorDetail", notes=notes)
+
+
+def updateNoteFields(note: dict) -> None:
+    return invoke("updateNoteFields", note=note)
+
+
+def updateNote(note: dict) -> None:
+    return invoke("updateNote", note=note)
+
+
+def updateNoteTags(note: int, tags: list) -> None:
+    return invoke("updateNoteTags", note=note, tags=tags)
+
+
+def getNoteTags(note: int) -> list:
+    return invoke("getNoteTags", note=note)
+
+
+def addTags(notes: list, tags: str) -> None:
+    return invoke("addTags", notes=notes, tags=tags)
+
+
+def removeTags(notes: list, tags: str) -> None:
+    return invoke("removeTags", notes=notes, tags=tags)
+
+
+def getTags() -> list:
+    return invoke("getTags")
+
+
+def clearUnusedTags() -> None:
+    return invoke("clearUnusedTags")
+
+
+def replaceTags(
+    notes: list, tag_to_replace: str, replace_with_tag: str
+) -> None:
+    return invoke(
+        "replaceTags",
+        notes=notes,
+        tag_to_replace=tag_to_replace,
+        replace_with_tag=replace_with_tag,
+    )
+
+
+def replaceTagsInAllNotes(tag_to_replace: str, replace_with_tag: str) -> None:
+    return invoke(
+        "replaceTagsInAllNotes",
+        tag_to_replace=tag_to_replace,
+        replace_with_tag=replace_with_tag,
+    )
+
+
+def findNotes(query: str) -> list:
+    return invoke("findNotes", query=query)
+
+
+def notesInfo(notes: list) -> list:
+    return invoke("notesInfo", notes=notes)
+
+
+def deleteNotes(notes: list) -> None:
+    return invoke("deleteNotes", notes=notes)
+
+
+def removeEmptyNotes() -> None:
+    return invoke("removeEmptyNotes")
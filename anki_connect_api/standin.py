@@ -0,0 +1,570 @@
+"""Stand-in for Anki-Connect serving an in-memory collection of synthetic
+cards, for load tests without Anki.
+
+    python -m anki_connect_api.standin [--cards N] [--port PORT] [--latency S]
+"""
+import argparse
+import base64
+import concurrent.futures
+import datetime
+import fnmatch
+import http.server
+import itertools
+import os
+import queue
+import re
+import shlex
+import shutil
+import tempfile
+import threading
+import time
+
+from ._chunking import count
+from ._codec import get_codec
+
+NOTE_BASE = 1502298033753
+CARD_BASE = 1498938915662
+MOD_BASE = 1629454092
+DECKS = ('Default', 'Japanese::JLPT N3', 'Japanese::JLPT N2', 'Spanish')
+TAGS = ('jlpt', 'verbs', 'leech', 'marked', 'nouns')
+MODELS = {
+    'Basic': ('Front', 'Back'),
+    'Basic (and reversed card)': ('Front', 'Back'),
+}
+SEARCH_KEYS = ('deck', 'tag', 'note', 'is', 'nid', 'cid', 'edited')
+PERIODIC_KEYS = ('deck', 'tag', 'note')
+CSS = '.card {\n font-family: arial;\n font-size: 20px;\n}\n'
+# hour of the local time at which a new day starts in Anki by default
+ROLLOVER = 4
+
+
+def _next_day_at(now):
+    """Time at which the next day starts in Anki."""
+    start = datetime.datetime.fromtimestamp(now).replace(
+        hour=ROLLOVER, minute=0, second=0, microsecond=0
+    )
+    if start.timestamp() <= now:
+        start += datetime.timedelta(days=1)
+    return int(start.timestamp())
+
+
+def _fields(note):
+    return {
+        name: {'value': value, 'order': order}
+        for order, (name, value) in enumerate(note['fields'].items())
+    }
+
+
+class Collection:
+    """Collection of `size` synthetic notes with one card each. The notes
+    are computed from their index when requested, only added and modified
+    notes are stored, so millions of cards take next to no memory.
+
+    Actions are methods named like the Anki-Connect action; only the ones
+    needed to exercise the client are implemented.
+    """
+
+    def __init__(self, size: int = 10000, decks=DECKS, media_dir=None):
+        self.size = size
+        self._base_size = size
+        self.decks = {name: 1 + i for i, name in enumerate(decks)}
+        self._base_decks = tuple(decks)
+        self._notes = {}
+        self._media_dir = media_dir
+        self._own_media_dir = False
+
+    # notes are identified by their index, note and card id are derived
+    # from it
+    def _index(self, id_, base):
+        index = id_ - base if isinstance(id_, int) else -1
+        return index if 0 <= index < self.size else None
+
+    def _note(self, index):
+        note = self._notes.get(index)
+        if note is not None:
+            return note
+        return self._base_note(index)
+
+    def _base_note(self, index):
+        return {
+            'deckName': self._base_decks[index % len(self._base_decks)],
+            'modelName': 'Basic',
+            'fields': {'Front': f'Front {index}', 'Back': f'Back {index}'},
+            'tags': [TAGS[index % 5], TAGS[(index // 5) % 5]],
+            'mod': MOD_BASE + index,
+        }
+
+    def _schedule(self, index):
+        spread = index * 7919 % 10007
+        card_type = spread % 3
+        return {
+            'type': card_type,
+            'queue': -1 if spread % 50 == 0 else card_type,
+            'due': spread,
+            'interval': spread % 400 if card_type == 2 else 0,
+            'reps': spread % 50,
+            'lapses': spread % 7,
+            'left': 0,
+        }
+
+    def _matches(self, index, terms, note=None):
+        for key, value in terms:
+            if key == 'nid' or key == 'cid':
+                base = NOTE_BASE if key == 'nid' else CARD_BASE
+                if base + index not in value:
+                    return False
+                continue
+            if key == 'is':
+                schedule = self._schedule(index)
+                if value == 'new':
+                    matched = schedule['type'] == 0
+                elif value in ('due', 'review'):
+                    matched = schedule['type'] == 2
+                elif value == 'suspended':
+                    matched = schedule['queue'] == -1
+                else:
+                    matched = True
+                if not matched:
+                    return False
+                continue
+            if note is None:
+                note = self._note(index)
+            if key == 'edited':
+                if note['mod'] <= value:
+                    return False
+                continue
+            if key == 'deck':
+                deck = note['deckName']
+                if not (value.match(deck) or value.match(deck.split('::')[0])):
+                    return False
+            elif key == 'tag':
+                if not any(value.match(tag) for tag in note['tags']):
+                    return False
+            elif key == 'note':
+                if not value.match(note['modelName']):
+                    return False
+            elif not any(
+                value in field.lower() for field in note['fields'].values()
+            ):
+                return False
+        return True
+
+    def _search(self, query):
+        terms = []
+        for token in shlex.split(query or ''):
+            key, sep, value = token.partition(':')
+            key = key.lower()
+            if not sep or key not in SEARCH_KEYS:
+                if token not in ('*', 'deck:*'):
+                    terms.append(('text', token.lower()))
+            elif key in ('nid', 'cid'):
+                terms.append((key, {int(i) for i in value.split(',')}))
+            elif key == 'is':
+                terms.append((key, value.lower()))
+            elif key == 'edited':
+                # like in Anki, edited:1 means since the start of the day
+                cutoff = _next_day_at(time.time()) - int(value) * 86400
+                terms.append((key, cutoff))
+            elif value != '*':
+                pattern = fnmatch.translate(value)
+                terms.append((key, re.compile(pattern, re.IGNORECASE)))
+        id_terms = [value for key, value in terms if key in ('nid', 'cid')]
+        edited = [value for key, value in terms if key == 'edited']
+        periodic = [term for term in terms if term[0] in PERIODIC_KEYS]
+        if id_terms:
+            candidates = sorted(
+                {i - NOTE_BASE for i in id_terms[0]}
+                | {i - CARD_BASE for i in id_terms[0]}
+            )
+        elif edited:
+            # synthetic notes were modified in the order of their index
+            first = max(0, max(edited) - MOD_BASE)
+            candidates = sorted(
+                set(range(first, self._base_size)) | set(self._notes)
+            )
+        elif periodic:
+            candidates = self._periodic_search(periodic)
+            terms = [term for term in terms if term[0] not in PERIODIC_KEYS]
+        else:
+            candidates = range(self.size)
+        return [
+            i for i in candidates
+            if 0 <= i < self.size and self._matches(i, terms)
+        ]
+
+    def _periodic_search(self, terms):
+        # deck, tags and model of the synthetic notes repeat with a short
+        # period, so they only need to be checked once per residue
+        period = len(self._base_decks) * 25
+        residues = [
+            r for r in range(min(period, self._base_size))
+            if self._matches(r, terms, self._base_note(r))
+        ]
+        indices = sorted(itertools.chain.from_iterable(
+            range(r, self._base_size, period) for r in residues
+        ))
+        if not self._notes:
+            return indices
+        indices = [i for i in indices if i not in self._notes]
+        indices.extend(
+            i for i in self._notes if self._matches(i, terms, self._notes[i])
+        )
+        indices.sort()
+        return indices
+
+    def findCards(self, query=None):
+        return [CARD_BASE + i for i in self._search(query)]
+
+    def findNotes(self, query=None):
+        return [NOTE_BASE + i for i in self._search(query)]
+
+    def cardsInfo(self, cards):
+        result = []
+        for card_id in cards:
+            index = self._index(card_id, CARD_BASE)
+            if index is None:
+                result.append({})
+                continue
+            note = self._note(index)
+            fields = _fields(note)
+            values = list(note['fields'].values())
+            result.append({
+                'answer': f'<style>{CSS}</style>{values[-1]}',
+                'question': f'<style>{CSS}</style>{values[0]}',
+                'deckName': note['deckName'],
+                'modelName': note['modelName'],
+                'fieldOrder': 0,
+                'fields': fields,
+                'css': CSS,
+                'cardId': card_id,
+                'note': NOTE_BASE + index,
+                'ord': 0,
+                'mod': note['mod'],
+                **self._schedule(index),
+            })
+        return result
+
+    def cardsModTime(self, cards):
+        result = []
+        for card_id in cards:
+            index = self._index(card_id, CARD_BASE)
+            if index is None:
+                result.append({})
+                continue
+            mod = self._note(index)['mod']
+            result.append({'cardId': card_id, 'mod': mod})
+        return result
+
+    def notesInfo(self, notes):
+        result = []
+        for note_id in notes:
+            index = self._index(note_id, NOTE_BASE)
+            if index is None:
+                result.append({})
+                continue
+            note = self._note(index)
+            result.append({
+                'noteId': note_id,
+                'modelName': note['modelName'],
+                'tags': list(note['tags']),
+                'fields': _fields(note),
+                'cards': [CARD_BASE + index],
+            })
+        return result
+
+    def addNotes(self, notes):
+        result = []
+        for note in notes:
+            model = MODELS.get(note.get('modelName'))
+            fields = note.get('fields', {})
+            if (
+                model is None or note.get('deckName') not in self.decks
+                or not set(fields) <= set(model) or not fields.get(model[0])
+            ):
+                result.append(None)
+                continue
+            index = self.size
+            self.size += 1
+            self._notes[index] = {
+                'deckName': note['deckName'],
+                'modelName': note['modelName'],
+                'fields': {name: fields.get(name, '') for name in model},
+                'tags': list(note.get('tags', [])),
+                'mod': int(time.time()),
+            }
+            result.append(NOTE_BASE + index)
+        return result
+
+    def updateNoteFields(self, note):
+        index = self._index(note.get('id'), NOTE_BASE)
+        if index is None:
+            raise Exception(f'note was not found: {note.get("id")}')
+        current = self._note(index)
+        fields = dict(current['fields'])
+        for name, value in note.get('fields', {}).items():
+            if name not in fields:
+                raise Exception(f'field not found: {name}')
+            fields[name] = value
+        self._notes[index] = {
+            **current, 'fields': fields, 'mod': int(time.time())
+        }
+
+    def deckNames(self):
+        return sorted(self.decks)
+
+    def deckNamesAndIds(self):
+        return dict(self.decks)
+
+    def createDeck(self, deck):
+        return self.decks.setdefault(deck, 1 + len(self.decks))
+
+    def modelNames(self):
+        return list(MODELS)
+
+    def version(self):
+        return 6
+
+    @property
+    def media_dir(self):
+        if self._media_dir is None:
+            self._media_dir = tempfile.mkdtemp(prefix='anki-standin-')
+            self._own_media_dir = True
+        return self._media_dir
+
+    def _media_path(self, filename):
+        if not filename or os.path.basename(filename) != filename:
+            raise Exception(f'invalid filename: {filename}')
+        return os.path.join(self.media_dir, filename)
+
+    def storeMediaFile(
+        self, filename, data=None, path=None, url=None, deleteExisting=True
+    ):
+        if data is not None:
+            content = base64.b64decode(data)
+        elif path is not None:
+            with open(path, 'rb') as f:
+                content = f.read()
+        else:
+            raise Exception(
+                'You must provide a "data", "path", or "url" field.'
+            )
+        if not deleteExisting and os.path.exists(self._media_path(filename)):
+            stem, ext = os.path.splitext(filename)
+            number = 1
+            while os.path.exists(self._media_path(f'{stem}-{number}{ext}')):
+                number += 1
+            filename = f'{stem}-{number}{ext}'
+        with open(self._media_path(filename), 'wb') as f:
+            f.write(content)
+        return filename
+
+    def retrieveMediaFile(self, filename):
+        try:
+            with open(self._media_path(filename), 'rb') as f:
+                return base64.b64encode(f.read()).decode('ascii')
+        except FileNotFoundError:
+            return False
+
+    def getMediaFilesNames(self, pattern='*'):
+        return sorted(fnmatch.filter(os.listdir(self.media_dir), pattern))
+
+    def getMediaDirPath(self):
+        return os.path.abspath(self.media_dir)
+
+    def deleteMediaFile(self, filename):
+        try:
+            os.remove(self._media_path(filename))
+        except FileNotFoundError:
+            pass
+
+    def close(self):
+        if self._own_media_dir:
+            shutil.rmtree(self._media_dir, ignore_errors=True)
+
+
+class StandIn:
+    """HTTP server answering Anki-Connect requests from a `Collection`.
+
+    Connections are handled concurrently, but like in Anki every action is
+    executed one after the other on a single thread. Each request takes at
+    least `latency` seconds plus `item_latency` per card or note it works
+    on, to mimic the time Anki needs. If `key` is set, requests must carry
+    it.
+
+    Example::
+        >>> with StandIn(Collection(1_000_000)).start() as server:
+        ...     client = AnkiClient(server.url)
+        ...     len(client.findCards(query="deck:Spanish"))
+        250000
+    """
+
+    def __init__(
+        self,
+        collection: Collection = None,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        *,
+        latency: float = 0.0,
+        item_latency: float = 0.0,
+        key: str = None,
+        codec: str = None
+    ):
+        self.collection = Collection() if collection is None else collection
+        self.latency = latency
+        self.item_latency = item_latency
+        self.key = key
+        self.codec = get_codec(codec)
+        self.requests = 0
+        self._queue = queue.Queue()
+        self._worker = None
+        self._thread = None
+        self._server = http.server.ThreadingHTTPServer(
+            (host, port), self._handler()
+        )
+        self._server.daemon_threads = True
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def start(self):
+        """Serve in a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._work, daemon=True)
+            self._worker.start()
+        self._server.serve_forever()
+
+    def close(self):
+        if self._worker is not None:
+            self._server.shutdown()
+            self._queue.put(None)
+        self._server.server_close()
+        self.collection.close()
+
+    def handle(self, body: bytes) -> bytes:
+        """Execute the request on the worker thread and return the
+        response."""
+        future = concurrent.futures.Future()
+        self._queue.put((body, future))
+        return future.result()
+
+    def _work(self):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            body, future = job
+            try:
+                future.set_result(self._respond(body))
+            except Exception as e:
+                future.set_exception(e)
+
+    def _respond(self, body):
+        self.requests += 1
+        try:
+            request = self.codec.loads(body)
+            if self.key is not None and request.get('key') != self.key:
+                raise Exception('valid api key must be provided')
+            result = self._execute(request)
+            response = {'result': result, 'error': None}
+        except Exception as e:
+            response = {'result': None, 'error': str(e)}
+        return self.codec.dumps(response)
+
+    def _execute(self, request, nested=False):
+        action = request.get('action')
+        params = request.get('params') or {}
+        delay = 0.0 if nested else self.latency
+        if self.item_latency:
+            delay += self.item_latency * (count(action, params) or 0)
+        if delay:
+            time.sleep(delay)
+        if action == 'multi':
+            return [
+                self._execute_nested(sub)
+                for sub in params.get('actions', [])
+            ]
+        method = getattr(Collection, action or '_', None)
+        if not callable(method) or action.startswith('_') or action == 'close':
+            raise Exception('unsupported action')
+        try:
+            return getattr(self.collection, action)(**params)
+        except TypeError as e:
+            raise Exception(str(e))
+
+    def _execute_nested(self, request):
+        try:
+            response = {
+                'result': self._execute(request, nested=True), 'error': None
+            }
+        except Exception as e:
+            response = {'result': None, 'error': str(e)}
+        if 'version' not in request and response['error'] is None:
+            return response['result']
+        return response
+
+    def _handler(self):
+        server = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length', 0))
+                data = server.handle(self.rfile.read(length))
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--cards', type=int, default=10000)
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help='seconds every request takes')
+    parser.add_argument('--item-latency', type=float, default=0.0,
+                        help='additional seconds per card or note')
+    parser.add_argument('--key', help='API key required from clients')
+    parser.add_argument('--media-dir', help='directory for media files')
+    args = parser.parse_args()
+    server = StandIn(
+        Collection(args.cards, media_dir=args.media_dir),
+        args.host,
+        args.port,
+        latency=args.latency,
+        item_latency=args.item_latency,
+        key=args.key,
+    )
+    print(f'serving {args.cards} cards on {server.url}')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+
+if __name__ == '__main__':
+    main()
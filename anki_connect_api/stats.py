@@ -0,0 +1,34 @@
+"""Statistic Actions
+
+The functions are loaded without documentation, call
+`anki_connect_api.load_docs()` to attach it.
+"""
+from . import invoke
+
+
+def getNumCardsReviewedToday() -> int:
+    return invoke("getNumCardsReviewedToday")
+
+
+def getNumCardsReviewedByDay() -> list:
+    return invoke("getNumCardsReviewedByDay")
+
+
+def getCollectionStatsHTML(wholeCollection: bool) -> str:
+    return invoke("getCollectionStatsHTML", wholeCollection=wholeCollection)
+
+
+def cardReviews(deck: str, startID: int) -> list:
+    return invoke("cardReviews", deck=deck, startID=startID)
+
+
+def getReviewsOfCards(cards: list) -> dict:
+    return invoke("getReviewsOfCards", cards=cards)
+
+
+def getLatestReviewID(deck: str) -> int:
+    return invoke("getLatestReviewID", deck=deck)
+
+
+def insertReviews(reviews: list) -> None:
+    return invoke("insertReviews", reviews=reviews)
@@ -0,0 +1,71 @@
+"""Compare the JSON codecs on typical Anki-Connect requests and responses.
+
+    python benchmarks/bench_codec.py [--repeat N]
+"""
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).absolute().parent.parent))
+
+import payloads  # noqa: E402
+from anki_connect_api._codec import get_codec  # noqa: E402
+from anki_connect_api._protocol import make_request  # noqa: E402
+
+CASES = {
+    "cardsInfo": (
+        make_request("cardsInfo", {"cards": list(range(1000))}),
+        payloads.response(payloads.cards_info(1000)),
+    ),
+    "findModelsByName": (
+        make_request("findModelsByName", {"modelNames": ["Basic"] * 50}),
+        payloads.response(payloads.find_models(50)),
+    ),
+    "getReviewsOfCards": (
+        make_request("getReviewsOfCards", {"cards": list(range(1000))}),
+        payloads.response(payloads.reviews_of_cards(1000)),
+    ),
+}
+
+
+def available_codecs():
+    codecs = []
+    for name in ("json", "ujson", "orjson"):
+        try:
+            codecs.append(get_codec(name))
+        except ImportError:
+            print(f"{name} is not installed, skipping it")
+    return codecs
+
+
+def best_of(func, repeat):
+    number = 5
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    codecs = available_codecs()
+    print(f"default codec: {get_codec().name}\n")
+    print(f"{'payload':<18} {'codec':<7} {'size':>9} {'encode':>10} {'decode':>10}")
+    for case, (request, response) in CASES.items():
+        baseline = None
+        for codec in codecs:
+            data = codec.dumps(response)
+            encode = best_of(lambda: codec.dumps(request), args.repeat)
+            decode = best_of(lambda: codec.loads(data), args.repeat)
+            if baseline is None:
+                baseline = decode
+            print(
+                f"{case:<18} {codec.name:<7} {len(data):>9} "
+                f"{encode * 1e6:>8.1f}us {decode * 1e3:>8.2f}ms"
+                f"  ({baseline / decode:.1f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
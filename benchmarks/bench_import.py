@@ -0,0 +1,73 @@
+"""Measure the time `import anki_connect_api` takes with `python -X importtime`
+and check that the transport and JSON machinery are not loaded by it.
+
+    python benchmarks/bench_import.py [--runs N] [--max-ms MS]
+
+Exits with an error if a deferred module is imported or the import takes
+longer than --max-ms.
+"""
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).absolute().parent.parent
+
+# must only be loaded on the first request
+DEFERRED = (
+    "anki_connect_api.client", "anki_connect_api._transport", "http.client",
+    "urllib.request", "email", "ssl", "json",
+)
+
+
+def import_times():
+    """Return the (self, cumulative) microseconds of every module imported
+    by `import anki_connect_api`, in import order."""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import anki_connect_api"],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(own), int(cumulative))
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--max-ms", type=float,
+                        help="fail if the import takes longer than this")
+    parser.add_argument("--top", type=int, default=10,
+                        help="number of slowest modules to show")
+    args = parser.parse_args()
+
+    runs = [import_times() for _ in range(args.runs)]
+    best = min(runs, key=lambda times: times["anki_connect_api"][1])
+    total = best["anki_connect_api"][1] / 1e3
+    print(f"import anki_connect_api: {total:.1f}ms (best of {args.runs})\n")
+    print(f"{'module':<40} {'self':>9} {'cumulative':>11}")
+    slowest = sorted(best.items(), key=lambda item: -item[1][0])[:args.top]
+    for name, (own, cumulative) in slowest:
+        print(f"{name:<40} {own / 1e3:>7.1f}ms {cumulative / 1e3:>9.1f}ms")
+
+    failed = False
+    loaded = [
+        name for name in DEFERRED
+        if any(name in times for times in runs)
+    ]
+    if loaded:
+        print(f"\nimported too early: {', '.join(loaded)}")
+        failed = True
+    if args.max_ms is not None and total > args.max_ms:
+        print(f"\nimport takes longer than {args.max_ms}ms")
+        failed = True
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Compare the time and peak memory of media transfers with whole base64
+strings and with the streaming methods, against a stand-in server running
+in a separate process.
+
+    python benchmarks/bench_media.py [--size MB] [--port PORT]
+"""
+import argparse
+import base64
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).absolute().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import anki_connect_api as anki  # noqa: E402
+
+
+def upload_data(client, path):
+    with open(path, "rb") as f:
+        data = base64.b64encode(f.read()).decode("ascii")
+    return client.storeMediaFile("bench.bin", data=data)
+
+
+def upload_streamed(client, path):
+    return client.storeMediaFileFrom("bench.bin", path)
+
+
+def download_data(client, path):
+    data = base64.b64decode(client.retrieveMediaFile("bench.bin"))
+    with open(path + ".copy", "wb") as f:
+        f.write(data)
+
+
+def download_streamed(client, path):
+    client.retrieveMediaFileTo("bench.bin", path + ".copy")
+
+
+BENCHMARKS = {
+    "storeMediaFile(data=...)": upload_data,
+    "storeMediaFileFrom": upload_streamed,
+    "retrieveMediaFile": download_data,
+    "retrieveMediaFileTo": download_streamed,
+}
+
+
+def measure(func, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        func(*args)
+        return time.perf_counter() - start, tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def wait_for(port, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            socket.create_connection(("127.0.0.1", port), 0.1).close()
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.05)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=100,
+                        help="size of the media file in MB")
+    parser.add_argument("--port", type=int, default=18765)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "source.bin")
+        with open(path, "wb") as f:
+            for _ in range(args.size):
+                f.write(os.urandom(1 << 20))
+        media_dir = os.path.join(directory, "media")
+        os.mkdir(media_dir)
+        server = subprocess.Popen(
+            [sys.executable, "-m", "anki_connect_api.standin",
+             "--port", str(args.port), "--media-dir", media_dir],
+            cwd=ROOT, stdout=subprocess.DEVNULL,
+        )
+        try:
+            wait_for(args.port)
+            url = f"http://127.0.0.1:{args.port}"
+            print(f"{'benchmark':<28} {'seconds':>8} {'MB/s':>8} "
+                  f"{'peak memory':>12}")
+            with anki.AnkiClient(url) as client:
+                for name, func in BENCHMARKS.items():
+                    seconds, peak = measure(func, client, path)
+                    print(f"{name:<28} {seconds:>8.2f} "
+                          f"{args.size / seconds:>8.1f} "
+                          f"{peak / 1e6:>10.1f}MB")
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
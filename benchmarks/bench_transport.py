@@ -0,0 +1,91 @@
+"""Compare the pooled keep-alive transport with a fresh urllib connection per
+call, both against a local HTTP/1.1 server that answers like Anki-Connect.
+
+    python benchmarks/bench_transport.py [--calls N] [--threads N]
+"""
+import argparse
+import http.server
+import json
+import sys
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).absolute().parent.parent))
+
+import anki_connect_api as anki  # noqa: E402
+
+RESPONSE = json.dumps({"result": [False, True, None], "error": None}).encode()
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(RESPONSE)))
+        self.end_headers()
+        self.wfile.write(RESPONSE)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def urlopen_invoke(url, action, **params):
+    """The transport used before the connection pool was introduced."""
+    body = json.dumps(
+        {"action": action, "version": 6, "params": params}
+    ).encode("utf-8")
+    return json.load(urllib.request.urlopen(urllib.request.Request(url, body)))
+
+
+def run(func, calls, threads):
+    cards = [1483959291685, 1483959293217, 1234567891234]
+    start = time.perf_counter()
+    if threads == 1:
+        for _ in range(calls):
+            func(cards)
+    else:
+        with ThreadPoolExecutor(threads) as executor:
+            list(executor.map(func, [cards] * calls))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=1)
+    args = parser.parse_args()
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    anki.URL = url
+    anki.POOL_SIZE = max(args.threads, 1)
+
+    candidates = (
+        ("urlopen", lambda cards: urlopen_invoke(url, "areSuspended", cards=cards)),
+        ("pool", anki.areSuspended),
+    )
+    results = {}
+    for name, func in candidates:
+        func([1])  # warm up
+        elapsed = run(func, args.calls, args.threads)
+        results[name] = elapsed
+        print(
+            f"{name:>8}: {args.calls} calls in {elapsed:.3f}s, "
+            f"{1e6 * elapsed / args.calls:.1f} us/call, "
+            f"{args.calls / elapsed:.0f} calls/s"
+        )
+    print(f" speedup: {results['urlopen'] / results['pool']:.2f}x")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
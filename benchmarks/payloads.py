@@ -0,0 +1,154 @@
+"""Synthetic responses shaped like the ones Anki-Connect returns for real
+collections, used by the benchmarks."""
+import random
+
+CSS = (
+    ".card {\n    font-family: arial;\n    font-size: 20px;\n"
+    "    text-align: center;\n    color: black;\n"
+    "    background-color: white;\n}\n"
+)
+LATEX_PRE = (
+    "\\documentclass[12pt]{article}\n\\special{papersize=3in,5in}\n"
+    "\\usepackage[utf8]{inputenc}\n\\usepackage{amssymb,amsmath}\n"
+    "\\pagestyle{empty}\n\\setlength{\\parindent}{0in}\n\\begin{document}\n"
+)
+WORDS = (
+    "Hauptstadt", "Rumänien", "Bukarest", "東京", "日本の首都", "capital",
+    "<b>bold</b>", "<img src=\"romania.png\">", "[sound:word.mp3]", "naïve",
+)
+
+
+def _text(rng, words=8):
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def _fields(rng):
+    return {
+        "Front": {"value": _text(rng, 4), "order": 0},
+        "Back": {"value": _text(rng, 12), "order": 1},
+    }
+
+
+def cards_info(count=1000, seed=0):
+    rng = random.Random(seed)
+    result = []
+    for i in range(count):
+        card_id = 1498938915662 + i
+        fields = _fields(rng)
+        result.append({
+            "answer": f"<style>{CSS}</style>{fields['Back']['value']}",
+            "question": f"<style>{CSS}</style>{fields['Front']['value']}",
+            "deckName": "Japanese::JLPT N3",
+            "modelName": "Basic",
+            "fieldOrder": 0,
+            "fields": fields,
+            "css": CSS,
+            "cardId": card_id,
+            "interval": rng.randint(-1200, 400),
+            "note": card_id - 20,
+            "ord": 0,
+            "type": rng.randint(0, 3),
+            "queue": rng.randint(-1, 3),
+            "due": rng.randint(0, 20000),
+            "reps": rng.randint(0, 50),
+            "lapses": rng.randint(0, 10),
+            "left": rng.randint(0, 1000),
+            "mod": 1629454092 + i,
+        })
+    return result
+
+
+def notes_info(count=1000, seed=0):
+    rng = random.Random(seed)
+    return [
+        {
+            "noteId": 1502298033753 + i,
+            "modelName": "Basic",
+            "tags": rng.sample(["jlpt", "n3", "verbs", "leech", "marked"], 2),
+            "fields": _fields(rng),
+            "cards": [1498938915662 + i],
+        }
+        for i in range(count)
+    ]
+
+
+def _model(model_id, name, templates):
+    return {
+        "id": model_id,
+        "name": name,
+        "type": 0,
+        "mod": 1704387367,
+        "usn": -1,
+        "sortf": 0,
+        "did": None,
+        "tmpls": [
+            {
+                "name": f"Card {i + 1}",
+                "ord": i,
+                "qfmt": "{{Front}}",
+                "afmt": "{{FrontSide}}\n\n<hr id=answer>\n\n{{Back}}",
+                "bqfmt": "",
+                "bafmt": "",
+                "did": None,
+                "bfont": "",
+                "bsize": 0,
+                "id": 9176047152973362695 - i,
+            }
+            for i in range(templates)
+        ],
+        "flds": [
+            {
+                "name": field,
+                "ord": i,
+                "sticky": False,
+                "rtl": False,
+                "font": "Arial",
+                "size": 20,
+                "description": "",
+                "plainText": False,
+                "collapsed": False,
+                "excludeFromSearch": False,
+                "id": 2453723143453745216 - i,
+                "tag": None,
+                "preventDeletion": False,
+            }
+            for i, field in enumerate(("Front", "Back", "Extra"))
+        ],
+        "css": CSS,
+        "latexPre": LATEX_PRE,
+        "latexPost": "\\end{document}",
+        "latexsvg": False,
+        "req": [[i, "any", [i]] for i in range(templates)],
+        "originalStockKind": 1,
+    }
+
+
+def find_models(count=50):
+    return [
+        _model(1704387367119 + i, f"Model {i}", 1 + i % 3)
+        for i in range(count)
+    ]
+
+
+def reviews_of_cards(count=1000, reviews=10, seed=0):
+    rng = random.Random(seed)
+    return {
+        str(1653613948202 + i): [
+            {
+                "id": 1653772912146 + j,
+                "usn": 1750,
+                "ease": rng.randint(1, 4),
+                "ivl": rng.randint(-1200, 400),
+                "lastIvl": rng.randint(-1200, 400),
+                "factor": rng.choice((0, 2500, 2650)),
+                "time": rng.randint(1000, 60000),
+                "type": rng.randint(0, 3),
+            }
+            for j in range(reviews)
+        ]
+        for i in range(count)
+    }
+
+
+def response(result):
+    return {"result": result, "error": None}
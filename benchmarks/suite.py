@@ -0,0 +1,176 @@
+"""Micro-benchmarks of the client hot path against the in-memory stand-in.
+
+    python benchmarks/suite.py [--save results.json] [--compare baseline.json]
+                               [--threshold 0.15] [--repeat N] [-k PATTERN]
+
+Every benchmark reports the best time per operation of several runs. With
+--compare the run fails if a benchmark got slower by more than the
+threshold compared to a saved run.
+"""
+import argparse
+import fnmatch
+import json
+import platform
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).absolute().parent.parent))
+
+import payloads  # noqa: E402
+import anki_connect_api as anki  # noqa: E402
+from anki_connect_api._chunking import merge, split  # noqa: E402
+from anki_connect_api._codec import get_codec  # noqa: E402
+from anki_connect_api._protocol import encode_request  # noqa: E402
+from anki_connect_api.standin import Collection, StandIn  # noqa: E402
+
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    def register(func):
+        BENCHMARKS[name] = func
+        return func
+    return register
+
+
+def codec_benchmarks(name, action, params, result):
+    codec = get_codec()
+    data = codec.dumps(payloads.response(result))
+
+    @benchmark(f"encode/{name}")
+    def encode(client):
+        return lambda: encode_request(action, params, None, codec)
+
+    @benchmark(f"decode/{name}")
+    def decode(client):
+        return lambda: codec.loads(data)
+
+
+codec_benchmarks(
+    "cardsInfo", "cardsInfo", {"cards": list(range(1000))},
+    payloads.cards_info(1000),
+)
+codec_benchmarks(
+    "notesInfo", "notesInfo", {"notes": list(range(1000))},
+    payloads.notes_info(1000),
+)
+codec_benchmarks(
+    "findModelsById", "findModelsById", {"modelIds": list(range(50))},
+    payloads.find_models(50),
+)
+
+
+@benchmark("invoke/version")
+def invoke_version(client):
+    return client.version
+
+
+@benchmark("invoke/cardsInfo-100")
+def invoke_cards_info(client):
+    cards = client.findCards(query="deck:*")[:100]
+    return lambda: client.cardsInfo(cards)
+
+
+@benchmark("multi/20-actions")
+def multi(client):
+    actions = [{"action": "deckNames"}] * 20
+    return lambda: client.multi(actions)
+
+
+@benchmark("multi/20-single-calls")
+def single_calls(client):
+    def run():
+        for _ in range(20):
+            client.deckNames()
+    return run
+
+
+@benchmark("chunking/split-merge-100k")
+def split_merge(client):
+    params = {"cards": list(range(100000))}
+    results = [[False] * 1000] * 100
+
+    def run():
+        split("areSuspended", params, 1000)
+        merge("areSuspended", results)
+    return run
+
+
+@benchmark("chunking/cardsModTime-20k")
+def chunked_invoke(client):
+    cards = client.findCards(query="deck:*")[:20000]
+    chunked = anki.AnkiClient(client.url, chunk_size=2000)
+    return lambda: chunked.cardsModTime(cards)
+
+
+def measure(func, repeat):
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat, number)) / number
+
+
+def run(pattern, repeat):
+    results = {}
+    with StandIn(Collection(100000)).start() as server:
+        with anki.AnkiClient(server.url) as client:
+            for name, setup in BENCHMARKS.items():
+                if not fnmatch.fnmatch(name, pattern):
+                    continue
+                seconds = measure(setup(client), repeat)
+                results[name] = seconds
+                print(f"{name:<32} {seconds * 1e6:>12.1f}us")
+    return {
+        "version": anki.__version__,
+        "python": platform.python_version(),
+        "codec": get_codec().name,
+        "results": results,
+    }
+
+
+def compare(run, baseline, threshold):
+    """Print the change of every benchmark and return the regressions."""
+    regressions = []
+    print(f"\n{'benchmark':<32} {'baseline':>12} {'current':>12} "
+          f"{'change':>8}")
+    for name, seconds in run["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            continue
+        change = seconds / before - 1
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(
+            f"{name:<32} {before * 1e6:>10.1f}us {seconds * 1e6:>10.1f}us "
+            f"{change:>+8.1%}{flag}"
+        )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--save", help="write the results to this file")
+    parser.add_argument("--compare", help="results of a previous run")
+    parser.add_argument("--threshold", type=float, default=0.15,
+                        help="allowed slowdown, 0.15 is 15%%")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("-k", dest="pattern", default="*",
+                        help="only run benchmarks matching this pattern")
+    args = parser.parse_args()
+
+    result = run(args.pattern, args.repeat)
+    if args.save:
+        Path(args.save).write_text(json.dumps(result, indent=2) + "\n")
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        regressions = compare(result, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} benchmark(s) regressed by more than "
+                  f"{args.threshold:.0%}: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+import pytest
+
+from anki_connect_api.client import AnkiClient
+from anki_connect_api.standin import Collection, StandIn
+
+
+@pytest.fixture
+def server(tmp_path):
+    """Stand-in server with a collection of 1000 notes."""
+    media_dir = tmp_path / 'collection.media'
+    media_dir.mkdir()
+    collection = Collection(1000, media_dir=str(media_dir))
+    with StandIn(collection).start() as server:
+        yield server
+
+
+@pytest.fixture
+def client(server):
+    with AnkiClient(server.url) as client:
+        yield client
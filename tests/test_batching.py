@@ -0,0 +1,100 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from anki_connect_api._aiobatching import AsyncBatcher
+from anki_connect_api._batching import Batcher
+
+
+class Server:
+    """Stands in for `_request`: answers `echo` with its param `x` and
+    fails `bad`, also inside of `multi`."""
+
+    def __init__(self):
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def execute(self, action, params):
+        if action == 'bad':
+            raise Exception('boom')
+        return params.get('x')
+
+    def invoke(self, action, **params):
+        with self._lock:
+            self.requests.append(action)
+        if action != 'multi':
+            return self.execute(action, params)
+        responses = []
+        for request in params['actions']:
+            try:
+                result = self.execute(request['action'], request['params'])
+                responses.append({'result': result, 'error': None})
+            except Exception as e:
+                responses.append({'result': None, 'error': str(e)})
+        return responses
+
+    async def ainvoke(self, action, **params):
+        await asyncio.sleep(0)
+        return self.invoke(action, **params)
+
+
+def call(batcher, i):
+    if i % 10 == 0:
+        with pytest.raises(Exception, match='boom'):
+            batcher.submit('bad', {})
+        return 'boom'
+    return batcher.submit('echo', {'x': i})
+
+
+def test_batcher_coalesces_calls_from_threads():
+    server = Server()
+    batcher = Batcher(server.invoke, window=0.01, max_size=16)
+    with ThreadPoolExecutor(32) as executor:
+        results = list(executor.map(lambda i: call(batcher, i), range(500)))
+    assert results == [i if i % 10 else 'boom' for i in range(500)]
+    assert len(server.requests) < 500
+    assert 'multi' in server.requests
+
+
+def test_batcher_sends_a_single_call_as_is():
+    server = Server()
+    batcher = Batcher(server.invoke, window=0.001)
+    assert batcher.submit('echo', {'x': 1}) == 1
+    assert server.requests == ['echo']
+
+
+def test_batcher_fails_all_calls_if_multi_fails():
+    def invoke(action, **params):
+        raise Exception('down')
+
+    batcher = Batcher(invoke, window=0.01)
+    with ThreadPoolExecutor(4) as executor:
+        futures = [
+            executor.submit(batcher.submit, 'echo', {'x': i})
+            for i in range(4)
+        ]
+    for future in futures:
+        with pytest.raises(Exception, match='down'):
+            future.result()
+
+
+def test_async_batcher_coalesces_calls_from_tasks():
+    server = Server()
+
+    async def main():
+        batcher = AsyncBatcher(server.ainvoke, window=0.002, max_size=64)
+
+        async def call(i):
+            action = 'bad' if i % 10 == 0 else 'echo'
+            try:
+                return await batcher.submit(action, {'x': i})
+            except Exception as e:
+                return str(e)
+
+        return await asyncio.gather(*map(call, range(500)))
+
+    results = asyncio.run(main())
+    assert results == [i if i % 10 else 'boom' for i in range(500)]
+    assert len(server.requests) <= 500 // 64 + 1
@@ -0,0 +1,129 @@
+import asyncio
+
+import pytest
+
+from anki_connect_api import MetadataCache, QueryCache
+from anki_connect_api._cache import affects, normalize_query, run
+from anki_connect_api.aio import AsyncAnkiClient
+from anki_connect_api.client import AnkiClient
+
+
+@pytest.mark.parametrize('query, expected', [
+    ('  deck:X   is:due ', 'deck:X is:due'),
+    ('"a   b"  c', '"a   b" c'),
+    ("'x  y'\tz", "'x  y' z"),
+    (r'a\  b', r'a\  b'),
+    (r'"a\"  b"   c', r'"a\"  b" c'),
+])
+def test_normalize_query(query, expected):
+    assert normalize_query(query) == expected
+
+
+def test_affects_looks_into_multi():
+    writes = {'createDeck'}
+    assert affects('createDeck', {}, writes)
+    assert not affects('deckNames', {}, writes)
+    assert affects('multi', {'actions': [
+        {'action': 'deckNames'}, {'action': 'createDeck', 'params': {}},
+    ]}, writes)
+    assert not affects('multi', {'actions': [{'action': 'version'}]}, writes)
+
+
+def test_run_passes_errors_into_the_handler():
+    def handle():
+        try:
+            yield 'version', {}
+        except Exception as e:
+            return str(e)
+
+    def send(action, params):
+        raise Exception('boom')
+
+    assert run(handle(), send) == 'boom'
+
+
+def test_metadata_cache(server):
+    cache = MetadataCache()
+    client = AnkiClient(server.url, caches=[cache])
+    sent = server.requests
+    names = client.deckNames()
+    names.append('changed by the caller')
+    assert client.deckNames() == names[:-1]
+    assert server.requests - sent == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+    client.createDeck('New')
+    assert 'New' in client.deckNames()
+    client.multi([{'action': 'createDeck', 'params': {'deck': 'Other'}}])
+    assert 'Other' in client.deckNames()
+    assert cache.misses == 3
+
+
+def test_metadata_cache_expires(server, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr('time.monotonic', lambda: now[0])
+    cache = MetadataCache(ttl=10)
+    client = AnkiClient(server.url, caches=[cache])
+    client.deckNames()
+    now[0] += 5
+    client.deckNames()
+    now[0] += 10
+    client.deckNames()
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_errors_are_not_cached(server):
+    cache = MetadataCache(actions=['nope'])
+    client = AnkiClient(server.url, caches=[cache])
+    for _ in range(2):
+        with pytest.raises(Exception, match='unsupported action'):
+            client.invoke('nope')
+    assert cache.hits == 0
+
+
+def test_query_cache(server):
+    cache = QueryCache()
+    client = AnkiClient(server.url, caches=[cache])
+    cards = client.findCards(query='deck:Spanish  tag:jlpt')
+    assert client.findCards(query=' deck:Spanish tag:jlpt') == cards
+    assert (cache.hits, cache.misses) == (1, 1)
+    notes = client.findNotes(query='deck:Spanish')
+    client.addNotes([{
+        'deckName': 'Spanish', 'modelName': 'Basic',
+        'fields': {'Front': 'new', 'Back': ''}, 'tags': [],
+    }])
+    assert len(client.findNotes(query='deck:Spanish')) == len(notes) + 1
+
+
+def test_caches_work_with_the_async_client(server):
+    cache = QueryCache()
+
+    async def main():
+        async with AsyncAnkiClient(server.url, caches=[cache]) as client:
+            first = await client.findCards(query='deck:Spanish')
+            assert await client.findCards(query='deck:Spanish') == first
+
+    asyncio.run(main())
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_expired_entries_are_dropped(server, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr('time.monotonic', lambda: now[0])
+    cache = MetadataCache(ttl=10)
+    client = AnkiClient(server.url, caches=[cache])
+    client.deckNames()
+    client.modelNames()
+    now[0] += 20
+    client.deckNamesAndIds()
+    assert len(cache) == 1
+
+
+def test_max_entries(server):
+    cache = QueryCache(max_entries=2)
+    client = AnkiClient(server.url, caches=[cache])
+    for query in ('deck:Spanish', 'deck:Default', 'tag:jlpt'):
+        client.findCards(query=query)
+    assert len(cache) == 2
+    client.findCards(query='tag:jlpt')
+    client.findCards(query='deck:Spanish')
+    assert (cache.hits, cache.misses) == (1, 4)
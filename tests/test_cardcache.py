@@ -0,0 +1,202 @@
+import datetime
+import json
+import time
+
+import pytest
+
+from anki_connect_api import CardCache, NoteCache, SQLiteStore
+from anki_connect_api._cardcache import NOTE_WRITES
+from anki_connect_api.client import AnkiClient
+
+NOTE = 1502298033753
+
+# params of a call of every action in NOTE_WRITES changing NOTE
+WRITES = {
+    'updateNoteFields': {'note': {'id': NOTE, 'fields': {'Front': 'x'}}},
+    'updateNote': {'note': {'id': NOTE, 'fields': {}, 'tags': ['x']}},
+    'updateNoteModel': {'note': {
+        'id': NOTE, 'modelName': 'Basic', 'fields': {}, 'tags': [],
+    }},
+    'updateNoteTags': {'note': NOTE, 'tags': ['x']},
+    'addTags': {'notes': [NOTE], 'tags': 'x'},
+    'removeTags': {'notes': [NOTE], 'tags': 'x'},
+    'replaceTags': {
+        'notes': [NOTE], 'tag_to_replace': 'x', 'replace_with_tag': 'y',
+    },
+    'deleteNotes': {'notes': [NOTE]},
+}
+
+
+class Transport:
+    """Answers notesInfo, cardsInfo and cardsModTime for NOTE and its
+    card 1, and every other action with null."""
+
+    def request(self, body):
+        request = json.loads(body)
+        action, params = request['action'], request.get('params', {})
+        result = None
+        if action == 'notesInfo':
+            result = [{'noteId': id_, 'cards': [1]} for id_ in params['notes']]
+        elif action == 'cardsInfo':
+            result = [
+                {'cardId': id_, 'note': NOTE, 'mod': 1}
+                for id_ in params['cards']
+            ]
+        elif action == 'cardsModTime':
+            result = [{'cardId': id_, 'mod': 1} for id_ in params['cards']]
+        return json.dumps({'result': result, 'error': None}).encode()
+
+    def close(self):
+        pass
+
+
+def test_writes_cover_note_writes():
+    assert set(WRITES) == NOTE_WRITES
+
+
+@pytest.mark.parametrize('action', sorted(WRITES))
+def test_note_writes_drop_cached_records(action):
+    cards = CardCache()
+    notes = NoteCache()
+    client = AnkiClient(transport=Transport(), caches=[cards, notes])
+    client.cardsInfo(cards=[1])
+    client.notesInfo(notes=[NOTE])
+    client.invoke(action, **WRITES[action])
+    client.cardsInfo(cards=[1])
+    client.notesInfo(notes=[NOTE])
+    assert (cards.hits, cards.misses) == (0, 2)
+    assert (notes.hits, notes.misses) == (0, 2)
+
+
+def test_card_cache(server, client):
+    cache = CardCache()
+    cached = AnkiClient(server.url, caches=[cache])
+    cards = client.findCards(query='deck:*')[:100] + [42]
+    expected = client.cardsInfo(cards=cards)
+    assert cached.cardsInfo(cards=cards) == expected
+    assert cached.cardsInfo(cards=cards) == expected
+    assert (cache.hits, cache.misses) == (100, 102)
+    note = expected[5]['note']
+    cached.updateNoteFields(note={'id': note, 'fields': {'Front': 'edited'}})
+    assert cached.cardsInfo(cards=cards[5:6])[0]['fields']['Front'] == {
+        'value': 'edited', 'order': 0,
+    }
+
+
+def test_card_cache_with_deleted_cards(server, client):
+    cache = CardCache()
+    cached = AnkiClient(server.url, caches=[cache])
+    cards = client.findCards(query='deck:*')[:3]
+    cards.insert(1, 42)
+    assert client.cardsModTime(cards=cards)[1] == {}
+    expected = client.cardsInfo(cards=cards)
+    assert expected[1] == {}
+    assert cached.cardsInfo(cards=cards) == expected
+    assert cached.cardsInfo(cards=cards) == expected
+    assert cache.hits == 3
+
+
+def test_card_cache_evicts(server):
+    cache = CardCache(max_cards=50)
+    cached = AnkiClient(server.url, caches=[cache])
+    cards = cached.findCards(query='deck:*')[:200]
+    cached.cardsInfo(cards=cards)
+    assert len(cache.store) == 50
+    cached.cardsInfo(cards=cards[-50:])
+    assert cache.hits == 50
+
+
+def test_note_cache_notices_edits_in_anki(server, client):
+    cache = NoteCache(check_interval=0)
+    cached = AnkiClient(server.url, caches=[cache])
+    notes = client.findNotes(query='deck:*')[:20]
+    cached.notesInfo(notes=notes)
+    client.updateNoteFields(note={'id': notes[3], 'fields': {'Front': 'x'}})
+    infos = cached.notesInfo(notes=notes)
+    assert infos == client.notesInfo(notes=notes)
+    assert infos[3]['fields']['Front']['value'] == 'x'
+
+
+def test_note_cache_keeps_notes_without_mod(server, client):
+    cache = NoteCache()
+    cached = AnkiClient(server.url, caches=[cache])
+    notes = client.findNotes(query='deck:*')[:20]
+    assert 'mod' not in client.notesInfo(notes=notes[:1])[0]
+    expected = client.notesInfo(notes=notes + [42])
+    assert cached.notesInfo(notes=notes + [42]) == expected
+    assert cached.notesInfo(notes=notes + [42]) == expected
+    assert (cache.hits, cache.misses) == (20, 22)
+
+
+def test_note_cache_notices_edits_before_the_day_starts(
+    server, client, monkeypatch
+):
+    # a new day starts at 4:00 in Anki, so a search for edited:1 at 4:01
+    # doesn't find a note edited at 3:59
+    start = datetime.datetime.now().replace(
+        hour=3, minute=59, second=0, microsecond=0
+    ).timestamp()
+    now = [start]
+    monkeypatch.setattr(time, 'time', lambda: now[0])
+    cache = NoteCache(check_interval=60)
+    cached = AnkiClient(server.url, caches=[cache])
+    notes = client.findNotes(query='deck:*')[:5]
+    cached.notesInfo(notes=notes)
+    now[0] += 30
+    client.updateNoteFields(note={'id': notes[0], 'fields': {'Front': 'x'}})
+    now[0] += 90
+    assert client.findNotes(query='edited:1') == []
+    assert cached.notesInfo(notes=notes) == client.notesInfo(notes=notes)
+
+
+def test_sqlite_store_survives_restarts(server, client, tmp_path):
+    path = str(tmp_path / 'cache.sqlite')
+    cards = client.findCards(query='deck:*')[:30]
+    first = CardCache(store=SQLiteStore(path, 'cards'))
+    AnkiClient(server.url, caches=[first]).cardsInfo(cards=cards)
+    second = CardCache(store=SQLiteStore(path, 'cards'))
+    infos = AnkiClient(server.url, caches=[second]).cardsInfo(cards=cards)
+    assert infos == client.cardsInfo(cards=cards)
+    assert (second.hits, second.misses) == (30, 0)
+
+
+@pytest.mark.parametrize('action, params', [
+    ('createDeck', {'deck': 'New'}),
+    ('saveDeckConfig', {'config': {'id': 1}}),
+    ('setDeckConfigId', {'decks': ['Default'], 'configId': 1}),
+    ('createModel', {'modelName': 'New', 'inOrderFields': ['Front']}),
+])
+def test_deck_writes_and_new_models_keep_cached_records(action, params):
+    cache = CardCache()
+    client = AnkiClient(transport=Transport(), caches=[cache])
+    client.cardsInfo(cards=[1, 2])
+    client.invoke(action, **params)
+    client.cardsInfo(cards=[1, 2])
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+@pytest.mark.parametrize('store', ['memory', 'sqlite'])
+def test_change_deck_drops_moved_cards(store, tmp_path):
+    if store == 'sqlite':
+        cache = CardCache(store=SQLiteStore(str(tmp_path / 'cache.sqlite')))
+    else:
+        cache = CardCache()
+    client = AnkiClient(transport=Transport(), caches=[cache])
+    client.cardsInfo(cards=[1, 2, 3])
+    client.changeDeck(cards=[2], deck='Other')
+    client.multi(actions=[
+        {'action': 'changeDeck', 'params': {'cards': [3], 'deck': 'Other'}},
+    ])
+    client.cardsInfo(cards=[1, 2, 3])
+    assert (cache.hits, cache.misses) == (1, 5)
+
+
+def test_model_writes_drop_all_cached_records():
+    cache = CardCache()
+    client = AnkiClient(transport=Transport(), caches=[cache])
+    client.cardsInfo(cards=[1, 2])
+    client.modelFieldRename(
+        modelName='Basic', oldFieldName='Front', newFieldName='Question',
+    )
+    client.cardsInfo(cards=[1, 2])
+    assert (cache.hits, cache.misses) == (0, 4)
@@ -0,0 +1,106 @@
+import asyncio
+import gzip
+import json
+
+import pytest
+
+from anki_connect_api import ReplayTransport
+from anki_connect_api._cassette import request_hash
+from anki_connect_api.aio import AsyncAnkiClient, AsyncReplayTransport
+from anki_connect_api.client import AnkiClient
+
+
+def record(server, path):
+    """Record a short session against the stand-in server at `path` and
+    return its results."""
+    with AnkiClient(server.url, key='secret', record=path) as client:
+        cards = client.findCards(query='deck:Spanish')[:3]
+        return [
+            client.deckNames(), cards, client.cardsInfo(cards=cards),
+            client.deckNames(),
+        ]
+
+
+def replay(client):
+    cards = client.findCards(query='deck:Spanish')[:3]
+    return [
+        client.deckNames(), cards, client.cardsInfo(cards=cards),
+        client.deckNames(),
+    ]
+
+
+def test_replay_in_sequence(server, tmp_path):
+    path = tmp_path / 'session.jsonl'
+    expected = record(server, path)
+    client = AnkiClient(transport=ReplayTransport(path))
+    assert replay(client) == expected
+    with pytest.raises(Exception, match='cassette exhausted'):
+        client.deckNames()
+
+
+def test_replay_in_sequence_checks_the_action(server, tmp_path):
+    path = tmp_path / 'session.jsonl'
+    record(server, path)
+    client = AnkiClient(transport=ReplayTransport(path))
+    with pytest.raises(Exception, match='expected findCards at position 0'):
+        client.deckNames()
+
+
+def test_replay_by_hash(server, tmp_path):
+    path = tmp_path / 'session.jsonl'
+    expected = record(server, path)
+    client = AnkiClient(transport=ReplayTransport(path, match='hash'))
+    assert replay(client) == expected
+    # the last recorded response repeats
+    assert client.deckNames() == expected[0]
+    assert client.findCards(query='deck:Spanish')[:3] == expected[1]
+    with pytest.raises(Exception, match='no recorded response for version'):
+        client.version()
+
+
+def test_cassette_format(server, tmp_path):
+    path = tmp_path / 'session.jsonl.gz'
+    record(server, path)
+    assert path.read_bytes()[:2] == b'\x1f\x8b'
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        text = f.read()
+    assert 'secret' not in text
+    entries = [json.loads(line) for line in text.splitlines()]
+    assert [entry['action'] for entry in entries] == [
+        'findCards', 'deckNames', 'cardsInfo', 'deckNames',
+    ]
+    assert entries[0]['params'] == {'query': 'deck:Spanish'}
+    assert entries[0]['hash'] == request_hash(
+        'findCards', {'query': 'deck:Spanish'}
+    )
+    assert all(entry['seconds'] >= 0 for entry in entries)
+    assert json.loads(entries[1]['response'])['error'] is None
+
+
+def test_replay_latency(server, tmp_path, monkeypatch):
+    path = tmp_path / 'session.jsonl'
+    record(server, path)
+    slept = []
+    monkeypatch.setattr('time.sleep', slept.append)
+    replay(AnkiClient(transport=ReplayTransport(path)))
+    assert slept == []
+    transport = ReplayTransport(path, latency=True)
+    replay(AnkiClient(transport=transport))
+    assert slept == [entry['seconds'] for entry in transport.entries]
+
+
+def test_async_replay(server, tmp_path):
+    path = tmp_path / 'session.jsonl.gz'
+    expected = record(server, path)
+    transport = AsyncReplayTransport(path, latency=True)
+
+    async def main():
+        async with AsyncAnkiClient(transport=transport) as client:
+            cards = (await client.findCards(query='deck:Spanish'))[:3]
+            return [
+                await client.deckNames(), cards,
+                await client.cardsInfo(cards=cards),
+                await client.deckNames(),
+            ]
+
+    assert asyncio.run(main()) == expected
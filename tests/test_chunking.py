@@ -0,0 +1,206 @@
+import asyncio
+import json
+import random
+
+import pytest
+
+from anki_connect_api import AdaptiveChunkSize
+from anki_connect_api._chunking import count, merge, size_for, split
+from anki_connect_api.aio import AsyncAnkiClient
+from anki_connect_api.client import AnkiClient
+
+
+def test_split():
+    chunks = split('cardsInfo', {'cards': list(range(7))}, 3)
+    assert chunks == [
+        {'cards': [0, 1, 2]}, {'cards': [3, 4, 5]}, {'cards': [6]},
+    ]
+    assert split('cardsInfo', {'cards': [1, 2]}, 3) is None
+    assert split('cardsInfo', {'cards': [1, 2]}, None) is None
+    assert split('deckNames', {}, 3) is None
+    params = {
+        'notes': [1, 2, 3], 'tag_to_replace': 'a', 'replace_with_tag': 'b',
+    }
+    assert split('replaceTags', params, 2) == [
+        {**params, 'notes': [1, 2]}, {**params, 'notes': [3]},
+    ]
+
+
+def test_split_parallel_lists():
+    chunks = split(
+        'setEaseFactors', {'cards': [1, 2, 3], 'easeFactors': [4, 5, 6]}, 2
+    )
+    assert chunks == [
+        {'cards': [1, 2], 'easeFactors': [4, 5]},
+        {'cards': [3], 'easeFactors': [6]},
+    ]
+    with pytest.raises(Exception, match='differ in length'):
+        split('setEaseFactors', {'cards': [1, 2, 3], 'easeFactors': [4]}, 2)
+
+
+@pytest.mark.parametrize('action, results, expected', [
+    ('cardsInfo', [[1, 2], [3]], [1, 2, 3]),
+    ('cardsToNotes', [[1, 2], [2, 3]], [1, 2, 3]),
+    ('suspend', [False, True], True),
+    ('setDeckConfigId', [True, False], False),
+    ('getDeckStats', [{'1': 'a'}, {'2': 'b'}], {'1': 'a', '2': 'b'}),
+    ('getDecks', [{'A': [1]}, {'A': [2], 'B': [3]}], {'A': [1, 2], 'B': [3]}),
+    ('deleteNotes', [None, None], None),
+    ('replaceTags', [None, None], None),
+])
+def test_merge(action, results, expected):
+    assert merge(action, results) == expected
+
+
+def test_size_for_and_count():
+    assert size_for(5, 'cardsInfo') == 5
+    assert size_for({'cardsInfo': 5, None: 9}, 'cardsInfo') == 5
+    assert size_for({'cardsInfo': 5, None: 9}, 'notesInfo') == 9
+    assert size_for({'cardsInfo': 5}, 'notesInfo') is None
+    assert count('cardsInfo', {'cards': [1, 2]}) == 2
+    assert count('deckNames', {}) is None
+
+
+def test_client_merges_chunks_in_order(server, client):
+    cards = client.findCards(query='deck:*')[:250]
+    expected = client.cardsInfo(cards=cards)
+    sent = server.requests
+    chunked = AnkiClient(server.url, chunk_size=100, chunk_workers=3)
+    assert chunked.cardsInfo(cards=cards) == expected
+    assert server.requests - sent == 3
+
+
+def test_async_client_merges_chunks_in_order(server, client):
+    cards = client.findCards(query='deck:*')[:95]
+    expected = client.cardsInfo(cards=cards)
+
+    async def main():
+        async with AsyncAnkiClient(
+            server.url, chunk_size=10, chunk_workers=3
+        ) as chunked:
+            return await chunked.cardsInfo(cards=cards)
+
+    assert asyncio.run(main()) == expected
+
+
+def test_adaptive_chunk_size_records_chunks(server, client):
+    tuner = AdaptiveChunkSize()
+    chunked = AnkiClient(server.url, chunk_size=tuner)
+    cards = client.findCards(query='deck:*')
+    sent = server.requests
+    assert chunked.cardsInfo(cards=cards) == client.cardsInfo(cards=cards)
+    state = tuner.state()['cardsInfo']
+    # the request of the comparison isn't chunked
+    recorded = sum(stats[2] for stats in state['buckets'].values())
+    assert recorded == server.requests - sent - 1
+
+
+def tune(tuner, latency, requests=60, action='cardsInfo'):
+    """Send `requests` requests of the size chosen by `tuner`, taking
+    `latency(size)` seconds, and return the sizes."""
+    sizes = []
+    for _ in range(requests):
+        size = tuner.size_for(action)
+        sizes.append(size)
+        tuner.record(action, size, latency(size))
+    return sizes
+
+
+def test_adaptive_chunk_size_grows_up_to_the_latency_ceiling():
+    # throughput keeps growing with the size, the ceiling limits it
+    def latency(size):
+        return 0.02 + 0.0005 * size
+
+    sizes = tune(AdaptiveChunkSize(max_latency=0.25), latency)
+    assert len(set(sizes[-20:])) == 1
+    assert max(latency(size) for size in sizes) <= 0.25
+    # the largest size below the ceiling is 460
+    assert sizes[-1] > 0.8 * 460
+
+
+def test_adaptive_chunk_size_finds_the_best_throughput():
+    # throughput peaks at 316 items, far below the ceiling
+    def latency(size):
+        return 0.01 + 1e-4 * size + 1e-7 * size ** 2
+
+    sizes = tune(AdaptiveChunkSize(max_latency=0.5), latency)
+    assert len(set(sizes[-20:])) == 1
+    best = 316 / latency(316)
+    assert sizes[-1] / latency(sizes[-1]) > 0.9 * best
+
+
+def test_adaptive_chunk_size_converges_with_noise():
+    rng = random.Random(1)
+
+    def latency(size):
+        return (0.02 + 0.0005 * size) * rng.uniform(0.8, 1.2)
+
+    sizes = tune(AdaptiveChunkSize(max_latency=0.25), latency, requests=200)
+    settled = sizes[-50:]
+    assert max(settled) <= 1.1 * min(settled)
+    assert all(0.02 + 0.0005 * size <= 0.25 for size in settled)
+
+
+def test_adaptive_chunk_size_shrinks_when_anki_slows_down():
+    tuner = AdaptiveChunkSize(max_latency=0.25)
+    fast = tune(tuner, lambda size: 0.0002 * size)
+    sizes = tune(tuner, lambda size: 0.002 * size)
+    assert sizes[-1] < fast[-1]
+    assert 0.002 * sizes[-1] <= 0.25
+
+
+@pytest.mark.parametrize('latency', [
+    lambda size: 0.0001 * size,
+    lambda size: 1.0 + size,
+])
+def test_adaptive_chunk_size_stays_in_bounds(latency):
+    tuner = AdaptiveChunkSize(
+        initial_size=100, min_size=20, max_size=64, max_latency=0.1
+    )
+    sizes = tune(tuner, latency)
+    assert all(20 <= size <= 64 for size in sizes)
+
+
+def test_adaptive_chunk_size_state_round_trips():
+    tuner = AdaptiveChunkSize(max_latency=0.25)
+    tune(tuner, lambda size: 0.02 + 0.0005 * size)
+    tune(tuner, lambda size: 0.001 * size, action='notesInfo')
+    state = json.loads(json.dumps(tuner.state()))
+    assert state == tuner.state()
+    restored = AdaptiveChunkSize(max_latency=0.25, state=state)
+    assert restored.state() == state
+    for action in ('cardsInfo', 'notesInfo'):
+        assert restored.size_for(action) == tuner.size_for(action)
+    # going on from the state, it stays where it was
+    size = tuner.size_for('cardsInfo')
+    assert tune(restored, lambda size: 0.02 + 0.0005 * size)[-1] == size
+    # sizes are clamped to the bounds of the new instance
+    bounded = AdaptiveChunkSize(max_size=64)
+    bounded.load_state(state)
+    assert bounded.size_for('cardsInfo') == 64
+
+
+def test_chunks_are_not_batched(server, client):
+    cards = client.findCards(query='deck:*')[:250]
+    expected = client.cardsInfo(cards=cards)
+    chunked = AnkiClient(
+        server.url, chunk_size=100, chunk_workers=3, batch_window=0.05
+    )
+    sent = server.requests
+    assert chunked.cardsInfo(cards=cards) == expected
+    assert server.requests - sent == 3
+
+
+def test_async_chunks_are_not_batched(server, client):
+    cards = client.findCards(query='deck:*')[:250]
+    expected = client.cardsInfo(cards=cards)
+
+    async def main():
+        async with AsyncAnkiClient(
+            server.url, chunk_size=100, chunk_workers=3, batch_window=0.05
+        ) as chunked:
+            return await chunked.cardsInfo(cards=cards)
+
+    sent = server.requests
+    assert asyncio.run(main()) == expected
+    assert server.requests - sent == 3
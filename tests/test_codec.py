@@ -0,0 +1,82 @@
+import json
+import sys
+import types
+
+import pytest
+
+from anki_connect_api import _codec
+from anki_connect_api._codec import Codec, get_codec
+
+BIG = {'id': 2**70, 'text': 'héllo ✓'}
+
+
+@pytest.fixture
+def codecs(monkeypatch):
+    """Forget the codecs created so far, so they are looked up again."""
+    monkeypatch.setattr(_codec, '_codecs', {})
+    return monkeypatch
+
+
+def too_big(obj):
+    if isinstance(obj, dict):
+        return any(map(too_big, obj.values()))
+    if isinstance(obj, list):
+        return any(map(too_big, obj))
+    return isinstance(obj, int) and not -2**63 <= obj < 2**64
+
+
+def fake_ujson():
+    """Stand-in for ujson, which like the real one can't encode integers
+    beyond 64 bit."""
+    def dumps(obj, ensure_ascii=True):
+        if too_big(obj):
+            raise OverflowError('int too big to convert')
+        return json.dumps(obj, ensure_ascii=ensure_ascii)
+
+    return types.SimpleNamespace(dumps=dumps, loads=json.loads)
+
+
+def test_orjson_is_preferred(codecs):
+    pytest.importorskip('orjson')
+    assert get_codec().name == 'orjson'
+
+
+def test_ujson_is_used_without_orjson(codecs):
+    codecs.setitem(sys.modules, 'orjson', None)
+    codecs.setitem(sys.modules, 'ujson', fake_ujson())
+    assert get_codec().name == 'ujson'
+
+
+def test_json_is_used_without_orjson_and_ujson(codecs):
+    codecs.setitem(sys.modules, 'orjson', None)
+    codecs.setitem(sys.modules, 'ujson', None)
+    assert get_codec().name == 'json'
+    assert get_codec() is get_codec('json')
+
+
+def test_missing_codecs_must_not_be_asked_for(codecs):
+    codecs.setitem(sys.modules, 'ujson', None)
+    with pytest.raises(ImportError):
+        get_codec('ujson')
+    with pytest.raises(ValueError, match='unknown codec'):
+        get_codec('simplejson')
+
+
+def test_codec_instances_are_passed_through():
+    codec = Codec('custom', json.dumps, json.loads)
+    assert get_codec(codec) is codec
+
+
+@pytest.mark.parametrize('name', ['orjson', 'ujson', 'json'])
+def test_codecs_encode_integers_beyond_64_bit(codecs, name):
+    if name == 'ujson':
+        codecs.setitem(sys.modules, 'ujson', fake_ujson())
+    elif name == 'orjson':
+        pytest.importorskip('orjson')
+    codec = get_codec(name)
+    data = codec.dumps(BIG)
+    assert isinstance(data, bytes)
+    assert json.loads(data) == BIG
+    assert codec.loads(codec.dumps({'id': 1, 'text': 'é'})) == {
+        'id': 1, 'text': 'é',
+    }
@@ -0,0 +1,80 @@
+import subprocess
+import sys
+
+import pytest
+
+# modules which must only be loaded once they are used, by the module
+# importing them too early
+DEFERRED = {
+    'anki_connect_api': (
+        'anki_connect_api.client', 'anki_connect_api._transport',
+        'http.client', 'urllib.request', 'email', 'ssl', 'json',
+    ),
+    'anki_connect_api.client': (
+        'anki_connect_api._cassette', 'anki_connect_api.aio', 'asyncio',
+        'http.client', 'gzip', 'hashlib',
+    ),
+    'anki_connect_api.aio': (
+        'anki_connect_api._cassette', 'anki_connect_api._transport',
+        'asyncio', 'gzip', 'hashlib',
+    ),
+}
+
+# the best of a few runs of `python -X importtime -c "import
+# anki_connect_api"` must stay below this; importing urllib.request alone
+# takes about twice as long
+IMPORT_BUDGET_MS = 40
+
+
+def loaded_modules(module):
+    """Names of the modules loaded by importing `module` in a fresh
+    interpreter."""
+    process = subprocess.run(
+        [
+            sys.executable, '-c',
+            f'import sys; import {module}; print(" ".join(sys.modules))',
+        ],
+        capture_output=True, text=True, check=True,
+    )
+    return set(process.stdout.split())
+
+
+def import_time(module):
+    """Cumulative milliseconds of importing `module` in a fresh interpreter,
+    as reported by `-X importtime`."""
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True, text=True, check=True,
+    )
+    for line in process.stderr.splitlines():
+        fields = line.split('|')
+        if len(fields) == 3 and fields[2].strip() == module:
+            return int(fields[1]) / 1e3
+    raise AssertionError(f'no import time reported for {module}')
+
+
+@pytest.mark.parametrize('module', DEFERRED)
+def test_import_defers_modules(module):
+    loaded = loaded_modules(module)
+    assert module in loaded
+    assert loaded.isdisjoint(DEFERRED[module])
+
+
+def test_import_time():
+    best = min(import_time('anki_connect_api') for _ in range(5))
+    assert best < IMPORT_BUDGET_MS
+
+
+def test_actions_are_loaded_on_first_use():
+    import anki_connect_api
+    assert callable(anki_connect_api.deckNames)
+    assert anki_connect_api.deckNames.__module__ == 'anki_connect_api.decks'
+    assert 'deckNames' in dir(anki_connect_api)
+    with pytest.raises(AttributeError):
+        anki_connect_api.noSuchAction
+
+
+def test_load_docs():
+    import anki_connect_api
+    anki_connect_api.load_docs()
+    assert 'Example::' in anki_connect_api.deckNames.__doc__
@@ -0,0 +1,78 @@
+import sys
+
+import pytest
+
+from anki_connect_api import loadtest
+from anki_connect_api.loadtest import Recorder, parse_mix, percentile
+
+
+@pytest.mark.parametrize('mix, expected', [
+    ('cardsInfo=70,notesInfo=30', {'cardsInfo': 70.0, 'notesInfo': 30.0}),
+    (' cardsInfo = 2.5 , deckNames ', {'cardsInfo': 2.5, 'deckNames': 1.0}),
+    ('deckNames=,version=0,', {'deckNames': 1.0, 'version': 0.0}),
+    ('deckNames=1,deckNames=3', {'deckNames': 3.0}),
+])
+def test_parse_mix(mix, expected):
+    assert parse_mix(mix) == expected
+
+
+@pytest.mark.parametrize('mix, error', [
+    ('cardsInfo=x', "invalid mix entry 'cardsInfo=x'"),
+    ('=5', "invalid mix entry '=5'"),
+    ('cardsInfo=-1', "invalid mix entry 'cardsInfo=-1'"),
+    ('cardsInfo=nan', "invalid mix entry 'cardsInfo=nan'"),
+    ('cardsInfo=inf', "invalid mix entry 'cardsInfo=inf'"),
+    ('cardsInfo=1=2', "invalid mix entry 'cardsInfo=1=2'"),
+    ('cardsInfo=0,notesInfo=0', 'no action with a weight above 0'),
+    ('', 'no action with a weight above 0'),
+    (' , ', 'no action with a weight above 0'),
+])
+def test_parse_mix_rejects_malformed_mixes(mix, error):
+    with pytest.raises(ValueError, match=error):
+        parse_mix(mix)
+
+
+def test_malformed_mix_is_a_usage_error(monkeypatch, capsys):
+    monkeypatch.setattr(sys, 'argv', ['loadtest', '--mix', 'cardsInfo=x'])
+    with pytest.raises(SystemExit) as exit:
+        loadtest.main()
+    assert exit.value.code == 2
+    assert "invalid mix entry 'cardsInfo=x'" in capsys.readouterr().err
+
+
+def test_percentile():
+    latencies = [i / 100 for i in range(1, 101)]
+    assert percentile(latencies, 50) == 0.5
+    assert percentile(latencies, 95) == 0.95
+    assert percentile(latencies, 99) == 0.99
+    assert percentile(latencies, 100) == 1.0
+    assert percentile(latencies, 0) == 0.01
+
+
+def test_percentile_uses_the_nearest_rank():
+    assert [percentile([1, 2, 3, 4], p) for p in (25, 50, 51, 95, 99)] == [
+        1, 2, 3, 4, 4,
+    ]
+    assert percentile([7], 99) == 7
+    assert percentile([], 50) is None
+
+
+def test_recorder_summary():
+    recorder = Recorder()
+    for seconds in (0.04, 0.01, 0.03, 0.02):
+        recorder.record('cardsInfo', seconds, False)
+    recorder.record('cardsInfo', 9.0, True)
+    recorder.record('addNotes', 1.0, True)
+    summary = recorder.summary(duration=2.0)
+    assert list(summary) == ['addNotes', 'cardsInfo']
+    assert summary['cardsInfo'] == {
+        'calls': 4, 'errors': 1, 'throughput': 2.0,
+        'p50': 0.02, 'p95': 0.04, 'p99': 0.04,
+    }
+    assert summary['addNotes'] == {
+        'calls': 0, 'errors': 1, 'throughput': 0.0,
+        'p50': None, 'p95': None, 'p99': None,
+    }
+    report = loadtest.report(summary).splitlines()
+    assert report[1].split() == ['addNotes', '0', '1', '0.0', '-', '-', '-']
+    assert report[-1].split() == ['total', '4', '2', '2.0']
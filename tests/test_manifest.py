@@ -0,0 +1,101 @@
+import os
+import threading
+
+from anki_connect_api import MediaManifest, hash_file
+
+
+def write(path, data, mtime=None):
+    path.write_bytes(data)
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+
+def test_scan_indexes_the_folder(tmp_path):
+    media = tmp_path / 'media'
+    media.mkdir()
+    write(media / 'a.txt', b'same')
+    write(media / 'b.txt', b'same')
+    write(media / 'c.txt', b'other')
+    (media / 'folder').mkdir()
+    manifest = MediaManifest(media)
+    stats = manifest.scan()
+    assert (stats['files'], stats['hashed'], stats['removed']) == (3, 3, 0)
+    assert len(manifest) == 3 and 'a.txt' in manifest
+    same = hash_file(media / 'a.txt')
+    assert manifest.hash('b.txt') == same
+    assert manifest.hash('missing.txt') is None
+    assert manifest.names(same) == {'a.txt', 'b.txt'}
+    assert manifest.has(same) and not manifest.has('0' * 64)
+
+
+def test_scan_rehashes_changed_files_only(tmp_path):
+    media = tmp_path / 'media'
+    media.mkdir()
+    write(media / 'a.txt', b'one', mtime=1000)
+    write(media / 'b.txt', b'two', mtime=1000)
+    manifest = MediaManifest(media)
+    manifest.scan()
+    assert manifest.scan()['hashed'] == 0
+    # same size, only the modification time tells
+    write(media / 'a.txt', b'new', mtime=2000)
+    assert manifest.scan()['hashed'] == 1
+    assert manifest.hash('a.txt') == hash_file(media / 'a.txt')
+    assert manifest.names(hash_file(media / 'b.txt')) == {'b.txt'}
+
+
+def test_scan_removes_deleted_files(tmp_path):
+    media = tmp_path / 'media'
+    media.mkdir()
+    write(media / 'a.txt', b'one')
+    write(media / 'b.txt', b'two')
+    manifest = MediaManifest(media)
+    manifest.scan()
+    old = manifest.hash('a.txt')
+    os.remove(media / 'a.txt')
+    stats = manifest.scan()
+    assert (stats['files'], stats['hashed'], stats['removed']) == (1, 0, 1)
+    assert 'a.txt' not in manifest
+    assert manifest.names(old) == set()
+    assert not manifest.has(old)
+
+
+def test_manifest_is_kept_across_reopening(tmp_path):
+    media = tmp_path / 'media'
+    media.mkdir()
+    write(media / 'a.txt', b'one')
+    write(media / 'b.txt', b'two')
+    path = tmp_path / 'media.sqlite'
+    first = MediaManifest(media, path)
+    first.scan()
+    first.close()
+    os.remove(media / 'b.txt')
+    second = MediaManifest(media, path)
+    assert len(second) == 2
+    assert second.hash('a.txt') == hash_file(media / 'a.txt')
+    stats = second.scan()
+    assert (stats['hashed'], stats['removed']) == (0, 1)
+    second.close()
+    assert len(MediaManifest(media, path)) == 1
+
+
+def test_manifest_can_be_shared_by_threads(tmp_path):
+    media = tmp_path / 'media'
+    media.mkdir()
+    write(media / 'a.txt', b'one')
+    manifest = MediaManifest(media, tmp_path / 'media.sqlite')
+    errors = []
+
+    def scan():
+        try:
+            manifest.scan()
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=scan) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert manifest.hash('a.txt') == hash_file(media / 'a.txt')
+    manifest.close()
@@ -0,0 +1,138 @@
+import asyncio
+import base64
+import io
+
+import pytest
+
+from anki_connect_api import MediaCache
+from anki_connect_api.aio import AsyncAnkiClient
+from anki_connect_api.client import AnkiClient
+
+
+def b64(data):
+    return base64.b64encode(data).decode('ascii')
+
+
+def store(client, count, size=1000):
+    for i in range(count):
+        client.storeMediaFile(f'f{i}.bin', data=b64(bytes([i]) * size))
+
+
+def test_media_cache_on_the_same_host(server, client, tmp_path):
+    store(client, 5)
+    cache = MediaCache(tmp_path / 'cache', max_bytes=3500)
+    cached = AnkiClient(server.url, caches=[cache])
+    assert cached.retrieveMediaFile('f0.bin') == b64(bytes([0]) * 1000)
+    assert cached.retrieveMediaFile('f0.bin') == b64(bytes([0]) * 1000)
+    assert cache.media_dir == client.getMediaDirPath()
+    assert (cache.hits, cache.misses) == (1, 1)
+    client.storeMediaFile('f0.bin', data=b64(b'new'))
+    assert cached.retrieveMediaFile('f0.bin') == b64(b'new')
+    for i in range(1, 5):
+        cached.retrieveMediaFile(f'f{i}.bin')
+    assert cache.bytes <= 3500
+    assert cached.retrieveMediaFile('missing.bin') is False
+
+
+def test_media_cache_notices_deleted_files(server, client, tmp_path):
+    store(client, 2)
+    cache = MediaCache(tmp_path / 'cache', media_dir=False, check_interval=0)
+    cached = AnkiClient(server.url, caches=[cache])
+    cached.retrieveMediaFile('f1.bin')
+    assert cached.retrieveMediaFile('f1.bin') == b64(bytes([1]) * 1000)
+    client.deleteMediaFile('f1.bin')
+    assert cached.retrieveMediaFile('f1.bin') is False
+
+
+def test_media_cache_notices_deleted_files_on_the_same_host(
+    server, client, tmp_path
+):
+    store(client, 2)
+    cache = MediaCache(tmp_path / 'cache')
+    cached = AnkiClient(server.url, caches=[cache])
+    cached.retrieveMediaFile('f1.bin')
+    assert cache.media_dir == client.getMediaDirPath()
+    client.deleteMediaFile('f1.bin')
+    assert cached.retrieveMediaFile('f1.bin') is False
+    assert client.getMediaFilesNames(pattern='*') == ['f0.bin']
+
+
+def test_media_cache_checks_that_the_media_folder_is_shared(
+    server, client, tmp_path, monkeypatch
+):
+    # a folder at the same path which isn't Anki's, e.g. in a container
+    other = tmp_path / 'other'
+    other.mkdir()
+    monkeypatch.setattr(
+        server.collection, 'getMediaDirPath', lambda: str(other)
+    )
+    store(client, 2)
+    cache = MediaCache(tmp_path / 'cache', check_interval=0)
+    cached = AnkiClient(server.url, caches=[cache])
+    cached.retrieveMediaFile('f1.bin')
+    assert cache.media_dir is False
+    client.deleteMediaFile('f1.bin')
+    assert cached.retrieveMediaFile('f1.bin') is False
+    assert list(other.iterdir()) == []
+    assert client.getMediaFilesNames(pattern='*') == ['f0.bin']
+
+
+def test_media_cache_is_kept_on_disk(server, client, tmp_path):
+    store(client, 3)
+    AnkiClient(
+        server.url, caches=[MediaCache(tmp_path / 'cache', media_dir=False)]
+    ).retrieveMediaFile('f2.bin')
+    cache = MediaCache(tmp_path / 'cache', media_dir=False)
+    assert AnkiClient(server.url, caches=[cache]).retrieveMediaFile(
+        'f2.bin'
+    ) == b64(bytes([2]) * 1000)
+    assert cache.hits == 1
+
+
+def test_media_cache_works_with_the_async_client(server, client, tmp_path):
+    store(client, 1)
+    cache = MediaCache(tmp_path / 'cache')
+
+    async def main():
+        async with AsyncAnkiClient(server.url, caches=[cache]) as cached:
+            await cached.retrieveMediaFile('f0.bin')
+            return await cached.retrieveMediaFile('f0.bin')
+
+    assert asyncio.run(main()) == b64(bytes([0]) * 1000)
+    assert cache.hits == 1
+
+
+def test_retrieve_media_file_to_uses_the_cache(server, client, tmp_path):
+    store(client, 2)
+    cache = MediaCache(tmp_path / 'cache')
+    cached = AnkiClient(server.url, caches=[cache])
+    first = tmp_path / 'first.bin'
+    assert cached.retrieveMediaFileTo('f1.bin', first) == 1000
+    assert (cache.hits, cache.misses) == (0, 1)
+    sent = server.requests
+    second = io.BytesIO()
+    assert cached.retrieveMediaFileTo('f1.bin', second) == 1000
+    assert server.requests == sent
+    assert first.read_bytes() == second.getvalue() == bytes([1]) * 1000
+    assert cached.retrieveMediaFile('f1.bin') == b64(bytes([1]) * 1000)
+    assert cache.hits == 2
+    missing = tmp_path / 'missing.bin'
+    assert cached.retrieveMediaFileTo('missing.bin', missing) is False
+    assert not missing.exists()
+
+
+def test_failed_writes_are_rolled_back(server, client, tmp_path):
+    store(client, 2)
+    cache = MediaCache(tmp_path / 'cache')
+    cached = AnkiClient(server.url, caches=[cache])
+
+    def evict():
+        raise OSError('disk full')
+
+    cache._evict = evict
+    with pytest.raises(OSError):
+        cached.retrieveMediaFile('f0.bin')
+    del cache._evict
+    assert len(cache) == 0
+    assert cached.retrieveMediaFile('f1.bin') == b64(bytes([1]) * 1000)
+    assert len(cache) == 1
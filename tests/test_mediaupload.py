@@ -0,0 +1,111 @@
+import base64
+
+import pytest
+
+from anki_connect_api import MediaUploader
+
+
+def write_files(directory, count):
+    directory.mkdir()
+    paths = []
+    for i in range(count):
+        path = directory / f'f{i}.bin'
+        path.write_bytes(bytes([i]) * 1000)
+        paths.append(str(path))
+    return paths
+
+
+def record_stores(client):
+    stores = []
+    store = client.storeMediaFile
+
+    def recording(filename, **params):
+        stores.append((filename, params))
+        return store(filename, **params)
+
+    client.storeMediaFile = recording
+    return stores
+
+
+def test_upload_skips_files_anki_has(server, client, tmp_path):
+    paths = write_files(tmp_path / 'files', 3)
+    uploader = MediaUploader(client)
+    report = uploader.upload(paths)
+    assert (report['uploaded'], report['skipped']) == (3, 0)
+    report = uploader.upload(paths)
+    assert (report['uploaded'], report['skipped']) == (0, 3)
+    assert client.getMediaFilesNames(pattern='*') == [
+        'f0.bin', 'f1.bin', 'f2.bin'
+    ]
+
+
+def test_upload_passes_paths_to_anki_sharing_the_folder(
+    server, client, tmp_path
+):
+    paths = write_files(tmp_path / 'files', 2)
+    stores = record_stores(client)
+    report = MediaUploader(client).upload(paths)
+    assert report['uploaded'] == 2
+    assert [params for name, params in stores if name.startswith('f')] == [
+        {'path': path} for path in paths
+    ]
+    assert client.getMediaFilesNames(pattern='*') == ['f0.bin', 'f1.bin']
+
+
+def test_upload_sends_files_if_the_folder_is_not_shared(
+    server, client, tmp_path, monkeypatch
+):
+    # a folder at the same path which isn't Anki's, e.g. in a container
+    other = tmp_path / 'other'
+    other.mkdir()
+    monkeypatch.setattr(
+        server.collection, 'getMediaDirPath', lambda: str(other)
+    )
+    paths = write_files(tmp_path / 'files', 2)
+    stores = record_stores(client)
+    report = MediaUploader(client).upload(paths)
+    assert report['uploaded'] == 2
+    assert not [params for name, params in stores if 'path' in params]
+    assert client.getMediaFilesNames(pattern='*') == ['f0.bin', 'f1.bin']
+    assert list(other.iterdir()) == []
+
+
+def test_upload_sends_files_anki_can_not_read(
+    server, client, tmp_path, monkeypatch
+):
+    store = server.collection.storeMediaFile
+
+    def store_media_file(filename, path=None, **params):
+        if path is not None and 'private' in path:
+            raise Exception(f"Permission denied: '{path}'")
+        return store(filename, path=path, **params)
+
+    monkeypatch.setattr(
+        server.collection, 'storeMediaFile', store_media_file
+    )
+    (tmp_path / 'public').mkdir()
+    public = tmp_path / 'public' / 'g.bin'
+    public.write_bytes(b'public')
+    paths = write_files(tmp_path / 'private', 3) + [str(public)]
+    stores = record_stores(client)
+    report = MediaUploader(client, workers=1).upload(paths)
+    assert (report['uploaded'], report['failed']) == (4, 0)
+    # one attempt to pass a path per folder
+    assert [name for name, params in stores if 'path' in params] == [
+        'f0.bin', 'g.bin',
+    ]
+    assert client.getMediaFilesNames(pattern='*') == [
+        'f0.bin', 'f1.bin', 'f2.bin', 'g.bin',
+    ]
+    assert client.retrieveMediaFile('f2.bin') == base64.b64encode(
+        bytes([2]) * 1000
+    ).decode()
+
+
+def test_upload_rejects_paths_with_the_same_name(client, tmp_path):
+    paths = write_files(tmp_path / 'a', 2) + write_files(tmp_path / 'b', 1)
+    with pytest.raises(ValueError, match='f0.bin'):
+        MediaUploader(client).upload(paths)
+    assert client.getMediaFilesNames(pattern='*') == []
+    files = {'a.bin': paths[0], 'b.bin': paths[2]}
+    assert MediaUploader(client).upload(files)['uploaded'] == 2
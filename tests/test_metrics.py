@@ -0,0 +1,92 @@
+import base64
+
+import pytest
+
+from anki_connect_api import Metrics
+from anki_connect_api.client import AnkiClient
+
+
+def test_snapshot():
+    metrics = Metrics(buckets=(0.1, 0.01, 1.0))
+    metrics.record('deckNames', 0.005, 100, 200)
+    metrics.record('deckNames', 0.05, 100, 300, error=True)
+    metrics.record('deckNames', 5.0, 10, 20)
+    metrics.record('cardsInfo', 0.1, 1, 2)
+    snapshot = metrics.snapshot()
+    assert list(snapshot) == ['cardsInfo', 'deckNames']
+    assert snapshot['deckNames'] == {
+        'count': 3,
+        'errors': 1,
+        'seconds': 5.055,
+        'request_bytes': 210,
+        'response_bytes': 520,
+        'histogram': {0.01: 1, 0.1: 2, 1.0: 2, float('inf'): 3},
+    }
+    # the upper bounds are inclusive, like in Prometheus
+    assert snapshot['cardsInfo']['histogram'] == {
+        0.01: 0, 0.1: 1, 1.0: 1, float('inf'): 1,
+    }
+    metrics.reset()
+    assert metrics.snapshot() == {}
+
+
+def test_prometheus():
+    metrics = Metrics(buckets=(0.01, 0.1))
+    metrics.record('deckNames', 0.05, 100, 200)
+    metrics.record('deckNames', 0.5, 100, 300, error=True)
+    assert metrics.prometheus(prefix='anki') == '''\
+# HELP anki_requests_total Requests sent to Anki-Connect.
+# TYPE anki_requests_total counter
+anki_requests_total{action="deckNames"} 2
+# HELP anki_errors_total Requests that failed.
+# TYPE anki_errors_total counter
+anki_errors_total{action="deckNames"} 1
+# HELP anki_request_bytes_total Bytes sent.
+# TYPE anki_request_bytes_total counter
+anki_request_bytes_total{action="deckNames"} 200
+# HELP anki_response_bytes_total Bytes received.
+# TYPE anki_response_bytes_total counter
+anki_response_bytes_total{action="deckNames"} 500
+# HELP anki_request_duration_seconds Request latency.
+# TYPE anki_request_duration_seconds histogram
+anki_request_duration_seconds_bucket{action="deckNames",le="0.01"} 0
+anki_request_duration_seconds_bucket{action="deckNames",le="0.1"} 1
+anki_request_duration_seconds_bucket{action="deckNames",le="+Inf"} 2
+anki_request_duration_seconds_sum{action="deckNames"} 0.55
+anki_request_duration_seconds_count{action="deckNames"} 2
+'''
+
+
+def test_every_call_is_counted(server, client, tmp_path):
+    client.storeMediaFile('a.bin', data=base64.b64encode(b'a' * 3000).decode())
+    source = tmp_path / 'source.bin'
+    source.write_bytes(b'b' * 100)
+    metrics = Metrics()
+    counted = AnkiClient(server.url, metrics=metrics)
+    cards = counted.findCards(query='deck:Spanish')[:10]
+    assert len(list(counted.stream('cardsInfo', cards=cards))) == 10
+    assert counted.retrieveMediaFileTo('a.bin', tmp_path / 'a.bin') == 3000
+    counted.storeMediaFileFrom('b.bin', source)
+    with pytest.raises(Exception, match='unsupported action'):
+        counted.invoke('nope')
+    snapshot = metrics.snapshot()
+    assert {action: stats['count'] for action, stats in snapshot.items()} == {
+        'cardsInfo': 1, 'findCards': 1, 'nope': 1, 'retrieveMediaFile': 1,
+        'storeMediaFile': 1,
+    }
+    assert snapshot['nope']['errors'] == 1
+    assert sum(stats['errors'] for stats in snapshot.values()) == 1
+    assert snapshot['retrieveMediaFile']['response_bytes'] > 4000
+    assert snapshot['storeMediaFile']['request_bytes'] > 100
+    assert snapshot['cardsInfo']['response_bytes'] > 1000
+
+
+def test_closing_a_stream_is_no_error(server):
+    metrics = Metrics()
+    counted = AnkiClient(server.url, metrics=metrics)
+    cards = counted.findCards(query='deck:Spanish')[:10]
+    stream = counted.stream('cardsInfo', cards=cards)
+    next(stream)
+    stream.close()
+    assert metrics.snapshot()['cardsInfo']['count'] == 1
+    assert metrics.snapshot()['cardsInfo']['errors'] == 0
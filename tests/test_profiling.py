@@ -0,0 +1,142 @@
+import asyncio
+import json
+import time
+
+import pytest
+
+from anki_connect_api._codec import Codec
+from anki_connect_api._profiling import PHASES, Profile, observe
+from anki_connect_api.aio import AsyncAnkiClient
+from anki_connect_api.client import AnkiClient
+
+SERIALIZE = 0.02
+NETWORK = 0.05
+DECODE = 0.03
+
+
+def slow_codec():
+    """json, taking `SERIALIZE` seconds to encode and `DECODE` to decode."""
+    def dumps(obj):
+        time.sleep(SERIALIZE)
+        return json.dumps(obj).encode('utf-8')
+
+    def loads(data):
+        time.sleep(DECODE)
+        return json.loads(data)
+
+    return Codec('slow', dumps, loads)
+
+
+class SlowTransport:
+    """Answers every request with `result` after `NETWORK` seconds."""
+
+    def __init__(self, result=1):
+        self.result = result
+
+    def request(self, body):
+        time.sleep(NETWORK)
+        return json.dumps({'result': self.result, 'error': None}).encode()
+
+    def close(self):
+        pass
+
+
+class AsyncSlowTransport(SlowTransport):
+    async def request(self, body):
+        await asyncio.sleep(NETWORK)
+        return json.dumps({'result': self.result, 'error': None}).encode()
+
+
+def test_profile_adds_up_calls():
+    profile = Profile()
+    profile.add('deckNames', dict(zip(PHASES, (1.0, 2.0, 3.0, 4.0))))
+    profile.add('deckNames', dict(zip(PHASES, (1.0, 1.0, 1.0, 1.0))))
+    profile.add('cardsInfo', {'serialize': 0.5, 'network': 0.25})
+    assert profile.calls == 3
+    assert profile.actions['deckNames'] == {
+        'calls': 2, 'serialize': 2.0, 'network': 3.0, 'read': 4.0,
+        'decode': 5.0,
+    }
+    assert profile.totals == {
+        'serialize': 2.5, 'network': 3.25, 'read': 4.0, 'decode': 5.0,
+    }
+    assert profile.report().splitlines() == [
+        'action             calls  serialize    network       read     decode',
+        'cardsInfo              1   500.0 ms   250.0 ms     0.0 ms     0.0 ms',
+        'deckNames              2  2000.0 ms  3000.0 ms  4000.0 ms  5000.0 ms',
+        'total                  3  2500.0 ms  3250.0 ms  4000.0 ms  5000.0 ms',
+    ]
+
+
+class Client:
+    metrics = None
+
+    def __init__(self, *profiles):
+        self._profiles = profiles
+
+
+def test_observe_splits_the_time_into_phases():
+    profile = Profile()
+    observe(Client(profile), 'deckNames', [0, 1, 3, 6, 10], 0, 0, False)
+    assert profile.actions['deckNames'] == {
+        'calls': 1, 'serialize': 1, 'network': 2, 'read': 3, 'decode': 4,
+    }
+
+
+def test_observe_ends_failed_calls_in_the_failed_phase():
+    profile = Profile()
+    observe(Client(profile), 'deckNames', [0, 1, None, None, 5], 0, 0, True)
+    assert profile.actions['deckNames'] == {
+        'calls': 1, 'serialize': 1, 'network': 4, 'read': 0.0, 'decode': 0.0,
+    }
+
+
+def test_client_profile():
+    client = AnkiClient(transport=SlowTransport(), codec=slow_codec())
+    client.deckNames()
+    with client.profile() as outer:
+        client.deckNames()
+        with client.profile() as inner:
+            client.modelNames()
+        client.deckNames()
+    client.deckNames()
+    assert (outer.calls, inner.calls) == (3, 1)
+    assert outer.actions['deckNames']['calls'] == 2
+    assert list(inner.actions) == ['modelNames']
+    stats = inner.actions['modelNames']
+    assert stats['serialize'] >= SERIALIZE
+    assert stats['network'] >= NETWORK
+    assert stats['decode'] >= DECODE
+    assert stats['read'] < SERIALIZE
+    assert sum(outer.totals.values()) == pytest.approx(
+        sum(sum(s[phase] for phase in PHASES) for s in outer.actions.values())
+    )
+
+
+def test_client_profile_of_a_stream():
+    client = AnkiClient(transport=SlowTransport([1, 2, 3]))
+    with client.profile() as profile:
+        assert list(client.stream('findCards', query='')) == [1, 2, 3]
+    stats = profile.actions['findCards']
+    assert stats['calls'] == 1
+    assert stats['network'] >= NETWORK
+
+
+def test_async_client_profile():
+    async def main():
+        async with AsyncAnkiClient(
+            transport=AsyncSlowTransport(), codec=slow_codec()
+        ) as client:
+            with client.profile() as profile:
+                await client.deckNames()
+                await client.deckNames()
+            return profile
+
+    profile = asyncio.run(main())
+    stats = profile.actions['deckNames']
+    assert stats['calls'] == 2
+    assert stats['serialize'] >= 2 * SERIALIZE
+    assert stats['network'] >= 2 * NETWORK
+    assert stats['decode'] >= 2 * DECODE
+    # reading is part of the network time
+    assert stats['read'] < SERIALIZE
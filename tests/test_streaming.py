@@ -0,0 +1,132 @@
+import base64
+import io
+import json
+import os
+import random
+
+import pytest
+
+from anki_connect_api._media import Base64Body, write_response
+from anki_connect_api._streaming import iter_response
+from anki_connect_api.client import AnkiClient
+
+
+def reader(text, size):
+    """`read()` returning at most `size` bytes at a time."""
+    data = io.BytesIO(text.encode('utf-8'))
+    return lambda _: data.read(size)
+
+
+def random_value(depth=0):
+    choice = random.random()
+    if depth > 3 or choice < 0.3:
+        return random.choice([
+            1, -2.5e10, 123456789012345, 'héllo"\\ ✓ 😀', True, None, False,
+            0.1, '', 'x' * random.randint(0, 50),
+        ])
+    if choice < 0.65:
+        return [random_value(depth + 1) for _ in range(random.randint(0, 5))]
+    return {
+        f'k{i}✓': random_value(depth + 1) for i in range(random.randint(0, 5))
+    }
+
+
+def test_iter_response_in_small_reads():
+    random.seed(1)
+    for _ in range(200):
+        if random.random() < 0.7:
+            result = [random_value() for _ in range(random.randint(0, 6))]
+            expected = result
+        else:
+            result = {str(i): random_value() for i in range(4)}
+            expected = list(result.items())
+        response = {'result': result, 'error': None}
+        if random.random() < 0.5:
+            response = {'error': None, 'result': result}
+        text = json.dumps(
+            response, ensure_ascii=random.random() < 0.5,
+            indent=random.choice([None, 1]),
+        )
+        size = random.randint(1, 7)
+        assert list(iter_response(reader(text, size))) == expected
+
+
+@pytest.mark.parametrize('text, error', [
+    ('{"result": [1, 2], "error": "boom"}', 'boom'),
+    ('{"error": "boom", "result": null}', 'boom'),
+    ('{"result": [1]}', 'unexpected number of fields'),
+    ('{"result": [1], "x": null}', 'missing required error field'),
+    ('{"result": [1], "error": null, "x": 1}', 'unexpected number of fields'),
+    ('{"result": [1, 2', 'Expecting'),
+])
+def test_iter_response_errors(text, error):
+    with pytest.raises(Exception, match=error):
+        list(iter_response(reader(text, 3)))
+
+
+def test_base64_body(tmp_path):
+    path = tmp_path / 'source.bin'
+    data = os.urandom(10000)
+    path.write_bytes(data)
+    with Base64Body(
+        'storeMediaFile', {'filename': 'a.bin'}, 'data', path, chunk_size=999
+    ) as body:
+        encoded = b''.join(body)
+        assert len(body) == len(encoded)
+        assert b''.join(body) == encoded
+    request = json.loads(encoded)
+    assert request['params']['filename'] == 'a.bin'
+    assert base64.b64decode(request['params']['data']) == data
+
+
+def test_base64_body_needs_whole_chunks():
+    with pytest.raises(ValueError):
+        Base64Body('storeMediaFile', {}, 'data', io.BytesIO(), chunk_size=4)
+
+
+@pytest.mark.parametrize('size', [1, 3, 4, 1000])
+def test_write_response(size):
+    data = os.urandom(3001)
+    encoded = base64.b64encode(data).decode('ascii').replace('/', '\\/')
+    text = json.dumps({'error': None, 'result': 'X'}).replace('X', encoded)
+    target = io.BytesIO()
+    assert write_response(reader(text, size), target) == len(data)
+    assert target.getvalue() == data
+
+
+def test_write_response_of_a_missing_file(tmp_path):
+    text = '{"result": false, "error": null}'
+    path = tmp_path / 'copy.bin'
+    assert write_response(reader(text, 4), path) is False
+    assert not path.exists()
+
+
+def test_write_response_removes_partial_files(tmp_path):
+    text = '{"result": "AAAA'
+    path = tmp_path / 'copy.bin'
+    with pytest.raises(json.JSONDecodeError):
+        write_response(reader(text, 4), path)
+    assert not path.exists()
+
+
+def test_abandoned_stream_returns_its_connection(server):
+    client = AnkiClient(server.url, pool_size=1)
+    cards = client.findCards(query='deck:*')[:3]
+    stream = client.stream('cardsInfo', cards=cards)
+    next(stream)
+    # the whole response has been received, the rest is decoded from it
+    assert len(client.transport._idle) == 1
+    assert 'Spanish' in client.deckNames()
+    assert len(list(stream)) == 2
+
+
+def test_closed_stream_returns_its_connection(server):
+    client = AnkiClient(server.url, pool_size=1)
+    cards = client.findCards(query='deck:*')
+    stream = client.stream('cardsInfo', cards=cards)
+    next(stream)
+    assert not client.transport._slots.acquire(blocking=False)
+    stream.close()
+    # the rest of the response was not read, so the connection is closed
+    assert not client.transport._idle
+    assert client.transport._slots.acquire(blocking=False)
@@ -0,0 +1,198 @@
+import asyncio
+import http.server
+import threading
+
+import pytest
+
+from anki_connect_api._aiotransport import AsyncConnectionPool
+from anki_connect_api._transport import ConnectionPool
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    """Echoes the request body, but drops the connection without an answer
+    after reading the requests whose number is in `server.drop`. If
+    `server.close` is true, it closes the connection after every response
+    without sending `Connection: close`, like the server of Anki-Connect."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        self.server.requests.append(body)
+        if len(self.server.requests) in self.server.drop:
+            self.close_connection = True
+            return
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        self.close_connection = self.server.close
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def echo_server():
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    server.requests = []
+    server.drop = set()
+    server.close = False
+    server.url = f'http://127.0.0.1:{server.server_address[1]}'
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_pool_reuses_connections(echo_server):
+    pool = ConnectionPool(echo_server.url)
+    assert pool.request(b'one') == b'one'
+    assert pool.request(b'two') == b'two'
+    assert len(pool._idle) == 1
+    pool.close()
+
+
+def test_pool_sends_iterable_bodies(echo_server):
+    class Body:
+        def __len__(self):
+            return 6
+
+        def __iter__(self):
+            return iter([b'ab', b'cd', b'ef'])
+
+    pool = ConnectionPool(echo_server.url)
+    assert pool.request(Body()) == b'abcdef'
+    pool.close()
+
+
+def test_pool_resends_requests_once_on_a_new_connection(echo_server):
+    echo_server.drop = {2}
+    pool = ConnectionPool(echo_server.url)
+    pool.request(b'one')
+    assert pool.request(b'two') == b'two'
+    assert echo_server.requests == [b'one', b'two', b'two']
+    # the server doesn't keep connections alive reliably
+    assert pool.request(b'three') == b'three'
+    assert not pool._idle
+
+
+def test_pool_does_not_resend_requests_on_new_connections(echo_server):
+    echo_server.drop = {1}
+    pool = ConnectionPool(echo_server.url)
+    with pytest.raises(ConnectionError):
+        pool.request(b'one')
+    assert echo_server.requests == [b'one']
+
+
+def test_pool_with_a_server_closing_connections_after_responses(echo_server):
+    echo_server.close = True
+    pool = ConnectionPool(echo_server.url)
+    for i in range(200):
+        assert pool.request(b'%d' % i) == b'%d' % i
+
+
+class FakeResponse:
+    status = 200
+    will_close = False
+
+    def read(self):
+        return b'answer'
+
+    def isclosed(self):
+        return True
+
+
+class FakeConnection:
+    def __init__(self, error=None):
+        self.error = error
+        self.closed = False
+
+    def request(self, *args):
+        if self.error is not None:
+            raise self.error
+
+    def getresponse(self):
+        return FakeResponse()
+
+    def close(self):
+        self.closed = True
+
+
+def test_pool_resends_requests_which_could_not_be_sent():
+    stale = FakeConnection(BrokenPipeError())
+    fresh = FakeConnection()
+    pool = ConnectionPool('http://127.0.0.1:1')
+    pool._checkout = lambda: (stale, True)
+    pool._connect = lambda: fresh
+    assert pool.request(b'body') == b'answer'
+    assert stale.closed
+    assert not pool._idle
+
+
+def test_pool_closes_the_new_connection_if_resending_fails():
+    stale = FakeConnection(BrokenPipeError())
+    fresh = FakeConnection(ConnectionRefusedError())
+    pool = ConnectionPool('http://127.0.0.1:1')
+    pool._checkout = lambda: (stale, True)
+    pool._connect = lambda: fresh
+    with pytest.raises(ConnectionRefusedError):
+        pool.request(b'body')
+    assert stale.closed and fresh.closed
+
+
+def test_async_pool_resends_requests_once_on_a_new_connection(echo_server):
+    echo_server.drop = {2}
+
+    async def main():
+        pool = AsyncConnectionPool(echo_server.url)
+        assert await pool.request(b'one') == b'one'
+        assert await pool.request(b'two') == b'two'
+        assert await pool.request(b'three') == b'three'
+        assert not pool._idle
+
+    asyncio.run(main())
+    assert echo_server.requests == [b'one', b'two', b'two', b'three']
+
+
+def test_async_pool_does_not_resend_requests_on_new_connections(echo_server):
+    echo_server.drop = {1}
+
+    async def main():
+        pool = AsyncConnectionPool(echo_server.url)
+        with pytest.raises(ConnectionError):
+            await pool.request(b'one')
+
+    asyncio.run(main())
+    assert echo_server.requests == [b'one']
+
+
+def test_async_pool_with_a_server_closing_connections_after_responses(
+    echo_server
+):
+    echo_server.close = True
+
+    async def main():
+        pool = AsyncConnectionPool(echo_server.url)
+        for i in range(200):
+            assert await pool.request(b'%d' % i) == b'%d' % i
+
+    asyncio.run(main())
+
+
+def test_async_pool_can_be_used_from_another_event_loop(echo_server):
+    pool = AsyncConnectionPool(echo_server.url)
+    assert asyncio.run(pool.request(b'one')) == b'one'
+    assert len(pool._idle) == 1
+    assert asyncio.run(pool.request(b'two')) == b'two'
+    assert len(pool._idle) == 1
+    pool.close()
+
+
+def test_async_pool_can_be_closed_after_its_event_loop(echo_server):
+    pool = AsyncConnectionPool(echo_server.url)
+    asyncio.run(pool.request(b'one'))
+    pool.close()
+    assert not pool._idle
@@ -1,3 +1,4 @@
+import ast
 import re
 import textwrap
 import json
@@ -13,31 +14,140 @@ RESULT_SEARCH = re.compile("^<summary><i>Sample.* result.*</i></summary>")
 
 HEADER = r'''__version__ = '24.2.26.0'
 
-import json
-import urllib.request
+import threading
+
+CATEGORIES = (
+    'cards', 'decks', 'gui', 'media', 'misc', 'models', 'notes', 'stats'
+)
 
 URL = 'http://127.0.0.1:8765'
+KEY = None
+POOL_SIZE = 4
+CHUNK_SIZE = None
+CODEC = None
+METRICS = None
+RECORD = None
+CACHES = ()
+
+_client = None
+_client_settings = None
+_client_lock = threading.Lock()
+
+_LAZY = {
+    'AdaptiveChunkSize': '._tuning',
+    'AnkiClient': '.client',
+    'CardCache': '._cardcache',
+    'LRUStore': '._cardcache',
+    'MediaCache': '._mediacache',
+    'MediaManifest': '._manifest',
+    'MediaUploader': '._mediaupload',
+    'MetadataCache': '._cache',
+    'Metrics': '._metrics',
+    'NoteCache': '._cardcache',
+    'Profile': '._profiling',
+    'QueryCache': '._cache',
+    'RecordingTransport': '._cassette',
+    'ReplayTransport': '._cassette',
+    'SQLiteStore': '._sqlitestore',
+    'UploadManifest': '._mediaupload',
+    'hash_file': '._media',
+}
+
+
+def __getattr__(name):
+    import importlib
+    if name in CATEGORIES:
+        return importlib.import_module(f'.{name}', __name__)
+    module = _LAZY.get(name)
+    if module is None and name in _ACTIONS:
+        module = f'.{_ACTIONS[name]}'
+    if module is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY) | set(_ACTIONS) | set(CATEGORIES))
+
+
+def load_docs():
+    """Attach the documentation and examples to all action functions, for
+    `help()` and interactive use. The functions are loaded without it to
+    save time and memory."""
+    from ._docs import DOCS
+    for name in _ACTIONS:
+        __getattr__(name).__doc__ = DOCS[name]
+
+
+def _get_client():
+    global _client, _client_settings
+    settings = (
+        URL, KEY, POOL_SIZE, CHUNK_SIZE, CODEC, METRICS, RECORD, tuple(CACHES)
+    )
+    with _client_lock:
+        if _client is None or settings != _client_settings:
+            from .client import AnkiClient
+            if _client is not None:
+                _client.close()
+            _client = AnkiClient(
+                URL,
+                KEY,
+                pool_size=POOL_SIZE,
+                chunk_size=CHUNK_SIZE,
+                codec=CODEC,
+                metrics=METRICS,
+                record=RECORD,
+                caches=CACHES,
+            )
+            _client_settings = settings
+        return _client
 
 
 def invoke(action: str, **params):
-    requestJson = json.dumps({
-        'action': action,
-        'version': 6,
-        'params': params
-    }).encode('utf-8')
-    response = json.load(
-        urllib.request.urlopen(urllib.request.Request(URL, requestJson))
-    )
-    if len(response) != 2:
-        raise Exception('response has an unexpected number of fields')
-    if 'error' not in response:
-        raise Exception('response is missing required error field')
-    if 'result' not in response:
-        raise Exception('response is missing required result field')
-    if response['error'] is not None:
-        raise Exception(response['error'])
-    return response['result']
+    return _get_client().invoke(action, **params)
+
+
+def stream(action: str, **params):
+    return _get_client().stream(action, **params)
+
+
+def profile():
+    return _get_client().profile()
+'''
+
+CATEGORY_HEADER = '''"""{title}
+
+The functions are loaded without documentation, call
+`anki_connect_api.load_docs()` to attach it.
+"""
+from . import invoke
+'''
+
+DOCS_HEADER = '''"""Documentation of the action functions, attached by
+`anki_connect_api.load_docs()`."""
 
+DOCS = {
+'''
+
+CATEGORY_NAMES = {
+    "Card Actions": "cards",
+    "Deck Actions": "decks",
+    "Graphical Actions": "gui",
+    "Media Actions": "media",
+    "Miscellaneous Actions": "misc",
+    "Model Actions": "models",
+    "Note Actions": "notes",
+    "Statistic Actions": "stats",
+}
+
+ACTIONS_HEADER = '''class Actions:
+    """Mixin of `AnkiClient` with a method for every action."""
+'''
+
+ASYNC_ACTIONS_HEADER = '''class AsyncActions:
+    """Mixin of `AsyncAnkiClient` with a coroutine for every action."""
 '''
 
 CODE_TEMPLATE = '''
@@ -47,7 +157,13 @@ CODE_TEMPLATE = '''
 
     Example::
 {examples}
-    """{flake8_ignore}
+    """
+{func_code}'''
+
+METHOD_TEMPLATE = '''
+{func_def}
+{doc}
+    """
 {func_code}'''
 
 exceptional_funcs = {}
@@ -239,6 +355,60 @@ def make_func(func_name, doc, requests, results):
         func_def = f"def {func_name}({func_args_str}) -> {return_type}:"
         func_code = f'    return invoke({invoke_args_str})'
 
+    method_doc = fill_doc(doc, "", width=86)
+    doc = fill_doc(doc, example, width=90)
+
+    # format the function with its docstring, then move the docstring to
+    # the docs table and write the function without it
+    code = CODE_TEMPLATE.format(
+            func_def=func_def,
+            doc=doc,
+            examples=examples,
+            func_code=func_code,
+    )
+    code = black.format_str(code, mode=black_mode)
+    docstring = ast.parse(code).body[0].body[0]
+    lines = code.splitlines(keepends=True)
+    prefix = "r" if lines[docstring.lineno - 1].lstrip().startswith("r") else ""
+    flake8_ignore = ""
+    max_len = max(len(line) for line in examples.splitlines())
+    if max_len > 95:
+        flake8_ignore = "  # noqa: E501"
+    fdocs.write(
+        f"    '{func_name}': {prefix}\"\"\"{docstring.value.value}\"\"\","
+        f"{flake8_ignore}\n"
+    )
+    del lines[docstring.lineno - 1:docstring.end_lineno]
+    fcategory.write("\n\n" + "".join(lines))
+    actions[func_name] = category
+
+    # write the methods of both client mixins
+    write_method(fclient, func_def, method_doc, func_code, is_async=False)
+    write_method(faio, func_def, method_doc, func_code, is_async=True)
+
+
+def write_method(fout, func_def, doc, func_code, is_async):
+    """Turn the function into a method calling self.invoke() and format it
+    inside of a dummy class to get the indentation right."""
+    if is_async:
+        method_def = re.sub(r"^def (\w+)\(", r"async def \1(self, ", func_def)
+        invoke_call = "return await self.invoke("
+    else:
+        method_def = re.sub(r"^def (\w+)\(", r"def \1(self, ", func_def)
+        invoke_call = "return self.invoke("
+    code = METHOD_TEMPLATE.format(
+        func_def=method_def.replace("(self, )", "(self)"),
+        doc=doc,
+        func_code=func_code.replace("return invoke(", invoke_call),
+    )
+    code = black.format_str(
+        "class _:\n" + textwrap.indent(code, "    "), mode=black_mode
+    )
+    fout.write("\n" + code.split("\n", 1)[1].lstrip("\n"))
+
+
+def fill_doc(doc, example, width):
+    """Wrap the docstring text and open it with the right kind of quotes."""
     if "\\" in doc or "\\" in example:
         initial_indent = '    r"""'
     else:
@@ -248,31 +418,15 @@ def make_func(func_name, doc, requests, results):
         p.append(
             textwrap.fill(
                 line,
-                width=90,
+                width=width,
                 break_long_words=False,
+                break_on_hyphens=False,
                 initial_indent=initial_indent,
                 subsequent_indent="    "
             )
         )
         initial_indent = '    '
-    doc = "\n".join(p)
-
-    # make flake8 happy for now, if the docstring exceeds the line length
-    flake8_ignore = ""
-    max_len = max(len(line) for line in examples.splitlines())
-    if max_len > 95:
-        flake8_ignore = "  # noqa: E501"
-
-    # write every part of the function to the .py file
-    code = CODE_TEMPLATE.format(
-            func_def=func_def,
-            doc=doc,
-            examples=examples,
-            func_code=func_code,
-            flake8_ignore=flake8_ignore,
-    )
-    code = black.format_str(code, mode=black_mode)
-    fout.write("\n\n" + code)
+    return "\n".join(p)
 
 
 def line_generator(file):
@@ -286,12 +440,23 @@ def line_generator(file):
 
 script_dir = Path(__file__).absolute().parent
 source_file_path = script_dir / "original.README.md"
-out_file_path = script_dir.parent / "anki_connect_api.py"
+out_file_path = script_dir.parent / "anki_connect_api" / "__init__.py"
+actions_file_path = script_dir.parent / "anki_connect_api" / "_actions.py"
+aio_actions_file_path = script_dir.parent / "anki_connect_api" / "_aioactions.py"
+docs_file_path = script_dir.parent / "anki_connect_api" / "_docs.py"
 
 with (source_file_path.open('r') as fin,
-      out_file_path.open('w') as fout):
+      out_file_path.open('w') as fout,
+      actions_file_path.open('w') as fclient,
+      aio_actions_file_path.open('w') as faio,
+      docs_file_path.open('w') as fdocs):
     lines_gen = line_generator(fin)
     fout.write(HEADER)
+    fclient.write(ACTIONS_HEADER)
+    faio.write(ASYNC_ACTIONS_HEADER)
+    fdocs.write(DOCS_HEADER)
+    fcategory = None
+    actions = {}
     # ignore everything till the first thematic break
     for line in lines_gen:
         if line.strip().startswith("---"):
@@ -299,8 +464,15 @@ with (source_file_path.open('r') as fin,
     # look for lines of interest
     for line in lines_gen:
         if line.startswith("### "):
-            # new section heading
-            fout.write("\n# " + line[4:].strip() + "\n")
+            # new section heading, each category goes into its own module
+            title = line[4:].strip()
+            category = CATEGORY_NAMES[title]
+            if fcategory is not None:
+                fcategory.close()
+            fcategory = (out_file_path.parent / f"{category}.py").open("w")
+            fcategory.write(CATEGORY_HEADER.format(title=title))
+            fclient.write("\n    # " + title + "\n")
+            faio.write("\n    # " + title + "\n")
         elif line.startswith("#### "):
             # new function
             func_name = line[5:].strip().replace("`", "")
@@ -309,3 +481,12 @@ with (source_file_path.open('r') as fin,
         else:
             if line != "\n":
                 print("ignored line:", repr(line))
+    fcategory.close()
+    fdocs.write("}\n")
+    # the package loads the actions from their category module on first use
+    fout.write("\n\n_ACTIONS = {\n")
+    for func_name, category in actions.items():
+        fout.write(f"    '{func_name}': '{category}',\n")
+    fout.write("}\n\n__all__ = [\n")
+    fout.write("    'invoke', 'stream', 'profile', 'load_docs', *_LAZY, *_ACTIONS\n")
+    fout.write("]\n")
@@ -1,9 +1,9 @@
 import ast
+import inspect
 import json
 from textwrap import indent, dedent
 from pathlib import Path
 
-import ast_comments
 import jsbeautifier
 import markdown_parser
 
@@ -12,7 +12,7 @@ opts.indent_size = 4
 opts.wrap_line_length = 100
 
 HEADER = """
-<!-- This file is auto-generated from <anki_connect_api.py>, do not edit it by hand. -->
+<!-- This file is auto-generated from <anki_connect_api/_docs.py>, do not edit it by hand. -->
 
 """
 
@@ -93,8 +93,22 @@ def write_json_func(fout, func_name, args, docstring):
 
 script_dir = Path(__file__).absolute().parent
 
-with open(script_dir.parent / "anki_connect_api.py", 'r') as file:
-    tree = ast_comments.parse(file.read())
+package_dir = script_dir.parent / "anki_connect_api"
+
+
+def read_module(name):
+    with open(package_dir / f"{name}.py", 'r') as file:
+        return ast.parse(file.read())
+
+
+def find_assignment(tree, name):
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and node.targets[0].id == name:
+            return ast.literal_eval(node.value)
+
+
+categories = find_assignment(read_module("__init__"), "CATEGORIES")
+docs = find_assignment(read_module("_docs"), "DOCS")
 
 
 jobs = (
@@ -116,16 +130,16 @@ for out_filepath, header_filepath, write_func in jobs:
             header = file.read()
         fout.write(HEADER)
         fout.write(header)
-        for node in tree.body:
-            if isinstance(node, ast.FunctionDef):
-                docstring = ast.get_docstring(node)
-                if not docstring:
-                    continue
-                func_name = node.name
-                args = [arg.arg for arg in node.args.args]
-                write_func(fout, func_name, args, docstring)
-            elif isinstance(node, ast_comments.Comment):
-                fout.write("---\n\n##" + node.value + "\n\n")
+        for category in categories:
+            tree = read_module(category)
+            title = ast.get_docstring(tree).splitlines()[0]
+            fout.write("---\n\n### " + title + "\n\n")
+            for node in tree.body:
+                if isinstance(node, ast.FunctionDef):
+                    func_name = node.name
+                    docstring = inspect.cleandoc(docs[func_name])
+                    args = [arg.arg for arg in node.args.args]
+                    write_func(fout, func_name, args, docstring)
     with out_filepath.open("r") as file:
         unformatted = file.read()
     formatted = markdown_parser.beautify(unformatted)